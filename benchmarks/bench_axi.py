@@ -0,0 +1,63 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Benchmarks of the AXI master and RAM on a passthrough."""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+from cocotb.handle import HierarchyObject
+from measure import create_testbench, measure, scaled
+
+from cocotb_wrapper.axi import AxiMaster, AxiRam, RandomAxiPayloadGenerator
+
+DATA_WIDTH_BITS = 64
+RAM_SIZE = 1 << 16
+
+tb = create_testbench("axi_passthrough")
+master = AxiMaster("s_axi", "clk", "rst", 1)
+ram = AxiRam("m_axi", "clk", "rst", 1, RAM_SIZE)
+
+
+@tb.register_test()
+async def axi_bursts(dut: HierarchyObject) -> None:
+    """Write and read back 4 KiB bursts."""
+    master.setup(dut)
+    ram.setup(dut)
+    generator = RandomAxiPayloadGenerator(DATA_WIDTH_BITS, seed=0)
+    data = b"".join(generator.get_payloads(4096 * 8 // DATA_WIDTH_BITS))
+    with measure("axi_bursts", "transactions") as m:
+        for i in range(scaled(200)):
+            address = (i * len(data)) % RAM_SIZE
+            await master.write(address, data)
+            resp = await master.read(address, len(data))
+            assert resp.data == data
+            m.count += 2
+            m.bytes += 2 * len(data)
+
+
+@tb.register_test()
+async def axi_single(dut: HierarchyObject) -> None:
+    """Write and read back single beats."""
+    master.setup(dut)
+    ram.setup(dut)
+    generator = RandomAxiPayloadGenerator(DATA_WIDTH_BITS, seed=0)
+    with measure("axi_single", "transactions") as m:
+        for i in range(scaled(2000)):
+            data = generator.get_payload()
+            address = (i * len(data)) % RAM_SIZE
+            await master.write(address, data)
+            resp = await master.read(address, len(data))
+            assert resp.data == data
+            m.count += 2
+            m.bytes += 2 * len(data)
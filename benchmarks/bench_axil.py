@@ -0,0 +1,43 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Benchmarks of the AXI-Lite master on a register file."""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+from cocotb.handle import HierarchyObject
+from measure import create_testbench, measure, scaled
+
+from cocotb_wrapper.axi import AxiLiteMaster, RandomAxiLitePayloadGenerator
+
+REGISTERS = 64
+
+tb = create_testbench("axil_regfile")
+master = AxiLiteMaster("s_axil", "clk", "rst", 1)
+
+
+@tb.register_test()
+async def axil_registers(dut: HierarchyObject) -> None:
+    """Write and read back registers."""
+    master.setup(dut)
+    generator = RandomAxiLitePayloadGenerator(32, seed=0)
+    with measure("axil_registers", "transactions") as m:
+        for i in range(scaled(2000)):
+            data = generator.get_payload()
+            address = 4 * (i % REGISTERS)
+            await master.write(address, data)
+            resp = await master.read(address, len(data))
+            assert resp.data == data
+            m.count += 2
+            m.bytes += 2 * len(data)
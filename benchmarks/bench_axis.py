@@ -0,0 +1,81 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Benchmarks of the AXI-Stream source and sink on a loopback FIFO."""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+from cocotb import start_soon
+from cocotb.handle import HierarchyObject
+from cocotb.triggers import ClockCycles
+from measure import create_testbench, measure, scaled
+
+from cocotb_wrapper.axi import (
+    AxiStreamCaptureMode,
+    AxiStreamSink,
+    AxiStreamSource,
+    RandomAxiStreamPayloadGenerator,
+)
+
+DATA_WIDTH_BITS = 64
+FRAME_LENGTH = 32
+
+tb = create_testbench("axis_fifo")
+source = AxiStreamSource("s_axis", DATA_WIDTH_BITS, "clk", "rst", 1)
+sink = AxiStreamSink("m_axis", DATA_WIDTH_BITS, "clk", "rst", 1)
+
+
+def _payloads(count: int) -> list[bytes]:
+    """Generate the payloads of a benchmark.
+
+    Args:
+        count: The number of frames
+
+    Returns:
+        The frame data
+    """
+    generator = RandomAxiStreamPayloadGenerator(
+        FRAME_LENGTH, DATA_WIDTH_BITS, seed=0
+    )
+    return generator.get_payloads(count)
+
+
+@tb.register_test()
+async def axis_frames(dut: HierarchyObject) -> None:
+    """Send frames through the FIFO and read each frame from the sink."""
+    source.setup(dut)
+    sink.setup(dut)
+    sink.set_capture_mode(AxiStreamCaptureMode.FRAMES)
+    payloads = _payloads(scaled(2000))
+    with measure("axis_frames", "frames") as m:
+        start_soon(source.write_frames(payloads, queue_depth=16))
+        while m.count < len(payloads):
+            frames = await sink.read_batch()
+            m.count += len(frames)
+            m.bytes += sum(len(frame) for frame in frames)
+
+
+@tb.register_test()
+async def axis_count(dut: HierarchyObject) -> None:
+    """Send frames through the FIFO into a sink that only counts them."""
+    source.setup(dut)
+    sink.setup(dut)
+    sink.set_capture_mode(AxiStreamCaptureMode.COUNT)
+    payloads = _payloads(scaled(2000))
+    with measure("axis_count", "frames") as m:
+        await source.write_frames(payloads, queue_depth=16)
+        while sink.stats.frames < len(payloads):
+            await ClockCycles(dut.clk, FRAME_LENGTH)
+        m.count = sink.stats.frames
+        m.bytes = sink.stats.bytes
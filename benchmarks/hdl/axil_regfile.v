@@ -0,0 +1,68 @@
+// An AXI-Lite register file of 32-bit registers.
+`timescale 1ns / 1ps
+
+module axil_regfile #(
+    parameter ADDR_WIDTH = 8
+) (
+    input  wire                  clk,
+    input  wire                  rst,
+
+    input  wire [ADDR_WIDTH-1:0] s_axil_awaddr,
+    input  wire [2:0]            s_axil_awprot,
+    input  wire                  s_axil_awvalid,
+    output wire                  s_axil_awready,
+    input  wire [31:0]           s_axil_wdata,
+    input  wire [3:0]            s_axil_wstrb,
+    input  wire                  s_axil_wvalid,
+    output wire                  s_axil_wready,
+    output wire [1:0]            s_axil_bresp,
+    output reg                   s_axil_bvalid,
+    input  wire                  s_axil_bready,
+    input  wire [ADDR_WIDTH-1:0] s_axil_araddr,
+    input  wire [2:0]            s_axil_arprot,
+    input  wire                  s_axil_arvalid,
+    output wire                  s_axil_arready,
+    output reg  [31:0]           s_axil_rdata,
+    output wire [1:0]            s_axil_rresp,
+    output reg                   s_axil_rvalid,
+    input  wire                  s_axil_rready
+);
+
+    reg [31:0] regs [0:(1 << (ADDR_WIDTH - 2)) - 1];
+
+    wire write = s_axil_awvalid && s_axil_wvalid && (!s_axil_bvalid || s_axil_bready);
+    wire read = s_axil_arvalid && (!s_axil_rvalid || s_axil_rready);
+    wire [31:0] mask = {{8{s_axil_wstrb[3]}}, {8{s_axil_wstrb[2]}},
+                        {8{s_axil_wstrb[1]}}, {8{s_axil_wstrb[0]}}};
+    wire [ADDR_WIDTH-3:0] waddr = s_axil_awaddr[ADDR_WIDTH-1:2];
+    wire [ADDR_WIDTH-3:0] raddr = s_axil_araddr[ADDR_WIDTH-1:2];
+
+    assign s_axil_awready = write;
+    assign s_axil_wready = write;
+    assign s_axil_bresp = 2'b00;
+    assign s_axil_arready = read;
+    assign s_axil_rresp = 2'b00;
+
+    always @(posedge clk) begin
+        if (rst) begin
+            s_axil_bvalid <= 1'b0;
+            s_axil_rvalid <= 1'b0;
+        end else begin
+            if (s_axil_bready) begin
+                s_axil_bvalid <= 1'b0;
+            end
+            if (write) begin
+                regs[waddr] <= (regs[waddr] & ~mask) | (s_axil_wdata & mask);
+                s_axil_bvalid <= 1'b1;
+            end
+            if (s_axil_rready) begin
+                s_axil_rvalid <= 1'b0;
+            end
+            if (read) begin
+                s_axil_rdata <= regs[raddr];
+                s_axil_rvalid <= 1'b1;
+            end
+        end
+    end
+
+endmodule
@@ -0,0 +1,88 @@
+-- An AXI-Lite register file of 32-bit registers.
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+entity axil_regfile is
+  generic (
+    ADDR_WIDTH : positive := 8
+  );
+  port (
+    clk            : in  std_logic;
+    rst            : in  std_logic;
+
+    s_axil_awaddr  : in  std_logic_vector(ADDR_WIDTH - 1 downto 0);
+    s_axil_awprot  : in  std_logic_vector(2 downto 0);
+    s_axil_awvalid : in  std_logic;
+    s_axil_awready : out std_logic;
+    s_axil_wdata   : in  std_logic_vector(31 downto 0);
+    s_axil_wstrb   : in  std_logic_vector(3 downto 0);
+    s_axil_wvalid  : in  std_logic;
+    s_axil_wready  : out std_logic;
+    s_axil_bresp   : out std_logic_vector(1 downto 0);
+    s_axil_bvalid  : out std_logic;
+    s_axil_bready  : in  std_logic;
+    s_axil_araddr  : in  std_logic_vector(ADDR_WIDTH - 1 downto 0);
+    s_axil_arprot  : in  std_logic_vector(2 downto 0);
+    s_axil_arvalid : in  std_logic;
+    s_axil_arready : out std_logic;
+    s_axil_rdata   : out std_logic_vector(31 downto 0);
+    s_axil_rresp   : out std_logic_vector(1 downto 0);
+    s_axil_rvalid  : out std_logic;
+    s_axil_rready  : in  std_logic
+  );
+end entity;
+
+architecture rtl of axil_regfile is
+  type regs_t is array (0 to 2 ** (ADDR_WIDTH - 2) - 1) of std_logic_vector(31 downto 0);
+  signal regs   : regs_t;
+  signal bvalid : std_logic;
+  signal rvalid : std_logic;
+  signal write  : std_logic;
+  signal read   : std_logic;
+begin
+
+  write <= s_axil_awvalid and s_axil_wvalid and (not bvalid or s_axil_bready);
+  read <= s_axil_arvalid and (not rvalid or s_axil_rready);
+
+  s_axil_awready <= write;
+  s_axil_wready <= write;
+  s_axil_bresp <= "00";
+  s_axil_bvalid <= bvalid;
+  s_axil_arready <= read;
+  s_axil_rresp <= "00";
+  s_axil_rvalid <= rvalid;
+
+  process (clk)
+    variable waddr : natural;
+  begin
+    if rising_edge(clk) then
+      if rst = '1' then
+        bvalid <= '0';
+        rvalid <= '0';
+      else
+        if s_axil_bready = '1' then
+          bvalid <= '0';
+        end if;
+        if write = '1' then
+          waddr := to_integer(unsigned(s_axil_awaddr(ADDR_WIDTH - 1 downto 2)));
+          for i in 0 to 3 loop
+            if s_axil_wstrb(i) = '1' then
+              regs(waddr)(8 * i + 7 downto 8 * i) <= s_axil_wdata(8 * i + 7 downto 8 * i);
+            end if;
+          end loop;
+          bvalid <= '1';
+        end if;
+        if s_axil_rready = '1' then
+          rvalid <= '0';
+        end if;
+        if read = '1' then
+          s_axil_rdata <= regs(to_integer(unsigned(s_axil_araddr(ADDR_WIDTH - 1 downto 2))));
+          rvalid <= '1';
+        end if;
+      end if;
+    end if;
+  end process;
+
+end architecture;
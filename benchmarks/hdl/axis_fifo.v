@@ -0,0 +1,52 @@
+// An AXI-Stream FIFO looping the sink port back to the source port.
+`timescale 1ns / 1ps
+
+module axis_fifo #(
+    parameter DATA_WIDTH = 64,
+    parameter ADDR_WIDTH = 4
+) (
+    input  wire                    clk,
+    input  wire                    rst,
+
+    input  wire [DATA_WIDTH-1:0]   s_axis_tdata,
+    input  wire [DATA_WIDTH/8-1:0] s_axis_tkeep,
+    input  wire                    s_axis_tlast,
+    input  wire                    s_axis_tvalid,
+    output wire                    s_axis_tready,
+
+    output wire [DATA_WIDTH-1:0]   m_axis_tdata,
+    output wire [DATA_WIDTH/8-1:0] m_axis_tkeep,
+    output wire                    m_axis_tlast,
+    output wire                    m_axis_tvalid,
+    input  wire                    m_axis_tready
+);
+
+    localparam WIDTH = DATA_WIDTH + DATA_WIDTH / 8 + 1;
+
+    reg [WIDTH-1:0] mem [0:(1 << ADDR_WIDTH) - 1];
+    reg [ADDR_WIDTH:0] wr_ptr;
+    reg [ADDR_WIDTH:0] rd_ptr;
+
+    wire full = (wr_ptr ^ rd_ptr) == {1'b1, {ADDR_WIDTH{1'b0}}};
+    wire empty = wr_ptr == rd_ptr;
+
+    assign s_axis_tready = !full;
+    assign m_axis_tvalid = !empty;
+    assign {m_axis_tlast, m_axis_tkeep, m_axis_tdata} = mem[rd_ptr[ADDR_WIDTH-1:0]];
+
+    always @(posedge clk) begin
+        if (rst) begin
+            wr_ptr <= 0;
+            rd_ptr <= 0;
+        end else begin
+            if (s_axis_tvalid && !full) begin
+                mem[wr_ptr[ADDR_WIDTH-1:0]] <= {s_axis_tlast, s_axis_tkeep, s_axis_tdata};
+                wr_ptr <= wr_ptr + 1;
+            end
+            if (m_axis_tready && !empty) begin
+                rd_ptr <= rd_ptr + 1;
+            end
+        end
+    end
+
+endmodule
@@ -0,0 +1,70 @@
+-- An AXI-Stream FIFO looping the sink port back to the source port.
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+entity axis_fifo is
+  generic (
+    DATA_WIDTH : positive := 64;
+    ADDR_WIDTH : positive := 4
+  );
+  port (
+    clk           : in  std_logic;
+    rst           : in  std_logic;
+
+    s_axis_tdata  : in  std_logic_vector(DATA_WIDTH - 1 downto 0);
+    s_axis_tkeep  : in  std_logic_vector(DATA_WIDTH / 8 - 1 downto 0);
+    s_axis_tlast  : in  std_logic;
+    s_axis_tvalid : in  std_logic;
+    s_axis_tready : out std_logic;
+
+    m_axis_tdata  : out std_logic_vector(DATA_WIDTH - 1 downto 0);
+    m_axis_tkeep  : out std_logic_vector(DATA_WIDTH / 8 - 1 downto 0);
+    m_axis_tlast  : out std_logic;
+    m_axis_tvalid : out std_logic;
+    m_axis_tready : in  std_logic
+  );
+end entity;
+
+architecture rtl of axis_fifo is
+  constant WIDTH : positive := DATA_WIDTH + DATA_WIDTH / 8 + 1;
+  type mem_t is array (0 to 2 ** ADDR_WIDTH - 1) of std_logic_vector(WIDTH - 1 downto 0);
+  signal mem    : mem_t;
+  signal wr_ptr : unsigned(ADDR_WIDTH downto 0);
+  signal rd_ptr : unsigned(ADDR_WIDTH downto 0);
+  signal full   : std_logic;
+  signal empty  : std_logic;
+  signal head   : std_logic_vector(WIDTH - 1 downto 0);
+begin
+
+  full <= '1' when (wr_ptr xor rd_ptr) = ('1' & (ADDR_WIDTH - 1 downto 0 => '0')) else '0';
+  empty <= '1' when wr_ptr = rd_ptr else '0';
+
+  s_axis_tready <= not full;
+  m_axis_tvalid <= not empty;
+
+  head <= mem(to_integer(rd_ptr(ADDR_WIDTH - 1 downto 0)));
+  m_axis_tlast <= head(WIDTH - 1);
+  m_axis_tkeep <= head(WIDTH - 2 downto DATA_WIDTH);
+  m_axis_tdata <= head(DATA_WIDTH - 1 downto 0);
+
+  process (clk)
+  begin
+    if rising_edge(clk) then
+      if rst = '1' then
+        wr_ptr <= (others => '0');
+        rd_ptr <= (others => '0');
+      else
+        if s_axis_tvalid = '1' and full = '0' then
+          mem(to_integer(wr_ptr(ADDR_WIDTH - 1 downto 0))) <= s_axis_tlast & s_axis_tkeep & s_axis_tdata;
+          wr_ptr <= wr_ptr + 1;
+        end if;
+        if m_axis_tready = '1' and empty = '0' then
+          rd_ptr <= rd_ptr + 1;
+        end if;
+      end if;
+    end if;
+  end process;
+
+end architecture;
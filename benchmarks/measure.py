@@ -0,0 +1,152 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Measure the throughput of a benchmark.
+
+Each measurement is appended as one JSON object per line to the file given by
+the :envvar:`COCOTB_WRAPPER_BENCH_RESULTS` environment variable, which is set
+by the benchmark runner.
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+import json
+import os
+import resource
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from cocotb import SIM_NAME
+from cocotb.handle import HierarchyObject
+from cocotb.log import SimLog
+from cocotb.triggers import ClockCycles
+from cocotb.utils import get_sim_time
+
+from cocotb_wrapper import Testbench
+
+RESULTS_ENV = "COCOTB_WRAPPER_BENCH_RESULTS"
+"""The environment variable holding the path of the results file."""
+SCALE_ENV = "COCOTB_WRAPPER_BENCH_SCALE"
+"""The environment variable holding the factor applied to all counts."""
+CLOCK_PERIOD_NS = 10
+"""The clock period of all benchmark designs in nanoseconds."""
+
+_log = SimLog("benchmark")
+
+
+class Measurement:
+    """The result of a benchmark."""
+
+    def __init__(self, name: str, unit: str):
+        """Initialize an instance.
+
+        Args:
+            name: The name of the benchmark
+            unit: The name of the counted items, e.g. ``'frames'``
+        """
+        self.name: str = name
+        self.unit: str = unit
+        self.count: int = 0
+        """The number of processed items."""
+        self.bytes: int = 0
+        """The number of transferred payload bytes."""
+
+
+def scaled(count: int) -> int:
+    """Scale an item count by the factor given to the runner.
+
+    Args:
+        count: The item count at scale 1
+
+    Returns:
+        The scaled item count, at least 1
+    """
+    return max(1, round(count * float(os.environ.get(SCALE_ENV, "1"))))
+
+
+def create_testbench(name: str) -> Testbench:
+    """Create the testbench of a benchmark design.
+
+    The setup starts the clock and holds the reset for a few cycles. The
+    teardown does nothing, so no time is spent between the benchmarks.
+
+    Args:
+        name: The name of the design
+
+    Returns:
+        The testbench
+    """
+    tb = Testbench(name, clk="clk", rst="rst")
+
+    @tb.register_setup()
+    async def setup(dut: HierarchyObject) -> None:
+        tb.start_clk(dut, CLOCK_PERIOD_NS, "ns")
+        dut.rst.setimmediatevalue(1)
+        await ClockCycles(dut.clk, 4)
+        dut.rst.value = 0
+        await ClockCycles(dut.clk, 2)
+
+    @tb.register_teardown()
+    async def teardown(dut: HierarchyObject) -> None:
+        pass
+
+    return tb
+
+
+@contextmanager
+def measure(name: str, unit: str) -> Iterator[Measurement]:
+    """Measure the wall-clock time and simulated cycles of a block.
+
+    The block sets :attr:`Measurement.count` and optionally
+    :attr:`Measurement.bytes`. The peak resident set size is that of the whole
+    simulator process.
+
+    Args:
+        name: The name of the benchmark
+        unit: The name of the counted items
+
+    Yields:
+        The measurement to fill in
+    """
+    measurement = Measurement(name, unit)
+    sim_start = get_sim_time("ns")
+    wall_start = time.perf_counter()
+    yield measurement
+    wall = time.perf_counter() - wall_start
+    cycles = (get_sim_time("ns") - sim_start) / CLOCK_PERIOD_NS
+    result = {
+        "name": name,
+        "simulator": SIM_NAME,
+        "unit": unit,
+        "count": measurement.count,
+        "bytes": measurement.bytes,
+        "wall_seconds": wall,
+        "sim_cycles": cycles,
+        "cycles_per_second": cycles / wall,
+        "rate": measurement.count / wall,
+        "bytes_per_second": measurement.bytes / wall,
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+    _log.info(
+        "%s: %.0f %s/s, %.0f cycles/s",
+        name,
+        result["rate"],
+        unit,
+        result["cycles_per_second"],
+    )
+    path = os.environ.get(RESULTS_ENV)
+    if path:
+        with open(path, "a") as f:
+            f.write(json.dumps(result) + "\n")
@@ -0,0 +1,198 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Run the benchmark suite of cocotb-wrapper.
+
+The reference designs in ``hdl/`` are built and simulated with the given
+simulator, and the measurements are written to a JSON file. Two result files,
+e.g. of two versions of cocotb-wrapper, are compared with ``--compare``::
+
+    python benchmarks/run.py --simulator icarus --output old.json
+    python benchmarks/run.py --simulator icarus --output new.json
+    python benchmarks/run.py --compare old.json new.json
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+from importlib.metadata import version
+from pathlib import Path
+
+import cocotb
+from cocotb.runner import get_runner
+from measure import RESULTS_ENV, SCALE_ENV
+
+BENCH_DIR = Path(__file__).resolve().parent
+HDL_DIR = BENCH_DIR / "hdl"
+DESIGNS = {
+    "axis_fifo": "bench_axis",
+    "axi_passthrough": "bench_axi",
+    "axil_regfile": "bench_axil",
+}
+"""The test module of each reference design."""
+VHDL_SIMULATORS = ("ghdl", "nvc", "questa", "riviera", "xcelium")
+
+
+def run(
+    simulator: str, output: Path, scale: float, designs: list[str]
+) -> dict[str, object]:
+    """Build and simulate the reference designs.
+
+    Args:
+        simulator: The name of the cocotb simulator
+        output: The path of the results file
+        scale: The factor applied to the item count of each benchmark
+        designs: The names of the designs to run
+
+    Returns:
+        The results
+    """
+    lang = "vhdl" if simulator in VHDL_SIMULATORS else "verilog"
+    suffix = ".vhd" if lang == "vhdl" else ".v"
+    build_args = ["--std=08"] if simulator == "ghdl" else []
+    lines = output.with_suffix(".jsonl")
+    lines.unlink(missing_ok=True)
+    for design in designs:
+        runner = get_runner(simulator)
+        build_dir = BENCH_DIR / "sim_build" / simulator / design
+        sources = [HDL_DIR / f"{design}{suffix}"]
+        runner.build(
+            verilog_sources=sources if lang == "verilog" else [],
+            vhdl_sources=sources if lang == "vhdl" else [],
+            hdl_toplevel=design,
+            build_args=build_args,
+            build_dir=build_dir,
+        )
+        runner.test(
+            test_module=DESIGNS[design],
+            hdl_toplevel=design,
+            hdl_toplevel_lang=lang,
+            build_dir=build_dir,
+            test_dir=build_dir,
+            extra_env={RESULTS_ENV: str(lines), SCALE_ENV: str(scale)},
+        )
+    with open(lines) as f:
+        benchmarks = [json.loads(line) for line in f]
+    lines.unlink()
+    return {
+        "cocotb_wrapper": version("cocotb-wrapper"),
+        "cocotb": cocotb.__version__,
+        "python": platform.python_version(),
+        "simulator": simulator,
+        "scale": scale,
+        "date": datetime.now(timezone.utc).isoformat(),
+        "benchmarks": benchmarks,
+    }
+
+
+def compare(baseline: Path, current: Path, tolerance: float) -> int:
+    """Print the relative change between two result files.
+
+    Args:
+        baseline: The path of the reference results
+        current: The path of the new results
+        tolerance: The relative slowdown accepted before a benchmark counts
+            as a regression
+
+    Returns:
+        The number of regressions
+    """
+    with open(baseline) as f:
+        old = {b["name"]: b for b in json.load(f)["benchmarks"]}
+    with open(current) as f:
+        new = {b["name"]: b for b in json.load(f)["benchmarks"]}
+    regressions = 0
+    print(f"{'benchmark':<20} {'metric':<18} {'baseline':>12} {'current':>12}")
+    for name in sorted(old.keys() & new.keys()):
+        for metric in ("rate", "cycles_per_second", "peak_rss_kib"):
+            before, after = old[name][metric], new[name][metric]
+            change = after / before - 1 if before else 0.0
+            if metric == "peak_rss_kib":
+                regressed = change > tolerance
+            else:
+                regressed = change < -tolerance
+            regressions += regressed
+            print(
+                f"{name:<20} {metric:<18} {before:>12.0f} {after:>12.0f} "
+                f"{change:>+8.1%}{'  REGRESSION' if regressed else ''}"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run or compare the benchmarks.
+
+    Args:
+        argv: The command line arguments
+
+    Returns:
+        The exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--simulator",
+        default=os.environ.get("SIM", "icarus"),
+        help="the cocotb simulator name (default: $SIM or icarus)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="the results file (default: benchmarks/results/<simulator>.json)",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="the factor applied to the item count of each benchmark",
+    )
+    parser.add_argument(
+        "--design",
+        action="append",
+        choices=sorted(DESIGNS),
+        help="run only the given design, may be repeated",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        type=Path,
+        metavar=("BASELINE", "CURRENT"),
+        help="compare two results files instead of running the benchmarks",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="the relative change reported as a regression (default: 0.1)",
+    )
+    args = parser.parse_args(argv)
+    if args.compare:
+        return 1 if compare(*args.compare, args.tolerance) else 0
+    output = args.output or BENCH_DIR / "results" / f"{args.simulator}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    results = run(
+        args.simulator, output, args.scale, args.design or list(DESIGNS)
+    )
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,14 @@
 #  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
 # ============================================================
 
-"""Helper function and classes for testing the component module."""
+"""Helper function and classes for testing the component module.
+
+Only :class:`~cocotb_wrapper.Testbench` is imported with the package, along
+with the :mod:`~cocotb_wrapper.memory`, :mod:`~cocotb_wrapper.profiler`,
+:mod:`~cocotb_wrapper.seeds` and :mod:`~cocotb_wrapper.waves` modules it uses in
+every test. The other submodules are imported on first access, e.g.
+``cocotb_wrapper.axi``, so testbenches only pay for the modules they use.
+"""
 
 from __future__ import annotations
 
@@ -16,6 +23,59 @@ __email__ = "deaa@zhaw.ch"
 __copyright__ = "2023 ZHAW Institute of Embedded Systems"
 __date__ = "2023-08-30"
 
+from types import ModuleType
+
+from ._imports import import_module
 from .testbench import Testbench
 
-__all__ = ["Testbench"]
+__all__ = [
+    "Testbench",
+    "axi",
+    "backdoor",
+    "buses",
+    "coverage",
+    "framing",
+    "matrix",
+    "memory",
+    "patterns",
+    "profiler",
+    "protocol",
+    "scoreboard",
+    "seeds",
+    "tasks",
+    "waves",
+]
+
+_SUBMODULES = (
+    "axi",
+    "backdoor",
+    "buses",
+    "coverage",
+    "framing",
+    "matrix",
+    "memory",
+    "patterns",
+    "profiler",
+    "protocol",
+    "scoreboard",
+    "seeds",
+    "tasks",
+    "waves",
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import a submodule on first access.
+
+    Args:
+        name: The name of the attribute
+
+    Returns:
+        The submodule
+
+    Raises:
+        AttributeError: If the name is not a submodule
+    """
+    if name in _SUBMODULES:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
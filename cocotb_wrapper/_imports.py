@@ -0,0 +1,76 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Import modules on first use.
+
+Importing `cocotbext-axi` takes a noticeable part of the startup time of a
+simulation. The wrappers therefore import it only when the first wrapper is set
+up. Set the :envvar:`COCOTB_WRAPPER_IMPORT_REPORT` environment variable to log
+the time spent in each deferred import.
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+import importlib
+import os
+import sys
+import time
+from types import ModuleType
+
+from cocotb.log import SimLog
+
+IMPORT_REPORT_ENV = "COCOTB_WRAPPER_IMPORT_REPORT"
+"""The environment variable enabling the import-time report."""
+
+
+def import_module(name: str) -> ModuleType:
+    """Import a module and report the import time if enabled.
+
+    Args:
+        name: The absolute name of the module
+
+    Returns:
+        The module
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    if os.environ.get(IMPORT_REPORT_ENV):
+        SimLog("cocotb_wrapper.import").info(
+            "Imported %s in %.1f ms", name, 1e3 * (time.perf_counter() - start)
+        )
+    return module
+
+
+class LazyModule(ModuleType):
+    """A module that is imported on the first attribute access.
+
+    Once imported, the attributes of the module are copied into the instance,
+    so later accesses cost the same as on the module itself.
+    """
+
+    def __init__(self, name: str):
+        """Initialize an instance.
+
+        Args:
+            name: The absolute name of the module
+        """
+        super().__init__(name)
+
+    def __getattr__(self, name: str) -> object:
+        module = import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, name)
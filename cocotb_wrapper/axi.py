@@ -16,15 +16,45 @@ __mail__ = "deaa@zhaw.ch"
 __copyright__ = "2022 ZHAW Institute of Embedded Systems"
 __date__ = "2022-12-20"
 
-from collections.abc import Iterator
-from enum import IntEnum, IntFlag
+import hashlib
+import math
+import os
+import random
+import weakref
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from enum import Enum, IntEnum, IntFlag
+from functools import lru_cache
 from itertools import cycle
-from random import getrandbits
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-import cocotbext.axi as axi
+from cocotb import start_soon
 from cocotb.handle import HierarchyObject
 from cocotb.log import SimLog
-from cocotb.triggers import Event
+from cocotb.queue import Queue, QueueEmpty, QueueFull
+from cocotb.task import Task
+from cocotb.triggers import ClockCycles, Event, First, RisingEdge, Timer
+from cocotb.utils import get_sim_steps, get_time_from_sim_steps
+
+from cocotb_wrapper._imports import LazyModule
+from cocotb_wrapper.coverage import (
+    CoverageDatabase,
+    _tap,
+    attach_axi,
+    attach_axil,
+    frame_sampler,
+)
+from cocotb_wrapper.framing import FrameWriter, PathLike, read_frames
+from cocotb_wrapper.protocol import ProtocolChecker
+
+if TYPE_CHECKING:
+    import cocotbext.axi as axi
+else:
+    axi = LazyModule("cocotbext.axi")
+
+_capturing: weakref.WeakSet[AxiStreamSink] = weakref.WeakSet()
 
 
 def bits_to_bytes(b: int) -> int:
@@ -39,6 +69,35 @@ def bits_to_bytes(b: int) -> int:
     return (b + 7) // 8
 
 
+def sideband_value(value: int | list[int] | None) -> int | None:
+    """Get the sideband value of a compacted frame.
+
+    Compacting a frame collapses a sideband signal such as ``tid`` or
+    ``tdest`` into a single value if it is the same for every byte.
+
+    Args:
+        value: The per-byte sideband values or a single compacted value
+
+    Returns:
+        The value of the first byte
+    """
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def stop_captures() -> int:
+    """Stop the captures of all AXI-Stream sinks.
+
+    Returns:
+        The number of stopped captures
+    """
+    sinks = list(_capturing)
+    for sink in sinks:
+        sink.stop_capture()
+    return len(sinks)
+
+
 class AxiBurstType(IntEnum):
     """The burst type used during the AXI write transaction."""
 
@@ -209,6 +268,44 @@ class AxiResp(IntEnum):
     """
 
 
+class _BusSignals:
+    """The signals of a bus, looked up once per DUT.
+
+    The handles stay valid for the whole simulation, so the bus models built
+    for each test share them instead of searching the DUT for the prefix again.
+    """
+
+    def __init__(self, bus_type: str, prefix: str):
+        """Initialize an instance.
+
+        Args:
+            bus_type: The name of the cocotbext bus class, e.g. ``'AxiBus'``
+            prefix: The prefix of the signals
+        """
+        self._bus_type: str = bus_type
+        self._prefix: str = prefix
+        self._dut: HierarchyObject | None = None
+        self._bus: Any = None
+
+    def get(self, dut: HierarchyObject) -> Any:
+        """Get the cocotbext bus of the DUT.
+
+        Args:
+            dut: The device under test
+
+        Returns:
+            The bus with the signal handles
+
+        Raises:
+            AttributeError: If the DUT has no signals with the prefix
+        """
+        if self._dut is not dut:
+            bus_class = getattr(axi, self._bus_type)
+            self._bus = bus_class.from_prefix(dut, self._prefix)
+            self._dut = dut
+        return self._bus
+
+
 class AxiMaster:
     """A Wrapper around `cocotbext-axi AXI <https://github.com/alexforencich/cocotbext-axi#axi-and-axi-lite-master>`_.
 
@@ -238,6 +335,9 @@ class AxiMaster:
         self._rst: str = rst
         self._reset_active_level: int = reset_active_level
         self._max_burst_length: int = max_burst_length
+        self._coverage: CoverageDatabase | None = None
+        self._protocol: ProtocolChecker | None = None
+        self._signals: _BusSignals = _BusSignals("AxiBus", bus_prefix)
         self._log = SimLog(self._bus_prefix)
 
     def setup(self, dut: HierarchyObject) -> None:
@@ -251,12 +351,16 @@ class AxiMaster:
                 `clk` and `rst`.
         """
         self._bus = axi.AxiMaster(  # pyright: ignore[reportAttributeAccessIssue,reportUninitializedInstanceVariable]
-            bus=axi.AxiBus.from_prefix(dut, self._bus_prefix),  # pyright: ignore[reportAttributeAccessIssue]
+            bus=self._signals.get(dut),
             clock=getattr(dut, self._clk),
             reset=getattr(dut, self._rst),
             reset_active_level=bool(self._reset_active_level),
             max_burst_length=self._max_burst_length,
         )
+        if self._coverage is not None:
+            attach_axi(self._coverage, self._bus_prefix, self._bus)
+        if self._protocol is not None:
+            self._protocol.attach_axi(self._bus_prefix, self._bus)
 
     async def write(
         self,
@@ -357,6 +461,40 @@ class AxiMaster:
             wuser=wuser,
         )
 
+    def enable_coverage(self, database: CoverageDatabase) -> None:
+        """Collect the functional coverage of the bus.
+
+        The coverage is collected from the next :meth:`setup` on, or right
+        away if the bus is already set up. See
+        :func:`~cocotb_wrapper.coverage.attach_axi` for the cover groups.
+        Enabling the same database again has no effect.
+
+        Args:
+            database: The database collecting the cover groups
+        """
+        if database is self._coverage:
+            return
+        self._coverage = database
+        if hasattr(self, "_bus"):
+            attach_axi(database, self._bus_prefix, self._bus)
+
+    def enable_protocol_checks(self, checker: ProtocolChecker) -> None:
+        """Check that the bus follows the protocol.
+
+        The checks start with the next :meth:`setup`, or right away if the bus
+        is already set up.
+
+        Args:
+            checker: The checker collecting the protocol violations
+        """
+        self._protocol = checker
+        if hasattr(self, "_bus"):
+            checker.attach_axi(self._bus_prefix, self._bus)
+
+    async def wait_idle(self) -> None:
+        """Wait until all read and write operations completed."""
+        await self._bus.wait()
+
     def set_idle_generator(self, generator: Iterator[int]) -> None:
         """Toggle pauses on the write bus lanes given a generator function.
 
@@ -395,6 +533,272 @@ class AxiMaster:
         self.set_backpressure_generator(cycle([0]))
 
 
+class _SlaveActivity:
+    """Track the transactions a cocotbext slave accepted but not answered.
+
+    A transaction is counted from its address until its write response or the
+    last beat of its read data is queued. A reset of the slave drops the
+    transactions of the reset interface, as the model does.
+    """
+
+    def __init__(self, model: axi.AxiRam | axi.AxiLiteRam):  # pyright: ignore[reportAttributeAccessIssue]
+        """Initialize an instance.
+
+        Args:
+            model: The cocotbext AXI or AXI-Lite slave
+        """
+        self._model = model
+        self._outstanding: dict[str, int] = {"write": 0, "read": 0}
+        self._answered: Event = Event()
+        self._answered.set()
+        write_if, read_if = model.write_if, model.read_if
+        _tap(write_if.aw_channel, lambda _: self._request("write"))
+        _tap(read_if.ar_channel, lambda _: self._request("read"))
+        _tap(write_if.b_channel, lambda _: self._response("write"))
+        _tap(
+            read_if.r_channel,
+            lambda r: (
+                self._response("read") if getattr(r, "rlast", 1) else None
+            ),
+        )
+        self._hook_reset(write_if, "write")
+        self._hook_reset(read_if, "read")
+
+    def idle(self) -> bool:
+        """Check whether the slave is idle.
+
+        Returns:
+            True if no transaction is outstanding and all channels are empty
+        """
+        write_if, read_if = self._model.write_if, self._model.read_if
+        return (
+            not any(self._outstanding.values())
+            and write_if.aw_channel.empty()
+            and write_if.w_channel.empty()
+            and read_if.ar_channel.empty()
+            and write_if.b_channel.idle()
+            and read_if.r_channel.idle()
+        )
+
+    async def wait(self) -> None:
+        """Wait until the slave is idle."""
+        write_if, read_if = self._model.write_if, self._model.read_if
+        while not self.idle():
+            if any(self._outstanding.values()):
+                await self._answered.wait()
+            elif not (write_if.b_channel.idle() and read_if.r_channel.idle()):
+                await write_if.b_channel.wait()
+                await read_if.r_channel.wait()
+            else:
+                # Data that arrived ahead of its address
+                await RisingEdge(write_if.w_channel.clock)
+
+    def _hook_reset(self, interface: Any, direction: str) -> None:
+        """Drop the outstanding transactions when an interface is reset.
+
+        Args:
+            interface: The write or read interface of the cocotbext slave
+            direction: ``'write'`` or ``'read'``
+        """
+        handle_reset = interface._handle_reset
+
+        def _handle_reset(state: bool) -> None:
+            handle_reset(state)
+            if state:
+                self._outstanding[direction] = 0
+                if not any(self._outstanding.values()):
+                    self._answered.set()
+
+        interface._handle_reset = _handle_reset
+
+    def _request(self, direction: str) -> None:
+        """Count an accepted address.
+
+        Args:
+            direction: ``'write'`` or ``'read'``
+        """
+        self._outstanding[direction] += 1
+        self._answered.clear()
+
+    def _response(self, direction: str) -> None:
+        """Count a queued write response or last beat of read data.
+
+        Args:
+            direction: ``'write'`` or ``'read'``
+        """
+        self._outstanding[direction] -= 1
+        if not any(self._outstanding.values()):
+            self._answered.set()
+
+
+class _Region(NamedTuple):
+    """An address range handled by a peripheral model."""
+
+    start: int
+    end: int
+    read: Callable[[int, int], bytes] | None
+    write: Callable[[int, bytes], None] | None
+
+
+class _AddressMap:
+    """The regions of a slave, sorted by their start address.
+
+    An access is split at the region boundaries. The parts outside of all
+    regions, or in a region without a handler for the access, go to the storage
+    of the RAM.
+    """
+
+    def __init__(self):
+        """Initialize an instance."""
+        self._starts: list[int] = []
+        self._regions: list[_Region] = []
+        self._low: float = math.inf
+        self._high: float = -math.inf
+
+    def add(
+        self,
+        address: int,
+        size: int,
+        read: Callable[[int, int], bytes] | None,
+        write: Callable[[int, bytes], None] | None,
+    ) -> None:
+        """Add a region.
+
+        Args:
+            address: The start address of the region
+            size: The size of the region in bytes
+            read: The read handler
+            write: The write handler
+
+        Raises:
+            ValueError: If the region is empty or overlaps another region
+        """
+        if size <= 0:
+            raise ValueError(f"Region at {address:#x} is empty")
+        end = address + size
+        index = bisect_right(self._starts, address)
+        if (index and self._regions[index - 1].end > address) or (
+            index < len(self._starts) and self._starts[index] < end
+        ):
+            raise ValueError(
+                f"Region {address:#x}..{end - 1:#x} overlaps another region"
+            )
+        self._starts.insert(index, address)
+        self._regions.insert(index, _Region(address, end, read, write))
+        self._update_span()
+
+    def remove(self, address: int) -> None:
+        """Remove a region.
+
+        Args:
+            address: The start address of the region
+
+        Raises:
+            KeyError: If no region starts at `address`
+        """
+        index = bisect_left(self._starts, address)
+        if index == len(self._starts) or self._starts[index] != address:
+            raise KeyError(f"No region starts at {address:#x}")
+        del self._starts[index]
+        del self._regions[index]
+        self._update_span()
+
+    def hits(self, address: int, length: int) -> bool:
+        """Check cheaply whether an access may touch a region.
+
+        Args:
+            address: The start address of the access
+            length: The size of the access in bytes
+
+        Returns:
+            False if the access is outside of the span of all regions
+        """
+        return address < self._high and address + length > self._low
+
+    def split(
+        self, address: int, length: int
+    ) -> Iterator[tuple[_Region | None, int, int]]:
+        """Split an access at the region boundaries.
+
+        Args:
+            address: The start address of the access
+            length: The size of the access in bytes
+
+        Yields:
+            The region or None for the storage, the start address and the size
+            of each part
+        """
+        end = address + length
+        index = max(bisect_right(self._starts, address) - 1, 0)
+        while address < end:
+            region = (
+                self._regions[index] if index < len(self._regions) else None
+            )
+            if region is None or end <= region.start:
+                yield None, address, end - address
+                return
+            if address < region.start:
+                yield None, address, region.start - address
+                address = region.start
+            elif address < region.end:
+                stop = min(end, region.end)
+                yield region, address, stop - address
+                address = stop
+                index += 1
+            else:
+                index += 1
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def _update_span(self) -> None:
+        """Update the addresses covered by all regions."""
+        self._low = self._starts[0] if self._starts else math.inf
+        self._high = self._regions[-1].end if self._regions else -math.inf
+
+
+def _map_slave(
+    model: axi.AxiRam | axi.AxiLiteRam,  # pyright: ignore[reportAttributeAccessIssue]
+    regions: _AddressMap,
+) -> None:
+    """Route the accesses of a cocotbext RAM through an address map.
+
+    Accesses outside of all regions go straight to the storage of the RAM. An
+    exception raised by a handler is answered with a ``SLVERR`` response.
+
+    Args:
+        model: The cocotbext AXI or AXI-Lite RAM
+        regions: The regions of the RAM
+    """
+    size = model.size
+
+    async def _write(address: int, data: bytes) -> None:
+        address %= size
+        if not regions.hits(address, len(data)):
+            model.write(address, data)
+            return
+        for region, start, length in regions.split(address, len(data)):
+            part = bytes(data[start - address : start - address + length])
+            if region is None or region.write is None:
+                model.write(start, part)
+            else:
+                region.write(start - region.start, part)
+
+    async def _read(address: int, length: int) -> bytes:
+        address %= size
+        if not regions.hits(address, length):
+            return model.read(address, length)
+        return b"".join(
+            model.read(start, part)
+            if region is None or region.read is None
+            else region.read(start - region.start, part)
+            for region, start, part in regions.split(address, length)
+        )
+
+    model.write_if._write = _write
+    model.read_if._read = _read
+
+
 class AxiRam:
     """A Wrapper around `cocotbext-axi AXI RAM <https://github.com/alexforencich/cocotbext-axi#axi-and-axi-lite-ram>`_.
 
@@ -425,6 +829,10 @@ class AxiRam:
         self._rst: str = rst
         self._reset_active_level: int = bool(reset_active_level)
         self._size: int = size
+        self._coverage: CoverageDatabase | None = None
+        self._protocol: ProtocolChecker | None = None
+        self._signals: _BusSignals = _BusSignals("AxiBus", bus_prefix)
+        self._regions: _AddressMap = _AddressMap()
         self._log = SimLog(self._bus_prefix)
 
     def setup(self, dut: HierarchyObject) -> None:
@@ -438,12 +846,19 @@ class AxiRam:
                 with `clk` and `rst`.
         """
         self._ram = axi.AxiRam(  # pyright: ignore[reportAttributeAccessIssue,reportUninitializedInstanceVariable]
-            bus=axi.AxiBus.from_prefix(dut, self._bus_prefix),  # pyright: ignore[reportAttributeAccessIssue]
+            bus=self._signals.get(dut),
             clock=getattr(dut, self._clk),
             reset=getattr(dut, self._rst),
             reset_active_level=self._reset_active_level,
             size=self._size,
         )
+        if self._coverage is not None:
+            attach_axi(self._coverage, self._bus_prefix, self._ram)
+        if self._protocol is not None:
+            self._protocol.attach_axi(self._bus_prefix, self._ram)
+        self._activity = _SlaveActivity(self._ram)  # pyright: ignore[reportUninitializedInstanceVariable]
+        if self._regions:
+            _map_slave(self._ram, self._regions)
 
     def write(self, address: int, data: bytes) -> None:
         """Write `data` to the `address`.
@@ -466,6 +881,48 @@ class AxiRam:
         """
         return bytes(self._ram.read(address, length))
 
+    def add_region(
+        self,
+        address: int,
+        size: int,
+        read: Callable[[int, int], bytes] | None = None,
+        write: Callable[[int, bytes], None] | None = None,
+    ) -> None:
+        """Model a peripheral at an address range of the RAM.
+
+        The handlers are called with the offset into the region instead of
+        accessing the storage, e.g. for read-to-clear status registers, FIFO
+        data ports or doorbells. A region without a read or write handler
+        leaves that access to the storage. An exception raised by a handler is
+        answered with a ``SLVERR`` response. The regions are kept across calls
+        to :meth:`setup`.
+
+        Args:
+            address: The start address of the region
+            size: The size of the region in bytes
+            read: A function that takes the offset and the length of a read
+                and returns the data
+            write: A function that takes the offset and the data of a write
+
+        Raises:
+            ValueError: If the region is empty or overlaps another region
+        """
+        self._regions.add(address, size, read, write)
+        if hasattr(self, "_ram"):
+            _map_slave(self._ram, self._regions)
+
+    def remove_region(self, address: int) -> None:
+        """Stop modelling a peripheral.
+
+        Args:
+            address: The start address of a region added with
+                :meth:`add_region`
+
+        Raises:
+            KeyError: If no region starts at `address`
+        """
+        self._regions.remove(address)
+
     def hexdump(self, address: int, length: int, prefix: str = "RAM") -> None:
         """Dump the content of the RAM to the stdout.
 
@@ -476,6 +933,44 @@ class AxiRam:
         """
         self._ram.hexdump(address, length, prefix)
 
+    def enable_coverage(self, database: CoverageDatabase) -> None:
+        """Collect the functional coverage of the RAM.
+
+        The coverage is collected from the next :meth:`setup` on, or right
+        away if the RAM is already set up. See
+        :func:`~cocotb_wrapper.coverage.attach_axi` for the cover groups.
+        Enabling the same database again has no effect.
+
+        Args:
+            database: The database collecting the cover groups
+        """
+        if database is self._coverage:
+            return
+        self._coverage = database
+        if hasattr(self, "_ram"):
+            attach_axi(database, self._bus_prefix, self._ram)
+
+    def enable_protocol_checks(self, checker: ProtocolChecker) -> None:
+        """Check that the bus follows the protocol.
+
+        The checks start with the next :meth:`setup`, or right away if the bus
+        is already set up.
+
+        Args:
+            checker: The checker collecting the protocol violations
+        """
+        self._protocol = checker
+        if hasattr(self, "_ram"):
+            checker.attach_axi(self._bus_prefix, self._ram)
+
+    async def wait_idle(self) -> None:
+        """Wait until all accepted transactions are answered.
+
+        The RAM is idle once the response of every received address is sent
+        and no data is left in its channels.
+        """
+        await self._activity.wait()
+
     def set_idle_generator(self, generator: Iterator[int]) -> None:
         """Toggle pauses on the write bus lanes given a generator function.
 
@@ -514,20 +1009,72 @@ class AxiRam:
         self.set_backpressure_generator(cycle([0]))
 
 
-class RandomAxiPayloadGenerator:
-    """A generator class that gives back a random payload.
+class _RandomPayloadGenerator:
+    """The base of the random payload generators.
 
-    Todo:
-        Add a usage example.
+    Without a seed, many words are drawn from the global random number
+    generator at once and split afterwards, instead of calling the generator
+    once per word. With a seed, the payloads are consecutive slices of a stream
+    derived in blocks from the seed and the index of the block alone, so any
+    payload can be recreated with :meth:`get_payload_at` instead of being
+    stored until it is checked. The last few blocks are kept, so a checker
+    recreating the payloads in order behind the producer of the same generator
+    derives each block about once. A payload recreated out of order is derived
+    on its own.
     """
 
-    def __init__(self, data_width_bits: int):
+    BLOCK_PAYLOADS = 64
+    """The number of payloads derived at once by a seeded generator."""
+    _CACHED_BLOCKS = 4
+
+    def __init__(
+        self, data_width_bits: int, payload_words: int, seed: int | None
+    ):
         """Initialize an instance.
 
         Args:
             data_width_bits: The width of each value in bits
+            payload_words: The number of values in each payload
+            seed: The seed the payloads are derived from. Defaults to `None`,
+                which uses the global random state
+        """
+        self._data_width_bits: int = data_width_bits
+        self._word_bytes: int = bits_to_bytes(data_width_bits)
+        self._payload_bytes: int = payload_words * self._word_bytes
+        self._seed: int | None = seed
+        self._index: int = 0
+        self._block_bytes: int = self.BLOCK_PAYLOADS * max(
+            self._payload_bytes, self._word_bytes
+        )
+        self._blocks: OrderedDict[int, bytes] = OrderedDict()
+        self._derived_blocks: int = 0
+        self._next_at: int = 0
+        # Clears the unused upper bits of the most significant byte
+        unused_bits = -data_width_bits % 8
+        self._mask_table: bytes | None = None
+        if unused_bits:
+            self._mask_table = bytes(
+                b & (0xFF >> unused_bits) for b in range(256)
+            )
+
+    @property
+    def index(self) -> int:
+        """Get the index of the next payload.
+
+        Returns:
+            The number of payloads generated so far
         """
-        self._data_width_bits = data_width_bits
+        return self._index
+
+    @property
+    def derived_blocks(self) -> int:
+        """Get the number of blocks a seeded generator derived.
+
+        Returns:
+            The number of blocks of :attr:`BLOCK_PAYLOADS` payloads derived so
+            far, including the blocks derived again after being dropped
+        """
+        return self._derived_blocks
 
     def get_payload(self) -> bytes:
         """Get a random payload.
@@ -535,9 +1082,173 @@ class RandomAxiPayloadGenerator:
         Returns:
             The random payload
         """
-        return getrandbits(self._data_width_bits).to_bytes(
-            bits_to_bytes(self._data_width_bits), byteorder="big"
+        return self.get_payloads(1)[0]
+
+    def get_payloads(self, count: int) -> list[bytes]:
+        """Get multiple random payloads.
+
+        Args:
+            count: The number of payloads
+
+        Returns:
+            The random payloads
+        """
+        size = self._payload_bytes
+        index = self._index
+        self._index += count
+        if not size:
+            return [b""] * count
+        if self._seed is not None:
+            data = self._derive(index * size, count * size)
+        else:
+            data = self._random_bytes(count * size)
+        return [data[i : i + size] for i in range(0, len(data), size)]
+
+    def get_payload_at(self, index: int) -> bytes:
+        """Recreate a payload of a seeded generator.
+
+        Args:
+            index: The index of the payload
+
+        Returns:
+            The payload the generator returns as its `index`-th payload
+
+        Raises:
+            ValueError: If the generator has no seed
+        """
+        if self._seed is None:
+            raise ValueError("Only seeded generators can recreate payloads")
+        size = self._payload_bytes
+        sequential = index == self._next_at
+        self._next_at = index + 1
+        block, start = divmod(index * size, self._block_bytes)
+        if not size:
+            return b""
+        if (
+            block in self._blocks
+            or sequential
+            or index % self.BLOCK_PAYLOADS == 0
+        ):
+            return self._derive(index * size, size)
+        # Only the start of the block up to the payload is derived
+        key = b"%d:%d" % (self._seed, block)
+        data = hashlib.shake_256(key).digest(start + size)[start:]
+        return self._mask(data)
+
+    def get_payload_into(self, buffer: bytearray | memoryview) -> None:
+        """Fill a buffer with random values.
+
+        The buffer counts as one payload. A seeded generator fills a buffer of
+        the payload size with the same data :meth:`get_payload_at` recreates
+        for this index.
+
+        Args:
+            buffer: A writable buffer whose size is a multiple of the value size
+
+        Raises:
+            ValueError: If the buffer does not hold a whole number of values
+        """
+        view = memoryview(buffer).cast("B")
+        if len(view) % self._word_bytes:
+            raise ValueError(
+                f"The buffer size must be a multiple of {self._word_bytes}"
+            )
+        if self._seed is not None:
+            view[:] = self._derive(self._index * self._payload_bytes, len(view))
+        else:
+            view[:] = self._random_bytes(len(view))
+        self._index += 1
+
+    def _derive(self, offset: int, size: int) -> bytes:
+        """Derive a part of the stream of a seeded generator.
+
+        Args:
+            offset: The offset in the stream, a multiple of the value size
+            size: The number of bytes, a multiple of the value size
+
+        Returns:
+            The big-endian values
+        """
+        if not size:
+            return b""
+        first = offset // self._block_bytes
+        last = (offset + size - 1) // self._block_bytes
+        data = b"".join(
+            self._derive_block(block) for block in range(first, last + 1)
+        )
+        start = offset - first * self._block_bytes
+        return data[start : start + size]
+
+    def _derive_block(self, block: int) -> bytes:
+        """Derive a block of the stream from the seed and its index.
+
+        Args:
+            block: The index of the block
+
+        Returns:
+            The big-endian values of the block
+        """
+        data = self._blocks.get(block)
+        if data is not None:
+            self._blocks.move_to_end(block)
+            return data
+        key = b"%d:%d" % (self._seed, block)
+        data = self._mask(hashlib.shake_256(key).digest(self._block_bytes))
+        self._derived_blocks += 1
+        self._blocks[block] = data
+        if len(self._blocks) > self._CACHED_BLOCKS:
+            self._blocks.popitem(last=False)
+        return data
+
+    def _random_bytes(self, size: int) -> bytes:
+        """Get random values from the global random state.
+
+        Args:
+            size: The number of bytes, a multiple of the value size
+
+        Returns:
+            The big-endian values
+        """
+        if not size:
+            return b""
+        return self._mask(
+            random.getrandbits(8 * size).to_bytes(size, byteorder="big")
+        )
+
+    def _mask(self, data: bytes) -> bytes:
+        """Clear the bits above the value width.
+
+        Args:
+            data: The big-endian values
+
+        Returns:
+            The values limited to the value width
+        """
+        if self._mask_table is None:
+            return data
+        masked = bytearray(data)
+        masked[:: self._word_bytes] = masked[:: self._word_bytes].translate(
+            self._mask_table
         )
+        return bytes(masked)
+
+
+class RandomAxiPayloadGenerator(_RandomPayloadGenerator):
+    """A generator class that gives back a random payload.
+
+    Todo:
+        Add a usage example.
+    """
+
+    def __init__(self, data_width_bits: int, seed: int | None = None):
+        """Initialize an instance.
+
+        Args:
+            data_width_bits: The width of each value in bits
+            seed: The seed the payloads are derived from. Defaults to `None`,
+                which uses the global random state
+        """
+        super().__init__(data_width_bits, 1, seed)
 
 
 class AxiLiteMaster:
@@ -566,6 +1277,9 @@ class AxiLiteMaster:
         self._clk: str = clk
         self._rst: str = rst
         self._reset_active_level: int = reset_active_level
+        self._coverage: CoverageDatabase | None = None
+        self._protocol: ProtocolChecker | None = None
+        self._signals: _BusSignals = _BusSignals("AxiLiteBus", bus_prefix)
         self._log = SimLog(self._bus_prefix)
 
     def setup(self, dut: HierarchyObject) -> None:
@@ -579,11 +1293,15 @@ class AxiLiteMaster:
                 with `clk` and `rst`.
         """
         self._bus = axi.AxiLiteMaster(  # pyright: ignore[reportAttributeAccessIssue,reportUninitializedInstanceVariable]
-            bus=axi.AxiLiteBus.from_prefix(dut, self._bus_prefix),  # pyright: ignore[reportAttributeAccessIssue]
+            bus=self._signals.get(dut),
             clock=getattr(dut, self._clk),
             reset=getattr(dut, self._rst),
             reset_active_level=bool(self._reset_active_level),
         )
+        if self._coverage is not None:
+            attach_axil(self._coverage, self._bus_prefix, self._bus)
+        if self._protocol is not None:
+            self._protocol.attach_axil(self._bus_prefix, self._bus)
 
     async def write(
         self,
@@ -622,6 +1340,40 @@ class AxiLiteMaster:
         """
         return await self._bus.read(address, length, prot=prot)
 
+    def enable_coverage(self, database: CoverageDatabase) -> None:
+        """Collect the functional coverage of the bus.
+
+        The coverage is collected from the next :meth:`setup` on, or right
+        away if the bus is already set up. See
+        :func:`~cocotb_wrapper.coverage.attach_axil` for the cover groups.
+        Enabling the same database again has no effect.
+
+        Args:
+            database: The database collecting the cover groups
+        """
+        if database is self._coverage:
+            return
+        self._coverage = database
+        if hasattr(self, "_bus"):
+            attach_axil(database, self._bus_prefix, self._bus)
+
+    def enable_protocol_checks(self, checker: ProtocolChecker) -> None:
+        """Check that the bus follows the protocol.
+
+        The checks start with the next :meth:`setup`, or right away if the bus
+        is already set up.
+
+        Args:
+            checker: The checker collecting the protocol violations
+        """
+        self._protocol = checker
+        if hasattr(self, "_bus"):
+            checker.attach_axil(self._bus_prefix, self._bus)
+
+    async def wait_idle(self) -> None:
+        """Wait until all read and write operations completed."""
+        await self._bus.wait()
+
     def set_idle_generator(self, generator: Iterator[int]) -> None:
         """Toggle pauses on the write bus lanes given a generator function.
 
@@ -690,6 +1442,10 @@ class AxiLiteRam:
         self._rst: str = rst
         self._reset_active_level: int = bool(reset_active_level)
         self._size: int = size
+        self._coverage: CoverageDatabase | None = None
+        self._protocol: ProtocolChecker | None = None
+        self._signals: _BusSignals = _BusSignals("AxiLiteBus", bus_prefix)
+        self._regions: _AddressMap = _AddressMap()
         self._log = SimLog(self._bus_prefix)
 
     def setup(self, dut: HierarchyObject) -> None:
@@ -703,12 +1459,19 @@ class AxiLiteRam:
                 with `clk` and `rst`.
         """
         self._ram = axi.AxiLiteRam(  # pyright: ignore[reportAttributeAccessIssue,reportUninitializedInstanceVariable]
-            bus=axi.AxiLiteBus.from_prefix(dut, self._bus_prefix),  # pyright: ignore[reportAttributeAccessIssue]
+            bus=self._signals.get(dut),
             clock=getattr(dut, self._clk),
             reset=getattr(dut, self._rst),
             reset_active_level=self._reset_active_level,
             size=self._size,
         )
+        if self._coverage is not None:
+            attach_axil(self._coverage, self._bus_prefix, self._ram)
+        if self._protocol is not None:
+            self._protocol.attach_axil(self._bus_prefix, self._ram)
+        self._activity = _SlaveActivity(self._ram)  # pyright: ignore[reportUninitializedInstanceVariable]
+        if self._regions:
+            _map_slave(self._ram, self._regions)
 
     def write(self, address: int, data: bytes) -> None:
         """Write `data` to the `address`.
@@ -731,6 +1494,48 @@ class AxiLiteRam:
         """
         return bytes(self._ram.read(address, length))
 
+    def add_region(
+        self,
+        address: int,
+        size: int,
+        read: Callable[[int, int], bytes] | None = None,
+        write: Callable[[int, bytes], None] | None = None,
+    ) -> None:
+        """Model a peripheral at an address range of the RAM.
+
+        The handlers are called with the offset into the region instead of
+        accessing the storage, e.g. for read-to-clear status registers, FIFO
+        data ports or doorbells. A region without a read or write handler
+        leaves that access to the storage. An exception raised by a handler is
+        answered with a ``SLVERR`` response. The regions are kept across calls
+        to :meth:`setup`.
+
+        Args:
+            address: The start address of the region
+            size: The size of the region in bytes
+            read: A function that takes the offset and the length of a read
+                and returns the data
+            write: A function that takes the offset and the data of a write
+
+        Raises:
+            ValueError: If the region is empty or overlaps another region
+        """
+        self._regions.add(address, size, read, write)
+        if hasattr(self, "_ram"):
+            _map_slave(self._ram, self._regions)
+
+    def remove_region(self, address: int) -> None:
+        """Stop modelling a peripheral.
+
+        Args:
+            address: The start address of a region added with
+                :meth:`add_region`
+
+        Raises:
+            KeyError: If no region starts at `address`
+        """
+        self._regions.remove(address)
+
     def hexdump(self, address: int, length: int, prefix: str = "RAM") -> None:
         """Dump the content of the RAM to the stdout.
 
@@ -741,6 +1546,44 @@ class AxiLiteRam:
         """
         self._ram.hexdump(address, length, prefix)
 
+    def enable_coverage(self, database: CoverageDatabase) -> None:
+        """Collect the functional coverage of the RAM.
+
+        The coverage is collected from the next :meth:`setup` on, or right
+        away if the RAM is already set up. See
+        :func:`~cocotb_wrapper.coverage.attach_axil` for the cover groups.
+        Enabling the same database again has no effect.
+
+        Args:
+            database: The database collecting the cover groups
+        """
+        if database is self._coverage:
+            return
+        self._coverage = database
+        if hasattr(self, "_ram"):
+            attach_axil(database, self._bus_prefix, self._ram)
+
+    def enable_protocol_checks(self, checker: ProtocolChecker) -> None:
+        """Check that the bus follows the protocol.
+
+        The checks start with the next :meth:`setup`, or right away if the bus
+        is already set up.
+
+        Args:
+            checker: The checker collecting the protocol violations
+        """
+        self._protocol = checker
+        if hasattr(self, "_ram"):
+            checker.attach_axil(self._bus_prefix, self._ram)
+
+    async def wait_idle(self) -> None:
+        """Wait until all accepted transactions are answered.
+
+        The RAM is idle once the response of every received address is sent
+        and no data is left in its channels.
+        """
+        await self._activity.wait()
+
     def set_idle_generator(self, generator: Iterator[int]) -> None:
         """Toggle pauses on the write bus lanes given a generator function.
 
@@ -779,30 +1622,22 @@ class AxiLiteRam:
         self.set_backpressure_generator(cycle([0]))
 
 
-class RandomAxiLitePayloadGenerator:
+class RandomAxiLitePayloadGenerator(_RandomPayloadGenerator):
     """A generator class that gives back a random payload.
 
     Todo:
         Add a usage example.
     """
 
-    def __init__(self, data_width_bits: int):
+    def __init__(self, data_width_bits: int, seed: int | None = None):
         """Initialize an instance.
 
         Args:
             data_width_bits: The width of each value in bits
+            seed: The seed the payloads are derived from. Defaults to `None`,
+                which uses the global random state
         """
-        self._data_width_bits = data_width_bits
-
-    def get_payload(self) -> bytes:
-        """Get a random payload.
-
-        Returns:
-            The random payload
-        """
-        return getrandbits(self._data_width_bits).to_bytes(
-            bits_to_bytes(self._data_width_bits), byteorder="big"
-        )
+        super().__init__(data_width_bits, 1, seed)
 
 
 class AxiStreamSource:
@@ -819,6 +1654,7 @@ class AxiStreamSource:
         clk: str,
         rst: str,
         reset_active_level: int,
+        queue_depth: int = 0,
     ):
         """Initialize an instance.
 
@@ -828,12 +1664,22 @@ class AxiStreamSource:
             clk: The name of the clock
             rst: The name of the reset
             reset_active_level: 1 if active high 0 if active low
+            queue_depth: The maximum number of frames :meth:`write_frames`
+                keeps queued in the source. ``0`` disables the limit
         """
         self._bus_prefix: str = bus_prefix
         self._tdata_width_bits: int = tdata_width_bits
         self._clk: str = clk
         self._rst: str = rst
         self._reset_active_level: int = reset_active_level
+        self._queue_depth: int = queue_depth
+        self._frames_queued: int = 0
+        self._frames_sent: int = 0
+        self._sent_event: Event = Event()
+        self._pacing_task: Task[None] | None = None
+        self._sample_frame: Callable[[bytes | bytearray], None] | None = None
+        self._protocol: ProtocolChecker | None = None
+        self._signals: _BusSignals = _BusSignals("AxiStreamBus", bus_prefix)
         self._log = SimLog(self._bus_prefix)
 
     def setup(self, dut: HierarchyObject) -> None:
@@ -847,15 +1693,48 @@ class AxiStreamSource:
                 with `clk` and `rst`.
         """
         self._bus = axi.AxiStreamSource(  # pyright: ignore[reportAttributeAccessIssue,reportUninitializedInstanceVariable]
-            bus=axi.AxiStreamBus.from_prefix(dut, self._bus_prefix),  # pyright: ignore[reportAttributeAccessIssue]
+            bus=self._signals.get(dut),
             clock=getattr(dut, self._clk),
             reset=getattr(dut, self._rst),
             reset_active_level=bool(self._reset_active_level),
             byte_lanes=bits_to_bytes(self._tdata_width_bits),
         )
+        self._frames_queued = 0
+        self._frames_sent = 0
+        self._sent_event = Event()
+        self._sent_event.set()
+        self._pacing_task = None
+        if self._protocol is not None:
+            self._protocol.attach_axis(self._bus_prefix, self._bus)
+
+    @property
+    def frames_sent(self) -> int:
+        """Get the number of transmitted frames.
+
+        Only frames queued with :meth:`send_nowait` or :meth:`write_frames`
+        are counted.
+
+        Returns:
+            The number of frames transmitted since the last :meth:`setup`
+        """
+        return self._frames_sent
+
+    @property
+    def frames_pending(self) -> int:
+        """Get the number of frames queued but not yet transmitted.
+
+        Returns:
+            The number of frames waiting for transmission
+        """
+        return self._frames_queued - self._frames_sent
 
     async def write(
-        self, frame_data: bytes, event: Event | None = None
+        self,
+        frame_data: bytes,
+        event: Event | None = None,
+        tid: int | None = None,
+        tdest: int | None = None,
+        tuser: int | None = None,
     ) -> None:
         """Write an AXI-Stream frame.
 
@@ -864,10 +1743,137 @@ class AxiStreamSource:
             event: An :class:`~cocotb.triggers.Event` object to await the
                 completion of the frame transmission. The event gets triggered
                 when the frame has been transmitted
+            tid: The `tid` of the frame
+            tdest: The `tdest` of the frame
+            tuser: The `tuser` of the frame
         """
-        frame = axi.AxiStreamFrame(frame_data, tx_complete=event)  # pyright: ignore[reportAttributeAccessIssue]
+        frame = axi.AxiStreamFrame(  # pyright: ignore[reportAttributeAccessIssue]
+            frame_data, tid=tid, tdest=tdest, tuser=tuser, tx_complete=event
+        )
+        if self._sample_frame is not None:
+            self._sample_frame(frame.tdata)
         await self._bus.write(frame)
 
+    def send_nowait(
+        self,
+        frame_data: bytes,
+        tid: int | None = None,
+        tdest: int | None = None,
+        tuser: int | None = None,
+    ) -> None:
+        """Queue an AXI-Stream frame without waiting.
+
+        Args:
+            frame_data: The frame data
+            tid: The `tid` of the frame
+            tdest: The `tdest` of the frame
+            tuser: The `tuser` of the frame
+
+        Raises:
+            QueueFull: If the source already holds `queue_depth` frames
+        """
+        if self._full(self._queue_depth):
+            raise QueueFull()
+        self._send(
+            axi.AxiStreamFrame(frame_data, tid=tid, tdest=tdest, tuser=tuser)  # pyright: ignore[reportAttributeAccessIssue]
+        )
+
+    async def write_frames(
+        self,
+        frames: Iterable[bytes | axi.AxiStreamFrame],  # pyright: ignore[reportAttributeAccessIssue]
+        queue_depth: int | None = None,
+    ) -> int:
+        """Queue multiple AXI-Stream frames.
+
+        The frames are queued without awaiting each transmission. This
+        coroutine only waits if the source holds `queue_depth` frames. Use
+        :meth:`wait_sent` or :attr:`frames_sent` to follow the transmission.
+
+        Args:
+            frames: The data of each frame, or frames with their `tid`, `tdest`
+                and `tuser`
+            queue_depth: Overrides the `queue_depth` of the instance
+
+        Returns:
+            The number of queued frames
+        """
+        if queue_depth is None:
+            queue_depth = self._queue_depth
+        count = 0
+        for frame_data in frames:
+            while self._full(queue_depth):
+                self._bus.dequeue_event.clear()
+                await self._bus.dequeue_event.wait()
+            self._send(frame_data)
+            count += 1
+        return count
+
+    async def send_from(
+        self,
+        source: PathLike | Iterable[bytes],
+        framing: str = "pcap",
+        frame_size: int = 0,
+        queue_depth: int | None = None,
+    ) -> int:
+        """Send frames read lazily from a file or an iterator.
+
+        Frames are only read when the source queue has room, so only a few
+        frames are held in memory at a time. See :mod:`~cocotb_wrapper.framing`
+        for the supported framings.
+
+        Args:
+            source: The path to a file or an iterator over the frame data
+            framing: The framing of the file
+            frame_size: The frame size in bytes of the ``'fixed'`` framing
+            queue_depth: The number of frames kept in the source queue.
+                Defaults to the `queue_depth` of the instance or ``8`` if that
+                is unlimited
+
+        Returns:
+            The number of queued frames
+        """
+        if isinstance(source, (str, os.PathLike)):
+            source = read_frames(source, framing, frame_size)
+        if queue_depth is None:
+            queue_depth = self._queue_depth or 8
+        return await self.write_frames(source, queue_depth)
+
+    async def wait_sent(self) -> None:
+        """Wait until all frames queued without an event are transmitted."""
+        await self._sent_event.wait()
+
+    def enable_coverage(self, database: CoverageDatabase) -> None:
+        """Collect the functional coverage of the sent frames.
+
+        See :func:`~cocotb_wrapper.coverage.frame_sampler` for the cover
+        group.
+
+        Args:
+            database: The database collecting the cover groups
+        """
+        self._sample_frame = frame_sampler(
+            database, self._bus_prefix, bits_to_bytes(self._tdata_width_bits)
+        )
+
+    def enable_protocol_checks(self, checker: ProtocolChecker) -> None:
+        """Check that the stream follows the protocol.
+
+        The checks start with the next :meth:`setup`, or right away if the bus
+        is already set up.
+
+        Args:
+            checker: The checker collecting the protocol violations
+        """
+        self._protocol = checker
+        if hasattr(self, "_bus"):
+            checker.attach_axis(self._bus_prefix, self._bus)
+
+    async def wait_idle(self) -> None:
+        """Wait until all queued frames are transmitted."""
+        while self.frames_pending or not self._bus.idle():
+            await self.wait_sent()
+            await self._bus.wait()
+
     def set_pause_generator(self, generator: Iterator[int]) -> None:
         """Toggle pauses on the bus given a generator function.
 
@@ -875,15 +1881,504 @@ class AxiStreamSource:
             generator: A signal generator for the tready flag. The tready signal
                 will be low if the Iterator yields a ``'1'``
         """
+        self._stop_pacing()
         self._bus.set_pause_generator(generator)
 
+    def set_rate(
+        self,
+        beats_per_cycle: float | None = None,
+        bytes_per_second: float | None = None,
+        clock_period: float | None = None,
+        clock_period_unit: str = "ns",
+        burst: int = 1,
+        jitter: float = 0.0,
+    ) -> None:
+        """Limit the source to a target bandwidth.
+
+        The cycles in which `tvalid` may be asserted are shaped by a token
+        bucket. Instead of stepping a pause generator every cycle, the source
+        is paused and released for whole runs of cycles. The rate limits the
+        cycles offered to the bus, so it is reached if the source has frames
+        queued and the sink does not apply backpressure.
+
+        Args:
+            beats_per_cycle: The target rate in beats per clock cycle
+            bytes_per_second: The target rate in bytes per simulated second.
+                Requires `clock_period`
+            clock_period: The period of the clock
+            clock_period_unit: The unit of the clock period
+            burst: The size of the token bucket, which limits how many beats
+                are sent back-to-back after a pause
+            jitter: The relative amount the pauses are randomly stretched or
+                shortened, between ``0`` and ``1``
+
+        Raises:
+            ValueError: If neither or both rates are given, or the rate is not
+                positive
+        """
+        if (beats_per_cycle is None) == (bytes_per_second is None):
+            raise ValueError("Give either beats_per_cycle or bytes_per_second")
+        if bytes_per_second is not None:
+            if clock_period is None:
+                raise ValueError("bytes_per_second requires the clock_period")
+            period = get_time_from_sim_steps(
+                get_sim_steps(clock_period, clock_period_unit),  # pyright: ignore[reportArgumentType]
+                "sec",
+            )
+            beats_per_cycle = (
+                bytes_per_second
+                * period
+                / bits_to_bytes(self._tdata_width_bits)
+            )
+        assert beats_per_cycle is not None
+        if beats_per_cycle <= 0:
+            raise ValueError("The rate must be positive")
+        self._stop_pacing()
+        self._bus.clear_pause_generator()
+        self._bus.pause = False
+        if beats_per_cycle < 1:
+            self._pacing_task = start_soon(
+                self._run_pacing(beats_per_cycle, max(1, burst), jitter)
+            )
+
     def disable(self) -> None:
         """Disable the AXI-Stream source."""
-        self._bus.set_pause_generator(cycle([1]))
+        self.set_pause_generator(cycle([1]))
 
     def enable(self) -> None:
         """Enable the AXI-Stream source."""
-        self._bus.set_pause_generator(cycle([0]))
+        self.set_pause_generator(cycle([0]))
+
+    async def _run_pacing(self, rate: float, burst: int, jitter: float) -> None:
+        """Pause and release the source according to a token bucket.
+
+        Every cycle adds `rate` tokens to the bucket, which holds at most
+        `burst` tokens plus the fraction added in one cycle, so no tokens are
+        lost by rounding the pauses to whole cycles. Each released cycle takes
+        one token.
+
+        Args:
+            rate: The rate in beats per cycle, below ``1``
+            burst: The size of the bucket
+            jitter: The relative random variation of the pauses
+        """
+        clock = self._bus.clock
+        tokens = float(burst)
+        while True:
+            if tokens >= 1:
+                # Release the source as long as tokens are left
+                released = math.floor((tokens - 1) / (1 - rate)) + 1
+                tokens -= released * (1 - rate)
+                self._bus.pause = False
+                await ClockCycles(clock, released)
+            paused = math.ceil((1 - tokens) / rate)
+            if jitter:
+                paused = round(paused * random.uniform(1 - jitter, 1 + jitter))
+            paused = max(1, paused)
+            tokens = min(burst + rate, tokens + paused * rate)
+            self._bus.pause = True
+            await ClockCycles(clock, paused)
+
+    def _stop_pacing(self) -> None:
+        """Stop limiting the rate of the source."""
+        if self._pacing_task is not None:
+            self._pacing_task.kill()
+            self._pacing_task = None
+
+    def _full(self, queue_depth: int) -> bool:
+        """Check whether the source queue reached `queue_depth`.
+
+        Args:
+            queue_depth: The maximum number of queued frames, ``0`` if
+                unlimited
+
+        Returns:
+            True if no further frame may be queued
+        """
+        return 0 < queue_depth <= self._bus.count()
+
+    def _send(self, frame_data: bytes | axi.AxiStreamFrame) -> None:  # pyright: ignore[reportAttributeAccessIssue]
+        """Queue a frame that reports its completion to the frame counters.
+
+        Args:
+            frame_data: The frame data or a frame with its sideband signals
+        """
+        frame = axi.AxiStreamFrame(  # pyright: ignore[reportAttributeAccessIssue]
+            frame_data, tx_complete=self._handle_tx_complete
+        )
+        if self._sample_frame is not None:
+            self._sample_frame(frame.tdata)
+        self._bus.send_nowait(frame)
+        self._frames_queued += 1
+        self._sent_event.clear()
+
+    def _handle_tx_complete(
+        self,
+        frame: axi.AxiStreamFrame,  # pyright: ignore[reportAttributeAccessIssue]
+    ) -> None:
+        """Count a transmitted frame.
+
+        Args:
+            frame: The transmitted frame
+        """
+        self._frames_sent += 1
+        if self._frames_sent == self._frames_queued:
+            self._sent_event.set()
+
+
+class AxiStreamCaptureMode(Enum):
+    """The way an :class:`AxiStreamSink` handles received frames."""
+
+    FRAMES = "frames"
+    """Queue every received frame to be read by the test."""
+    DIGEST = "digest"
+    """Discard the frames, but update a running digest and the counters."""
+    COUNT = "count"
+    """Discard the frames, but update the counters."""
+
+
+class AxiStreamCaptureStats:
+    """Running statistics over a stream of AXI-Stream frames.
+
+    The statistics use a constant amount of memory, independent of the number
+    of frames. Feed the expected frames into a second instance with the same
+    algorithm to compare a stream by its digest.
+    """
+
+    def __init__(
+        self, algorithm: str | None = "crc32", length_histogram: bool = False
+    ):
+        """Initialize an instance.
+
+        Args:
+            algorithm: The digest algorithm, one of ``'crc32'``, ``'xxhash'``
+                and ``'sha256'``. ``None`` only counts the frames and bytes
+            length_histogram: Count how often each frame length occurs
+
+        Raises:
+            ValueError: If the algorithm is not supported
+            ImportError: If ``'xxhash'`` is requested, but the `xxhash` package
+                is not installed
+        """
+        self._algorithm: str | None = algorithm
+        self._crc32: int = 0
+        if algorithm is None or algorithm == "crc32":
+            self._hash = None
+        elif algorithm == "sha256":
+            self._hash = hashlib.sha256()
+        elif algorithm == "xxhash":
+            try:
+                import xxhash  # pyright: ignore[reportMissingImports]
+            except ImportError as e:
+                raise ImportError(
+                    "The 'xxhash' digest requires the xxhash package"
+                ) from e
+            self._hash = xxhash.xxh64()
+        else:
+            raise ValueError(f"Unsupported digest algorithm '{algorithm}'")
+        self.frames: int = 0
+        """The number of frames."""
+        self.bytes: int = 0
+        """The total number of bytes of all frames."""
+        self.min_length: int | None = None
+        """The length of the shortest frame."""
+        self.max_length: int | None = None
+        """The length of the longest frame."""
+        self.length_histogram: Counter[int] | None = (
+            Counter() if length_histogram else None
+        )
+        """The number of frames per frame length, if enabled."""
+
+    @property
+    def mean_length(self) -> float:
+        """Get the mean frame length.
+
+        Returns:
+            The mean length of all frames in bytes
+        """
+        return self.bytes / self.frames if self.frames else 0.0
+
+    def update(self, data: bytes | bytearray) -> None:
+        """Add a frame to the statistics.
+
+        Args:
+            data: The frame data
+        """
+        length = len(data)
+        self.frames += 1
+        self.bytes += length
+        if self.min_length is None or length < self.min_length:
+            self.min_length = length
+        if self.max_length is None or length > self.max_length:
+            self.max_length = length
+        if self.length_histogram is not None:
+            self.length_histogram[length] += 1
+        if self._hash is not None:
+            self._hash.update(data)
+        elif self._algorithm is not None:
+            self._crc32 = zlib.crc32(data, self._crc32)
+
+    def hexdigest(self) -> str:
+        """Get the digest over all frame data.
+
+        Returns:
+            The digest as a hexadecimal string
+
+        Raises:
+            ValueError: If the statistics were created without an algorithm
+        """
+        if self._hash is not None:
+            return self._hash.hexdigest()
+        if self._algorithm is None:
+            raise ValueError("No digest algorithm selected")
+        return f"{self._crc32:08x}"
+
+
+class _AxiStreamSinkHooks:
+    """The hooks of the wrapper mixed into a cocotbext AXI-Stream sink.
+
+    Received frames are passed to a handler before they are queued, and the
+    sink applies backpressure while a hook reports that it is full.
+    """
+
+    def __init__(
+        self,
+        *args: object,
+        handler: Callable[[axi.AxiStreamFrame], bool],  # pyright: ignore[reportAttributeAccessIssue]
+        full: Callable[[], bool],
+        **kwargs: object,
+    ):
+        """Initialize an instance.
+
+        Args:
+            args: The arguments of the cocotbext sink
+            handler: A function that returns True if the frame is queued
+            full: A function that returns True if the sink must stall
+            kwargs: The keyword arguments of the cocotbext sink
+        """
+        super().__init__(*args, **kwargs)  # pyright: ignore[reportCallIssue]
+        self.queue = _SinkQueue(self, handler)
+        self._full_hook = full
+
+    def full(self) -> bool:
+        """Check whether the sink must apply backpressure.
+
+        Returns:
+            True if the sink queue or the hook is full
+        """
+        return super().full() or self._full_hook()  # pyright: ignore[reportAttributeAccessIssue]
+
+
+@lru_cache(maxsize=None)
+def _sink_model() -> type[axi.AxiStreamSink]:  # pyright: ignore[reportAttributeAccessIssue]
+    """Create the cocotbext AXI-Stream sink with the hooks of the wrapper.
+
+    The class is created on first use, so that `cocotbext-axi` is only imported
+    once a sink is set up.
+
+    Returns:
+        The sink class
+    """
+    return type(
+        "_AxiStreamSinkModel",
+        (_AxiStreamSinkHooks, axi.AxiStreamSink),  # pyright: ignore[reportAttributeAccessIssue]
+        {},
+    )
+
+
+class _SinkQueue(Queue):  # pyright: ignore[reportMissingTypeArgument]
+    """The receive queue of a cocotbext AXI-Stream sink.
+
+    Each received frame is passed to a handler first, which decides whether the
+    frame is queued or dropped.
+    """
+
+    def __init__(
+        self,
+        bus: axi.AxiStreamSink,  # pyright: ignore[reportAttributeAccessIssue]
+        handler: Callable[[axi.AxiStreamFrame], bool],  # pyright: ignore[reportAttributeAccessIssue]
+    ):
+        """Initialize an instance.
+
+        Args:
+            bus: The cocotbext sink that owns the queue
+            handler: A function that returns True if the frame is queued
+        """
+        super().__init__()
+        self._bus = bus
+        self._handler = handler
+
+    def put_nowait(self, item: axi.AxiStreamFrame) -> None:  # pyright: ignore[reportAttributeAccessIssue]
+        """Hand a received frame to the handler and queue it if requested.
+
+        Args:
+            item: The received frame
+        """
+        size = len(item)
+        if self._handler(item):
+            # The handler compacts the frame, which the sink counted in full
+            self._bus.queue_occupancy_bytes -= size - len(item)
+            super().put_nowait(item)
+        else:
+            # The sink counts every received frame as queued
+            self._bus.queue_occupancy_bytes -= size
+            self._bus.queue_occupancy_frames -= 1
+
+
+class AxiStreamChannel:
+    """The frames of one `tid` or `tdest` received by an AXI-Stream sink.
+
+    This class is not intended to be instantiated directly. Instead use
+    :meth:`~cocotb_wrapper.axi.AxiStreamSink.channel` of a demultiplexing sink.
+    """
+
+    def __init__(self, sink: AxiStreamSink, key: int | None, depth: int):
+        """Initialize an instance.
+
+        Args:
+            sink: The sink receiving the frames
+            key: The `tid` or `tdest` of the channel
+            depth: The number of queued frames at which the sink stalls. ``0``
+                disables the limit
+        """
+        self._sink: AxiStreamSink = sink
+        self._key: int | None = key
+        self._depth: int = depth
+        self._frames: deque[axi.AxiStreamFrame] = deque()  # pyright: ignore[reportAttributeAccessIssue]
+        self._stalled: bool = False
+        self._event: Event = Event()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Iterate over the data of the frames of this channel.
+
+        Yields:
+            The frame data of each received frame
+        """
+        while True:
+            yield await self.read()
+
+    @property
+    def key(self) -> int | None:
+        """Get the `tid` or `tdest` of the channel.
+
+        Returns:
+            The key of the channel
+        """
+        return self._key
+
+    def count(self) -> int:
+        """Get the number of queued frames.
+
+        Returns:
+            The number of queued frames
+        """
+        return len(self._frames)
+
+    async def read(self) -> bytes:
+        """Read an AXI-Stream frame of this channel.
+
+        Returns:
+            The frame data
+        """
+        return (await self.recv()).tdata
+
+    def read_nowait(self) -> bytes:
+        """Read an AXI-Stream frame of this channel without waiting.
+
+        Returns:
+            The frame data
+
+        Raises:
+            QueueEmpty: If no frame has been received
+        """
+        return self.recv_nowait().tdata
+
+    async def read_batch(
+        self, count: int = -1, timeout: int = 0, timeout_unit: str = "ns"
+    ) -> list[bytes]:
+        """Read all AXI-Stream frames queued in this channel.
+
+        If no frame is queued, wait for the next frame first.
+
+        Args:
+            count: The maximum number of frames to read. A negative value reads
+                all queued frames
+            timeout: The time to wait for a frame. ``0`` waits forever
+            timeout_unit: The unit of the timeout time
+
+        Returns:
+            The frame data of each read frame. The list is empty if the timeout
+            expired
+        """
+        frames = await self.recv_batch(count, timeout, timeout_unit)
+        return [frame.tdata for frame in frames]
+
+    async def recv(self) -> axi.AxiStreamFrame:  # pyright: ignore[reportAttributeAccessIssue]
+        """Receive an AXI-Stream frame of this channel.
+
+        Returns:
+            The frame with its sideband signals
+        """
+        while not self._frames:
+            self._event.clear()
+            await self._event.wait()
+        return self.recv_nowait()
+
+    def recv_nowait(self) -> axi.AxiStreamFrame:  # pyright: ignore[reportAttributeAccessIssue]
+        """Receive an AXI-Stream frame of this channel without waiting.
+
+        Returns:
+            The frame with its sideband signals
+
+        Raises:
+            QueueEmpty: If no frame has been received
+        """
+        if not self._frames:
+            raise QueueEmpty()
+        frame = self._frames.popleft()
+        if self._stalled and len(self._frames) < self._depth:
+            self._stalled = False
+            self._sink._release_channel()
+        return frame
+
+    async def recv_batch(
+        self, count: int = -1, timeout: int = 0, timeout_unit: str = "ns"
+    ) -> list[axi.AxiStreamFrame]:  # pyright: ignore[reportAttributeAccessIssue]
+        """Receive all AXI-Stream frames queued in this channel.
+
+        If no frame is queued, wait for the next frame first.
+
+        Args:
+            count: The maximum number of frames to receive. A negative value
+                receives all queued frames
+            timeout: The time to wait for a frame. ``0`` waits forever
+            timeout_unit: The unit of the timeout time
+
+        Returns:
+            The received frames. The list is empty if the timeout expired
+        """
+        if not self._frames:
+            self._event.clear()
+            if timeout:
+                await First(self._event.wait(), Timer(timeout, timeout_unit))  # pyright: ignore[reportArgumentType]
+            else:
+                await self._event.wait()
+        frames = []
+        while self._frames and len(frames) != count:
+            frames.append(self.recv_nowait())
+        return frames
+
+    def _put(self, frame: axi.AxiStreamFrame) -> None:  # pyright: ignore[reportAttributeAccessIssue]
+        """Queue a received frame.
+
+        Args:
+            frame: The received frame
+        """
+        self._frames.append(frame)
+        self._event.set()
+        if not self._stalled and 0 < self._depth <= len(self._frames):
+            self._stalled = True
+            self._sink._stall_channel()
 
 
 class AxiStreamSink:
@@ -900,6 +2395,11 @@ class AxiStreamSink:
         clk: str,
         rst: str,
         reset_active_level: int,
+        capture_mode: AxiStreamCaptureMode = AxiStreamCaptureMode.FRAMES,
+        digest_algorithm: str = "crc32",
+        length_histogram: bool = False,
+        demux: str | None = None,
+        channel_depth: int = 0,
     ):
         """Initialize an instance.
 
@@ -909,13 +2409,37 @@ class AxiStreamSink:
             clk: The name of the clock
             rst: The name of the reset
             reset_active_level: 1 if active high 0 if active low
+            capture_mode: How received frames are handled
+            digest_algorithm: The digest algorithm used in the
+                :attr:`AxiStreamCaptureMode.DIGEST` mode
+            length_histogram: Count how often each frame length occurs, if the
+                frames are not queued
+            demux: Sort the received frames into a queue per ``'tid'`` or
+                ``'tdest'``, which are read through :meth:`channel`
+            channel_depth: The number of frames queued in a channel at which
+                the sink deasserts `tready`. ``0`` disables the limit
+
+        Raises:
+            ValueError: If the demux field is not supported
         """
+        if demux not in (None, "tid", "tdest"):
+            raise ValueError(f"Unsupported demux field '{demux}'")
         self._bus_prefix: str = bus_prefix
         self._tdata_width_bits: int = tdata_width_bits
         self._clk: str = clk
         self._rst: str = rst
         self._reset_active_level: int = bool(reset_active_level)
+        self._demux: str | None = demux
+        self._channel_depth: int = channel_depth
+        self._channels: dict[int | None, AxiStreamChannel] = {}
+        self._full_channels: int = 0
+        self._sample_frame: Callable[[bytes | bytearray], None] | None = None
+        self._protocol: ProtocolChecker | None = None
+        self._signals: _BusSignals = _BusSignals("AxiStreamBus", bus_prefix)
         self._log = SimLog(self._bus_prefix)
+        self._callbacks: dict[Callable[[axi.AxiStreamFrame], None], bool] = {}  # pyright: ignore[reportAttributeAccessIssue]
+        self._writer: FrameWriter | None = None
+        self.set_capture_mode(capture_mode, digest_algorithm, length_histogram)
 
     def setup(self, dut: HierarchyObject) -> None:
         """Setup the AXI-Stream sink.
@@ -927,13 +2451,147 @@ class AxiStreamSink:
             AttributeError: If `dut` does not contain the handles of given
                 with `clk` and `rst`.
         """
-        self._bus = axi.AxiStreamSink(  # pyright: ignore[reportAttributeAccessIssue,reportUninitializedInstanceVariable]
-            bus=axi.AxiStreamBus.from_prefix(dut, self._bus_prefix),  # pyright: ignore[reportAttributeAccessIssue]
+        self._bus = _sink_model()(  # pyright: ignore[reportUninitializedInstanceVariable]
+            bus=self._signals.get(dut),
             clock=getattr(dut, self._clk),
             reset=getattr(dut, self._rst),
             reset_active_level=self._reset_active_level,
             byte_lanes=bits_to_bytes(self._tdata_width_bits),
+            handler=self._handle_frame,
+            full=self._channels_full,
+        )
+        self._channels = {}
+        self._full_channels = 0
+        self.set_capture_mode(
+            self._capture_mode, self._digest_algorithm, self._length_histogram
         )
+        if self._protocol is not None:
+            self._protocol.attach_axis(self._bus_prefix, self._bus)
+
+    @property
+    def stats(self) -> AxiStreamCaptureStats:
+        """Get the statistics of the frames received in a discarding mode.
+
+        Returns:
+            The frame and byte counters and the running digest
+        """
+        return self._stats
+
+    def channel(self, key: int | None) -> AxiStreamChannel:
+        """Get the queue of received frames with the given `tid` or `tdest`.
+
+        The channels are recreated by :meth:`setup`.
+
+        Args:
+            key: The `tid` or `tdest`, depending on the `demux` field
+
+        Returns:
+            The channel of the key
+        """
+        channel = self._channels.get(key)
+        if channel is None:
+            channel = self._channels[key] = AxiStreamChannel(
+                self, key, self._channel_depth
+            )
+        return channel
+
+    def add_callback(
+        self,
+        callback: Callable[[axi.AxiStreamFrame], None],  # pyright: ignore[reportAttributeAccessIssue]
+        consume: bool = False,
+    ) -> None:
+        """Call a function with every received frame.
+
+        The callback is called as soon as the frame is complete, before it is
+        queued. The callbacks are kept across calls to :meth:`setup`.
+
+        Args:
+            callback: A function that takes the received frame
+            consume: Don't queue the frames, since the callback processes them
+        """
+        self._callbacks[callback] = consume
+
+    def remove_callback(
+        self,
+        callback: Callable[[axi.AxiStreamFrame], None],  # pyright: ignore[reportAttributeAccessIssue]
+    ) -> None:
+        """Stop calling a function with every received frame.
+
+        Args:
+            callback: A function previously added with :meth:`add_callback`
+        """
+        self._callbacks.pop(callback, None)
+
+    def capture_to(
+        self, path: PathLike, framing: str = "pcap", consume: bool = True
+    ) -> None:
+        """Write all received frames to a file.
+
+        The frames are written by a buffered background writer. A previous
+        capture is stopped. See :mod:`~cocotb_wrapper.framing` for the
+        supported framings.
+
+        Each capture must be ended with :meth:`stop_capture`, which writes the
+        buffered frames. The :class:`~cocotb_wrapper.Testbench` stops the
+        captures still running at the end of each test.
+
+        Args:
+            path: The path to the file
+            framing: The framing of the file
+            consume: Don't queue the captured frames
+        """
+        self.stop_capture()
+        self._writer = FrameWriter(path, framing)
+        self.add_callback(self._capture_frame, consume)
+        _capturing.add(self)
+
+    def stop_capture(self) -> None:
+        """Stop writing received frames and close the file."""
+        if self._writer is not None:
+            _capturing.discard(self)
+            self.remove_callback(self._capture_frame)
+            self._writer.close()
+            self._writer = None
+
+    def set_capture_mode(
+        self,
+        mode: AxiStreamCaptureMode,
+        digest_algorithm: str = "crc32",
+        length_histogram: bool = False,
+    ) -> None:
+        """Select how received frames are handled and reset the statistics.
+
+        Args:
+            mode: How received frames are handled
+            digest_algorithm: The digest algorithm used in the
+                :attr:`AxiStreamCaptureMode.DIGEST` mode
+            length_histogram: Count how often each frame length occurs, if the
+                frames are not queued
+        """
+        self._capture_mode: AxiStreamCaptureMode = mode
+        self._digest_algorithm: str = digest_algorithm
+        self._length_histogram: bool = length_histogram
+        self._stats: AxiStreamCaptureStats = AxiStreamCaptureStats(
+            digest_algorithm if mode is AxiStreamCaptureMode.DIGEST else None,
+            length_histogram,
+        )
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Iterate over the data of the received AXI-Stream frames.
+
+        Yields:
+            The frame data of each received frame
+        """
+        while True:
+            yield await self.read()
+
+    def count(self) -> int:
+        """Get the number of received frames that have not been read yet.
+
+        Returns:
+            The number of queued frames
+        """
+        return self._bus.count()
 
     async def read(self) -> bytes:
         """Read an AXI-Stream frame.
@@ -941,9 +2599,120 @@ class AxiStreamSink:
         Returns:
             The frame data
         """
-        frame = await self._bus.recv()
+        frame = await self._bus.recv(compact=False)
         return frame.tdata  # type: ignore[no-any-return]
 
+    def read_nowait(self) -> bytes:
+        """Read an AXI-Stream frame without waiting.
+
+        Returns:
+            The frame data
+
+        Raises:
+            QueueEmpty: If no frame has been received
+        """
+        return self.recv_nowait().tdata  # type: ignore[no-any-return]
+
+    async def read_batch(
+        self, count: int = -1, timeout: int = 0, timeout_unit: str = "ns"
+    ) -> list[bytes]:
+        """Read all AXI-Stream frames that are queued in the sink.
+
+        If no frame is queued, wait for the next frame first.
+
+        Args:
+            count: The maximum number of frames to read. A negative value reads
+                all queued frames
+            timeout: The time to wait for a frame. ``0`` waits forever
+            timeout_unit: The unit of the timeout time
+
+        Returns:
+            The frame data of each read frame. The list is empty if the timeout
+            expired
+        """
+        frames = await self.recv_batch(count, timeout, timeout_unit)
+        return [frame.tdata for frame in frames]
+
+    async def recv(self) -> axi.AxiStreamFrame:  # pyright: ignore[reportAttributeAccessIssue]
+        """Receive an AXI-Stream frame including its sideband signals.
+
+        Returns:
+            The frame with the `tdata`, `tkeep`, `tid`, `tdest` and `tuser`
+            attributes
+        """
+        return await self._bus.recv(compact=False)
+
+    def recv_nowait(self) -> axi.AxiStreamFrame:  # pyright: ignore[reportAttributeAccessIssue]
+        """Receive an AXI-Stream frame without waiting.
+
+        Returns:
+            The frame with the `tdata`, `tkeep`, `tid`, `tdest` and `tuser`
+            attributes
+
+        Raises:
+            QueueEmpty: If no frame has been received
+        """
+        if self._bus.empty():
+            raise QueueEmpty()
+        return self._bus.recv_nowait(compact=False)
+
+    async def recv_batch(
+        self, count: int = -1, timeout: int = 0, timeout_unit: str = "ns"
+    ) -> list[axi.AxiStreamFrame]:  # pyright: ignore[reportAttributeAccessIssue]
+        """Receive all AXI-Stream frames that are queued in the sink.
+
+        If no frame is queued, wait for the next frame first.
+
+        Args:
+            count: The maximum number of frames to receive. A negative value
+                receives all queued frames
+            timeout: The time to wait for a frame. ``0`` waits forever
+            timeout_unit: The unit of the timeout time
+
+        Returns:
+            The received frames. The list is empty if the timeout expired
+        """
+        if self._bus.empty():
+            await self._bus.wait(timeout, timeout_unit)
+        frames = []
+        while not self._bus.empty() and len(frames) != count:
+            frames.append(self._bus.recv_nowait(compact=False))
+        return frames
+
+    def enable_coverage(self, database: CoverageDatabase) -> None:
+        """Collect the functional coverage of the received frames.
+
+        See :func:`~cocotb_wrapper.coverage.frame_sampler` for the cover
+        group.
+
+        Args:
+            database: The database collecting the cover groups
+        """
+        self._sample_frame = frame_sampler(
+            database, self._bus_prefix, bits_to_bytes(self._tdata_width_bits)
+        )
+
+    def enable_protocol_checks(self, checker: ProtocolChecker) -> None:
+        """Check that the stream follows the protocol.
+
+        The checks start with the next :meth:`setup`, or right away if the bus
+        is already set up.
+
+        Args:
+            checker: The checker collecting the protocol violations
+        """
+        self._protocol = checker
+        if hasattr(self, "_bus"):
+            checker.attach_axis(self._bus_prefix, self._bus)
+
+    async def wait_idle(self) -> None:
+        """Wait until no frame is being received.
+
+        Received frames that were not read yet don't keep the sink busy.
+        """
+        while self._bus.active:
+            await RisingEdge(self._bus.clock)
+
     def set_pause_generator(self, generator: Iterator[int]) -> None:
         """Toggle pauses on the bus given a generator function.
 
@@ -961,35 +2730,82 @@ class AxiStreamSink:
         """Enable the AXI-Stream sink."""
         self.set_pause_generator(cycle([0]))
 
+    def _capture_frame(self, frame: axi.AxiStreamFrame) -> None:  # pyright: ignore[reportAttributeAccessIssue]
+        """Write a received frame to the capture file.
+
+        Args:
+            frame: The received frame
+        """
+        if self._writer is not None:
+            self._writer.write(
+                frame.tdata,
+                int(get_time_from_sim_steps(frame.sim_time_end, "ns")),
+            )
+
+    def _handle_frame(self, frame: axi.AxiStreamFrame) -> bool:  # pyright: ignore[reportAttributeAccessIssue]
+        """Handle a received frame according to the capture mode.
+
+        Args:
+            frame: The received frame
+
+        Returns:
+            True if the frame is queued to be read
+        """
+        frame.compact()
+        if self._sample_frame is not None:
+            self._sample_frame(frame.tdata)
+        store = True
+        if self._callbacks:
+            for callback, consume in list(self._callbacks.items()):
+                callback(frame)
+                store = store and not consume
+        if self._capture_mode is not AxiStreamCaptureMode.FRAMES:
+            self._stats.update(frame.tdata)
+            return False
+        if store and self._demux is not None:
+            key = sideband_value(getattr(frame, self._demux))
+            self.channel(key)._put(frame)
+            return False
+        return store
+
+    def _channels_full(self) -> bool:
+        """Check whether a channel reached its depth.
+
+        Returns:
+            True if the sink must stall
+        """
+        return self._full_channels > 0
+
+    def _stall_channel(self) -> None:
+        """Stall the sink, since a channel reached its depth."""
+        self._full_channels += 1
 
-class RandomAxiStreamPayloadGenerator:
+    def _release_channel(self) -> None:
+        """Resume the sink, if no other channel is full."""
+        self._full_channels -= 1
+        self._bus.wake_event.set()
+
+
+class RandomAxiStreamPayloadGenerator(_RandomPayloadGenerator):
     """A generator class that gives back a random payload.
 
     Todo:
         Add a usage example.
     """
 
-    def __init__(self, frame_length: int, data_width_bits: int):
+    def __init__(
+        self,
+        frame_length: int,
+        data_width_bits: int,
+        seed: int | None = None,
+    ):
         """Initialize an instance.
 
         Args:
             frame_length: The length of the frame
             data_width_bits: The width of each value in bits
+            seed: The seed the payloads are derived from. Defaults to `None`,
+                which uses the global random state
         """
+        super().__init__(data_width_bits, frame_length, seed)
         self._frame_length: int = frame_length
-        self._data_width_bits: int = data_width_bits
-
-    def get_payload(self) -> bytes:
-        """Get a random payload.
-
-        Returns:
-            The random payload
-        """
-        return b"".join(
-            [
-                getrandbits(self._data_width_bits).to_bytes(
-                    bits_to_bytes(self._data_width_bits), byteorder="big"
-                )
-                for _ in range(self._frame_length)
-            ]
-        )
@@ -0,0 +1,201 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Access the memories of the DUT without going through its buses.
+
+The elements of an HDL array are written and read through the simulator
+handles of the elements directly, which skips the value conversion and the
+scheduling of cocotb handles. Arrays the simulator doesn't expose this way are
+accessed element by element through the cocotb handles instead.
+
+Data given as bytes is packed into the array elements in little-endian order,
+like the byte lanes of an AXI bus, so element ``offset`` holds the first bytes.
+The offsets are HDL indices, so the first element of ``mem [16:31]`` is 16.
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+import re
+from collections.abc import Sequence
+from typing import Any
+
+from cocotb.handle import HierarchyObject
+
+_INDEX = re.compile(r"[^\[\]]+")
+
+
+def resolve(dut: HierarchyObject, path: str) -> Any:
+    """Get the handle of an object in the hierarchy of the DUT.
+
+    Args:
+        dut: The device under test
+        path: The dotted path below the DUT, e.g. ``'u_core.u_sram.mem'``.
+            Generate blocks are indexed with brackets, e.g. ``'bank[2].mem'``
+
+    Returns:
+        The handle of the object
+
+    Raises:
+        AttributeError: If the path does not exist
+    """
+    handle: Any = dut
+    for part in path.split("."):
+        name, *indices = _INDEX.findall(part)
+        handle = getattr(handle, name)
+        for index in indices:
+            handle = handle[int(index)]
+    return handle
+
+
+def load(
+    handle: Any, data: bytes | Sequence[int], offset: int | None = None
+) -> None:
+    """Write consecutive elements of an HDL array immediately.
+
+    Args:
+        handle: The handle of the array
+        data: The bytes or the element values to write
+        offset: The index of the first element, the lowest index if None
+
+    Raises:
+        IndexError: If the data does not fit into the array
+        ValueError: If a value does not fit into an element
+    """
+    if offset is None:
+        first: int = min(handle._range)
+        offset = first
+    width = len(handle[offset])
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = _to_words(data, width)
+    for index, value in enumerate(data, offset):
+        if not 0 <= value < 1 << width:
+            raise ValueError(
+                f"Value {value:#x} of {handle._name}[{index}] does not fit "
+                f"into {width} bits"
+            )
+    try:
+        _load_elements(handle, data, offset, width)
+    except (AttributeError, TypeError):
+        for index, value in enumerate(data, offset):
+            handle[index].setimmediatevalue(value)
+
+
+def read(
+    handle: Any, length: int | None = None, offset: int | None = None
+) -> list[int]:
+    """Read consecutive elements of an HDL array.
+
+    Args:
+        handle: The handle of the array
+        length: The number of elements, all elements from `offset` on if None
+        offset: The index of the first element, the lowest index if None
+
+    Returns:
+        The values of the elements
+
+    Raises:
+        IndexError: If the elements are not in the array
+        ValueError: If an element holds unresolved bits such as X or Z
+    """
+    first: int = min(handle._range)
+    last: int = max(handle._range)
+    if offset is None:
+        offset = first
+    count: int = last + 1 - offset if length is None else length
+    try:
+        return _read_elements(handle, count, offset)
+    except (AttributeError, TypeError):
+        return [
+            int(handle[index].value) for index in range(offset, offset + count)
+        ]
+
+
+def to_bytes(values: Sequence[int], width: int) -> bytes:
+    """Unpack element values into bytes.
+
+    Args:
+        values: The element values
+        width: The width of an element in bits
+
+    Returns:
+        The bytes of the values in little-endian order
+    """
+    size = (width + 7) // 8
+    return b"".join(value.to_bytes(size, "little") for value in values)
+
+
+def _to_words(data: bytes | bytearray | memoryview, width: int) -> list[int]:
+    """Pack bytes into element values.
+
+    Args:
+        data: The bytes
+        width: The width of an element in bits
+
+    Returns:
+        The element values, the last one padded with zeros
+    """
+    size = (width + 7) // 8
+    return [
+        int.from_bytes(data[start : start + size], "little")
+        for start in range(0, len(data), size)
+    ]
+
+
+def _load_elements(
+    handle: Any, values: Sequence[int], offset: int, width: int
+) -> None:
+    """Write array elements through their simulator handles.
+
+    Args:
+        handle: The handle of the array
+        values: The element values
+        offset: The index of the first element
+        width: The width of an element in bits
+
+    Raises:
+        IndexError: If an element is not in the array
+    """
+    element = handle._handle.get_handle_by_index
+    for index, value in enumerate(values, offset):
+        sim_handle = element(index)
+        if sim_handle is None:
+            raise IndexError(f"{handle._name} has no element {index}")
+        if width <= 32:
+            sim_handle.set_signal_val_int(0, value)
+        else:
+            sim_handle.set_signal_val_binstr(0, format(value, f"0{width}b"))
+
+
+def _read_elements(handle: Any, length: int, offset: int) -> list[int]:
+    """Read array elements through their simulator handles.
+
+    Args:
+        handle: The handle of the array
+        length: The number of elements
+        offset: The index of the first element
+
+    Returns:
+        The values of the elements
+
+    Raises:
+        IndexError: If an element is not in the array
+    """
+    element = handle._handle.get_handle_by_index
+    values = []
+    for index in range(offset, offset + length):
+        sim_handle = element(index)
+        if sim_handle is None:
+            raise IndexError(f"{handle._name} has no element {index}")
+        values.append(int(sim_handle.get_signal_val_binstr(), 2))
+    return values
@@ -0,0 +1,198 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Declarative configuration of the bus models of a testbench.
+
+All bus models of a testbench are described in one mapping or TOML file and
+built together. Settings in the ``defaults`` table apply to every bus, and
+each entry of the ``buses`` table describes one bus::
+
+    [defaults]
+    clk = "clk"
+    rst = "rst"
+    reset_active_level = 1
+
+    [buses.s_axi]
+    type = "axi_master"
+    max_burst_length = 16
+
+    [buses.m_axis]
+    type = "axis_sink"
+    prefix = "m_axis_out"
+    tdata_width_bits = 64
+    capture_mode = "count"
+
+The name of a bus is its signal prefix unless ``prefix`` is given. The bus types
+are ``axi_master``, ``axi_ram``, ``axil_master``, ``axil_ram``,
+``axis_source`` and ``axis_sink``. All other keys are passed to the
+constructor of the wrapper in :mod:`~cocotb_wrapper.axi`.
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+from collections.abc import Iterator, Mapping
+from typing import Any, Union
+
+from cocotb.handle import HierarchyObject
+from cocotb.log import SimLog
+
+from cocotb_wrapper.axi import (
+    AxiLiteMaster,
+    AxiLiteRam,
+    AxiMaster,
+    AxiRam,
+    AxiStreamCaptureMode,
+    AxiStreamSink,
+    AxiStreamSource,
+)
+from cocotb_wrapper.framing import PathLike
+
+Bus = Union[
+    AxiMaster, AxiRam, AxiLiteMaster, AxiLiteRam, AxiStreamSource, AxiStreamSink
+]
+
+BUS_TYPES: dict[str, type[Bus]] = {
+    "axi_master": AxiMaster,
+    "axi_ram": AxiRam,
+    "axil_master": AxiLiteMaster,
+    "axil_ram": AxiLiteRam,
+    "axis_source": AxiStreamSource,
+    "axis_sink": AxiStreamSink,
+}
+"""The wrapper class of each bus type."""
+
+
+class BusConfig:
+    """The bus models of a testbench built from a declarative configuration.
+
+    Register the configuration with
+    :meth:`~cocotb_wrapper.Testbench.register_buses` to set up all bus models
+    before each test, or call :meth:`setup` directly.
+    """
+
+    def __init__(self, config: Mapping[str, Any]):
+        """Initialize an instance.
+
+        Args:
+            config: The configuration with the ``defaults`` and ``buses``
+                tables
+
+        Raises:
+            ValueError: If a bus type is missing or not supported
+        """
+        defaults = dict(config.get("defaults", {}))
+        self._buses: dict[str, Bus] = {}
+        self._prefixes: dict[str, str] = {}
+        self._checked: HierarchyObject | None = None
+        self._log = SimLog("buses")
+        for name, entry in config.get("buses", {}).items():
+            options = {**defaults, **entry}
+            bus_type = options.pop("type", None)
+            if bus_type not in BUS_TYPES:
+                raise ValueError(
+                    f"Unsupported type '{bus_type}' of bus '{name}'"
+                )
+            prefix = options.pop("prefix", name)
+            if "capture_mode" in options:
+                options["capture_mode"] = AxiStreamCaptureMode[
+                    options["capture_mode"].upper()
+                ]
+            self._buses[name] = BUS_TYPES[bus_type](
+                bus_prefix=prefix, **options
+            )
+            self._prefixes[name] = prefix
+
+    @classmethod
+    def from_toml(cls, path: PathLike) -> BusConfig:
+        """Read the configuration from a TOML file.
+
+        Python versions before 3.11 require the `tomli` package.
+
+        Args:
+            path: The path to the file
+
+        Returns:
+            The bus configuration
+        """
+        try:
+            import tomllib
+        except ImportError:
+            import tomli as tomllib  # pyright: ignore[reportMissingImports]
+
+        with open(path, "rb") as f:
+            return cls(tomllib.load(f))
+
+    def __getitem__(self, name: str) -> Any:
+        return self._buses[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._buses)
+
+    def __len__(self) -> int:
+        return len(self._buses)
+
+    def setup(self, dut: HierarchyObject) -> None:
+        """Set up all bus models.
+
+        On the first call, the signals of the DUT are discovered in one pass
+        and every prefix is checked before any bus model is built. The bus
+        models look up their signals once as well and reuse them in the
+        following tests.
+
+        Args:
+            dut: The device under test
+
+        Raises:
+            AttributeError: If no signal of the DUT starts with the prefix of
+                a bus
+        """
+        if self._checked is not dut:
+            self._check_prefixes(dut)
+            self._checked = dut
+        for bus in self._buses.values():
+            bus.setup(dut)
+        self._log.debug("Set up %d buses", len(self._buses))
+
+    def _check_prefixes(self, dut: HierarchyObject) -> None:
+        """Check that the DUT has signals with the prefix of every bus.
+
+        Args:
+            dut: The device under test
+
+        Raises:
+            AttributeError: If no signal of the DUT starts with the prefix of
+                a bus
+        """
+        names = [handle._name for handle in dut]  # pyright: ignore[reportAttributeAccessIssue]
+        found = {
+            prefix
+            for prefix in set(self._prefixes.values())
+            if any(name.startswith(f"{prefix}_") for name in names)
+        }
+        missing = sorted(set(self._prefixes.values()) - found)
+        if missing:
+            raise AttributeError(
+                f"No signals with the prefixes {', '.join(missing)} found in "
+                f"{dut._name}"  # pyright: ignore[reportAttributeAccessIssue]
+            )
+
+    def enable(self) -> None:
+        """Enable all bus models."""
+        for bus in self._buses.values():
+            bus.enable()
+
+    def disable(self) -> None:
+        """Disable all bus models."""
+        for bus in self._buses.values():
+            bus.disable()
@@ -0,0 +1,516 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Collect the functional coverage of AXI buses.
+
+Coverage is counted in cover groups. A cover group crosses several coverpoints
+and holds one integer counter per combination of their bins, so sampling a
+transaction costs a single array increment at a precomputed index. The
+coverage of each coverpoint is derived from the counters when it is reported.
+
+The cover groups of a testbench are collected in a
+:class:`CoverageDatabase`, which is saved to a sparse JSON file. The files of
+parallel runs are merged with::
+
+    python -m cocotb_wrapper.coverage merged.json run1.json run2.json
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+import json
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from operator import attrgetter
+from typing import Any
+
+from cocotb.log import SimLog
+
+from cocotb_wrapper.framing import PathLike
+
+BURST_BINS = ["FIXED", "INCR", "WRAP"]
+"""The bins of the burst type."""
+LENGTH_BINS = [
+    "1",
+    "2",
+    "3-4",
+    "5-8",
+    "9-16",
+    "17-32",
+    "33-64",
+    "65-128",
+    "129-256",
+]
+"""The bins of the burst length in beats."""
+LOCK_BINS = ["NORMAL", "EXCLUSIVE"]
+"""The bins of the lock type."""
+CACHE_BINS = [f"{cache:04b}" for cache in range(16)]
+"""The bins of the cache bits."""
+PROT_BINS = [f"{prot:03b}" for prot in range(8)]
+"""The bins of the protection bits."""
+RESP_BINS = ["OKAY", "EXOKAY", "SLVERR", "DECERR"]
+"""The bins of the response."""
+BOOL_BINS = ["no", "yes"]
+"""The bins of a condition."""
+FRAME_LENGTH_BINS = (
+    ["0", "1"]
+    + [f"{1 << bit}-{(2 << bit) - 1}" for bit in range(1, 15)]
+    + ["32768+"]
+)
+"""The bins of the AXI-Stream frame length in bytes."""
+
+
+class CoverGroup:
+    """The cross of several coverpoints counted in one integer array."""
+
+    def __init__(self, name: str, coverpoints: Mapping[str, Sequence[str]]):
+        """Initialize an instance.
+
+        Args:
+            name: The name of the cover group
+            coverpoints: The bin labels of each coverpoint
+        """
+        self.name: str = name
+        self.coverpoints: dict[str, list[str]] = {
+            coverpoint: list(labels)
+            for coverpoint, labels in coverpoints.items()
+        }
+        self.strides: list[int] = []
+        """The index step of one bin of each coverpoint."""
+        size = 1
+        for labels in reversed(list(self.coverpoints.values())):
+            self.strides.insert(0, size)
+            size *= len(labels)
+        self.counts: array[int] = array("Q", bytes(8 * size))
+        """The counter of each combination of bins."""
+
+    def sample(self, *bins: int) -> None:
+        """Count a combination of bins.
+
+        Args:
+            bins: The bin index of each coverpoint
+        """
+        self.counts[sum(b * s for b, s in zip(bins, self.strides))] += 1
+
+    def bins(self, coverpoint: str) -> dict[str, int]:
+        """Get the count of each bin of a coverpoint.
+
+        Args:
+            coverpoint: The name of the coverpoint
+
+        Returns:
+            The count of each bin label
+        """
+        position = list(self.coverpoints).index(coverpoint)
+        labels = self.coverpoints[coverpoint]
+        stride = self.strides[position]
+        totals = [0] * len(labels)
+        for index, count in enumerate(self.counts):
+            if count:
+                totals[(index // stride) % len(labels)] += count
+        return dict(zip(labels, totals))
+
+    def coverage(self, coverpoints: Iterable[str] | None = None) -> float:
+        """Get the fraction of hit bins.
+
+        Args:
+            coverpoints: The coverpoints to consider. Defaults to all
+
+        Returns:
+            The number of hit bins divided by the number of bins
+        """
+        hit = total = 0
+        for coverpoint in coverpoints or self.coverpoints:
+            counts = self.bins(coverpoint).values()
+            hit += sum(1 for count in counts if count)
+            total += len(counts)
+        return hit / total if total else 1.0
+
+    def merge(self, other: CoverGroup) -> None:
+        """Add the counters of another cover group.
+
+        Args:
+            other: A cover group with the same coverpoints
+
+        Raises:
+            ValueError: If the coverpoints differ
+        """
+        if other.coverpoints != self.coverpoints:
+            raise ValueError(f"The coverpoints of '{self.name}' differ")
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+
+
+class CoverageDatabase:
+    """The cover groups of a testbench."""
+
+    def __init__(self) -> None:
+        """Initialize an instance."""
+        self.groups: dict[str, CoverGroup] = {}
+        self._log = SimLog("coverage")
+
+    def group(
+        self, name: str, coverpoints: Mapping[str, Sequence[str]]
+    ) -> CoverGroup:
+        """Get a cover group, creating it if necessary.
+
+        Args:
+            name: The name of the cover group
+            coverpoints: The bin labels of each coverpoint
+
+        Returns:
+            The cover group
+
+        Raises:
+            ValueError: If a group of that name has different coverpoints
+        """
+        group = self.groups.get(name)
+        if group is None:
+            group = self.groups[name] = CoverGroup(name, coverpoints)
+        elif group.coverpoints != {k: list(v) for k, v in coverpoints.items()}:
+            raise ValueError(f"The coverpoints of '{name}' differ")
+        return group
+
+    def coverage(self) -> float:
+        """Get the fraction of hit bins over all cover groups.
+
+        Returns:
+            The number of hit bins divided by the number of bins
+        """
+        hit = total = 0
+        for group in self.groups.values():
+            for coverpoint in group.coverpoints:
+                counts = group.bins(coverpoint).values()
+                hit += sum(1 for count in counts if count)
+                total += len(counts)
+        return hit / total if total else 1.0
+
+    def merge(self, other: CoverageDatabase) -> None:
+        """Add the counters of another database.
+
+        Args:
+            other: The other database
+        """
+        for name, group in other.groups.items():
+            self.group(name, group.coverpoints).merge(group)
+
+    def save(self, path: PathLike) -> None:
+        """Write the database to a file.
+
+        Only the counters that are not zero are written.
+
+        Args:
+            path: The path to the file
+        """
+        data = {
+            name: {
+                "coverpoints": group.coverpoints,
+                "counts": {
+                    str(index): count
+                    for index, count in enumerate(group.counts)
+                    if count
+                },
+            }
+            for name, group in self.groups.items()
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: PathLike) -> CoverageDatabase:
+        """Read a database from a file.
+
+        Args:
+            path: The path to the file
+
+        Returns:
+            The database
+        """
+        with open(path) as f:
+            data = json.load(f)
+        database = cls()
+        for name, entry in data.items():
+            group = database.group(name, entry["coverpoints"])
+            for index, count in entry["counts"].items():
+                group.counts[int(index)] = count
+        return database
+
+    def report(self) -> None:
+        """Log the coverage of each coverpoint and its missed bins."""
+        for group in self.groups.values():
+            for coverpoint in group.coverpoints:
+                bins = group.bins(coverpoint)
+                missed = [label for label, count in bins.items() if not count]
+                self._log.info(
+                    "%s.%s: %d/%d bins%s",
+                    group.name,
+                    coverpoint,
+                    len(bins) - len(missed),
+                    len(bins),
+                    f", missed {', '.join(missed)}" if missed else "",
+                )
+        self._log.info("Total coverage: %.1f%%", 100 * self.coverage())
+
+
+def attach_axi(database: CoverageDatabase, name: str, model: Any) -> None:
+    """Collect the coverage of a cocotbext AXI master or slave.
+
+    The address channels are sampled into the groups ``<name>.aw`` and
+    ``<name>.ar``, which cross the burst type, size, length, lock, unaligned
+    starts and 4 KiB crossings, and ``<name>.aw_attr`` and ``<name>.ar_attr``,
+    which cross the cache and protection bits. The responses are sampled into
+    ``<name>.b`` and ``<name>.r``.
+
+    Args:
+        database: The coverage database
+        name: The prefix of the cover group names
+        model: The cocotbext model with `write_if` and `read_if`
+    """
+    lanes = model.write_if.byte_lanes
+    address_coverpoints = {
+        "burst": BURST_BINS,
+        "size": [str(1 << size) for size in range(lanes.bit_length())],
+        "length": LENGTH_BINS,
+        "lock": LOCK_BINS,
+        "unaligned": BOOL_BINS,
+        "crosses_4k": BOOL_BINS,
+    }
+    attribute_coverpoints = {"cache": CACHE_BINS, "prot": PROT_BINS}
+    for interface, prefix, resp in (
+        (model.write_if, "aw", "b"),
+        (model.read_if, "ar", "r"),
+    ):
+        _tap(
+            getattr(interface, f"{prefix}_channel"),
+            _axi_address_sampler(
+                database.group(f"{name}.{prefix}", address_coverpoints),
+                database.group(f"{name}.{prefix}_attr", attribute_coverpoints),
+                prefix,
+            ),
+        )
+        _tap(
+            getattr(interface, f"{resp}_channel"),
+            _response_sampler(
+                database.group(f"{name}.{resp}", {"resp": RESP_BINS}), resp
+            ),
+        )
+
+
+def attach_axil(database: CoverageDatabase, name: str, model: Any) -> None:
+    """Collect the coverage of a cocotbext AXI-Lite master or slave.
+
+    The address channels are sampled into the groups ``<name>.aw`` and
+    ``<name>.ar``, which cross the protection bits and unaligned addresses,
+    and the responses into ``<name>.b`` and ``<name>.r``.
+
+    Args:
+        database: The coverage database
+        name: The prefix of the cover group names
+        model: The cocotbext model with `write_if` and `read_if`
+    """
+    mask = model.write_if.byte_lanes - 1
+    for interface, prefix, resp in (
+        (model.write_if, "aw", "b"),
+        (model.read_if, "ar", "r"),
+    ):
+        group = database.group(
+            f"{name}.{prefix}", {"prot": PROT_BINS, "unaligned": BOOL_BINS}
+        )
+        _tap(
+            getattr(interface, f"{prefix}_channel"),
+            _axil_address_sampler(group, prefix, mask),
+        )
+        _tap(
+            getattr(interface, f"{resp}_channel"),
+            _response_sampler(
+                database.group(f"{name}.{resp}", {"resp": RESP_BINS}), resp
+            ),
+        )
+
+
+def frame_sampler(
+    database: CoverageDatabase, name: str, byte_lanes: int
+) -> Callable[[bytes | bytearray], None]:
+    """Create a sampler of AXI-Stream frames.
+
+    The frames are sampled into the group ``<name>.frames``, which crosses the
+    frame length and whether the last beat is partial.
+
+    Args:
+        database: The coverage database
+        name: The prefix of the cover group name
+        byte_lanes: The number of bytes per beat
+
+    Returns:
+        A function that samples the data of a frame
+    """
+    group = database.group(
+        f"{name}.frames",
+        {"length": FRAME_LENGTH_BINS, "partial_last": BOOL_BINS},
+    )
+    counts = group.counts
+    last_bin = len(FRAME_LENGTH_BINS) - 1
+
+    def sample(data: bytes | bytearray) -> None:
+        length = len(data)
+        counts[
+            min(length.bit_length(), last_bin) * 2 + bool(length % byte_lanes)
+        ] += 1
+
+    return sample
+
+
+def _tap(channel: Any, callback: Callable[[Any], None]) -> None:
+    """Pass every transaction of a cocotbext channel to a callback.
+
+    Both sources and sinks put each transaction into their queue, so the
+    callback sees the transactions sent by the model as well as the received
+    ones.
+
+    Args:
+        channel: The cocotbext channel or stream model with a `queue`
+        callback: The function called with each transaction
+    """
+    queue = channel.queue
+    put_nowait = queue.put_nowait
+
+    def _put_nowait(item: object) -> None:
+        callback(item)
+        put_nowait(item)
+
+    queue.put_nowait = _put_nowait
+
+
+def _axi_address_sampler(
+    address: CoverGroup, attributes: CoverGroup, prefix: str
+) -> Callable[[Any], None]:
+    """Create a sampler of AXI address transactions.
+
+    Args:
+        address: The cover group of the burst
+        attributes: The cover group of the cache and protection bits
+        prefix: ``'aw'`` or ``'ar'``
+
+    Returns:
+        A function that samples an address transaction
+    """
+    fields = attrgetter(
+        *(
+            f"{prefix}{field}"
+            for field in (
+                "burst",
+                "size",
+                "len",
+                "lock",
+                "addr",
+                "cache",
+                "prot",
+            )
+        )
+    )
+    counts = address.counts
+    s_burst, s_size, s_length, s_lock, s_unaligned, _ = address.strides
+    max_size = len(address.coverpoints["size"]) - 1
+    attribute_counts = attributes.counts
+
+    def sample(transaction: object) -> None:
+        burst, size, length, lock, addr, cache, prot = map(
+            int, fields(transaction)
+        )
+        if burst > 2:
+            return
+        start = addr & 0xFFF & -(1 << size)
+        crosses = burst == 1 and start + ((length + 1) << size) > 0x1000
+        counts[
+            burst * s_burst
+            + min(size, max_size) * s_size
+            + min(length, 255).bit_length() * s_length
+            + (lock & 1) * s_lock
+            + bool(addr & ((1 << size) - 1)) * s_unaligned
+            + crosses
+        ] += 1
+        attribute_counts[(cache & 15) * 8 + (prot & 7)] += 1
+
+    return sample
+
+
+def _axil_address_sampler(
+    group: CoverGroup, prefix: str, mask: int
+) -> Callable[[Any], None]:
+    """Create a sampler of AXI-Lite address transactions.
+
+    Args:
+        group: The cover group of the address
+        prefix: ``'aw'`` or ``'ar'``
+        mask: The address bits below the bus width
+
+    Returns:
+        A function that samples an address transaction
+    """
+    fields = attrgetter(f"{prefix}addr", f"{prefix}prot")
+    counts = group.counts
+
+    def sample(transaction: object) -> None:
+        addr, prot = fields(transaction)
+        counts[(int(prot) & 7) * 2 + bool(int(addr) & mask)] += 1
+
+    return sample
+
+
+def _response_sampler(group: CoverGroup, prefix: str) -> Callable[[Any], None]:
+    """Create a sampler of AXI responses.
+
+    AXI read responses are only sampled on the last beat of a burst.
+
+    Args:
+        group: The cover group of the response
+        prefix: ``'b'`` or ``'r'``
+
+    Returns:
+        A function that samples a response transaction
+    """
+    counts = group.counts
+    resp = attrgetter(f"{prefix}resp")
+
+    def sample(transaction: object) -> None:
+        if int(getattr(transaction, "rlast", 1)):
+            counts[int(resp(transaction)) & 3] += 1
+
+    return sample
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Merge coverage files.
+
+    Args:
+        argv: The output path followed by the input paths
+
+    Returns:
+        The exit code
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) < 2:
+        print("usage: python -m cocotb_wrapper.coverage OUTPUT INPUT...")
+        return 2
+    database = CoverageDatabase()
+    for path in args[1:]:
+        database.merge(CoverageDatabase.load(path))
+    database.save(args[0])
+    print(f"Merged {len(args) - 1} files, coverage {database.coverage():.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Read and write frames from and to files.
+
+The following framings are supported:
+
+``'pcap'``
+    A packet capture in the libpcap format. Both microsecond and nanosecond
+    resolution files in either byte order are read. Written files use
+    nanosecond resolution.
+``'length'``
+    Each frame is preceded by its length as a 32-bit big-endian integer.
+``'fixed'``
+    Raw data split into frames of a fixed size. The last frame may be shorter.
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+import atexit
+import os
+import struct
+import threading
+import weakref
+from collections.abc import Iterator
+from queue import SimpleQueue
+from typing import BinaryIO, Union
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+_PCAP_MAGIC_US = 0xA1B2C3D4
+_PCAP_MAGIC_NS = 0xA1B23C4D
+_PCAP_HEADER = struct.Struct("<IHHiIII")
+_PCAP_RECORD = struct.Struct("<IIII")
+_LENGTH = struct.Struct(">I")
+
+_open_writers: weakref.WeakSet[FrameWriter] = weakref.WeakSet()
+
+
+def read_frames(
+    path: PathLike, framing: str = "pcap", frame_size: int = 0
+) -> Iterator[bytes]:
+    """Read frames lazily from a file.
+
+    Only one frame is held in memory at a time, so arbitrarily large files can
+    be read.
+
+    Args:
+        path: The path to the file
+        framing: The framing of the file, one of ``'pcap'``, ``'length'`` and
+            ``'fixed'``
+        frame_size: The frame size in bytes of the ``'fixed'`` framing
+
+    Returns:
+        An iterator over the data of each frame
+
+    Raises:
+        ValueError: If the framing is not supported
+    """
+    if framing not in ("pcap", "length", "fixed"):
+        raise ValueError(f"Unsupported framing '{framing}'")
+    if framing == "fixed" and frame_size <= 0:
+        raise ValueError("The 'fixed' framing requires a positive frame size")
+    return _read_file(path, framing, frame_size)
+
+
+def _read_file(
+    path: PathLike, framing: str, frame_size: int
+) -> Iterator[bytes]:
+    """Read the frames of a file.
+
+    Args:
+        path: The path to the file
+        framing: The framing of the file
+        frame_size: The frame size in bytes of the ``'fixed'`` framing
+
+    Yields:
+        The data of each frame
+    """
+    with open(path, "rb") as f:
+        if framing == "pcap":
+            yield from _read_pcap(f)
+        elif framing == "length":
+            yield from _read_length_prefixed(f)
+        else:
+            yield from iter(lambda: f.read(frame_size), b"")
+
+
+def _read_exactly(f: BinaryIO, size: int, may_end: bool = True) -> bytes:
+    """Read exactly `size` bytes from a file.
+
+    Args:
+        f: The file
+        size: The number of bytes
+        may_end: Whether the file may end before the data
+
+    Returns:
+        The data, which is empty at the end of the file
+
+    Raises:
+        ValueError: If the file ends within the data, or before it if
+            `may_end` is False
+    """
+    data = f.read(size)
+    if len(data) != size and (data or not may_end):
+        raise ValueError(f"Truncated file '{f.name}'")
+    return data
+
+
+def _read_pcap(f: BinaryIO) -> Iterator[bytes]:
+    """Read the packets of a libpcap file.
+
+    Args:
+        f: The file
+
+    Yields:
+        The data of each packet
+
+    Raises:
+        ValueError: If the file is not a libpcap file or is truncated
+    """
+    header = _read_exactly(f, _PCAP_HEADER.size, False)
+    for byteorder in ("<", ">"):
+        (magic,) = struct.unpack_from(f"{byteorder}I", header)
+        if magic in (_PCAP_MAGIC_US, _PCAP_MAGIC_NS):
+            break
+    else:
+        raise ValueError(f"'{f.name}' is not a pcap file")
+    record = struct.Struct(f"{byteorder}IIII")
+    while True:
+        data = _read_exactly(f, record.size)
+        if not data:
+            return
+        _, _, length, _ = record.unpack(data)
+        yield _read_exactly(f, length, False)
+
+
+def _read_length_prefixed(f: BinaryIO) -> Iterator[bytes]:
+    """Read the frames of a length-prefixed file.
+
+    Args:
+        f: The file
+
+    Yields:
+        The data of each frame
+
+    Raises:
+        ValueError: If the file is truncated
+    """
+    while True:
+        data = _read_exactly(f, _LENGTH.size)
+        if not data:
+            return
+        (length,) = _LENGTH.unpack(data)
+        yield _read_exactly(f, length, False)
+
+
+class FrameWriter:
+    """Write frames to a file in a background thread.
+
+    Frames are collected into chunks of `buffer_size` bytes, which are written
+    by a background thread, so the simulation does not wait for the disk. The
+    buffered frames are only written by :meth:`close`. Writers still open when
+    the simulator exits are closed then, if its Python interpreter exits
+    normally.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        framing: str = "pcap",
+        linktype: int = 1,
+        buffer_size: int = 1 << 20,
+    ):
+        """Initialize an instance.
+
+        Args:
+            path: The path to the file
+            framing: The framing of the file, one of ``'pcap'``, ``'length'``
+                and ``'fixed'``
+            linktype: The link-layer header type of the ``'pcap'`` framing.
+                Defaults to Ethernet
+            buffer_size: The number of bytes passed to the writer thread at
+                once
+
+        Raises:
+            ValueError: If the framing is not supported
+        """
+        if framing not in ("pcap", "length", "fixed"):
+            raise ValueError(f"Unsupported framing '{framing}'")
+        self._framing: str = framing
+        self._buffer_size: int = buffer_size
+        self._buffer: bytearray = bytearray()
+        self._chunks: SimpleQueue[bytes | None] = SimpleQueue()
+        self._file: BinaryIO = open(path, "wb")  # noqa: SIM115
+        if framing == "pcap":
+            self._buffer += _PCAP_HEADER.pack(
+                _PCAP_MAGIC_NS, 2, 4, 0, 0, 0xFFFF_FFFF, linktype
+            )
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        _open_writers.add(self)
+
+    def __enter__(self) -> FrameWriter:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def write(self, data: bytes | bytearray, timestamp_ns: int = 0) -> None:
+        """Write a frame.
+
+        Args:
+            data: The frame data
+            timestamp_ns: The timestamp of the ``'pcap'`` framing in
+                nanoseconds
+        """
+        if self._framing == "pcap":
+            self._buffer += _PCAP_RECORD.pack(
+                timestamp_ns // 1_000_000_000,
+                timestamp_ns % 1_000_000_000,
+                len(data),
+                len(data),
+            )
+        elif self._framing == "length":
+            self._buffer += _LENGTH.pack(len(data))
+        self._buffer += data
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Pass the buffered frames to the writer thread."""
+        if self._buffer:
+            self._chunks.put(bytes(self._buffer))
+            self._buffer.clear()
+
+    def close(self) -> None:
+        """Write all buffered frames and close the file."""
+        if self._file.closed:
+            return
+        _open_writers.discard(self)
+        self.flush()
+        self._chunks.put(None)
+        self._thread.join()
+        self._file.close()
+
+    def _run(self) -> None:
+        """Write the chunks to the file until the writer is closed."""
+        for chunk in iter(self._chunks.get, None):
+            self._file.write(chunk)
+
+
+@atexit.register
+def _close_writers() -> None:
+    """Close the writers left open at exit."""
+    for writer in list(_open_writers):
+        writer.close()
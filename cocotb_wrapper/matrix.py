@@ -0,0 +1,196 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Expand parameter sweeps into test cases.
+
+The cases of a matrix are ordered in a reflected Gray code, so consecutive
+cases differ in a single parameter. The parameters that need an expensive
+reconfiguration of the DUT are the most significant digits and change the
+least often. The cases sharing the values of those parameters form a group,
+whose cases run one after the other.
+
+The cases of a regression are split into shards with the
+:envvar:`COCOTB_WRAPPER_SHARD` environment variable, e.g.
+``COCOTB_WRAPPER_SHARD=2/4`` runs the third of four shards. Groups larger than
+a shard's share are split into contiguous chunks, which costs one more
+reconfiguration per chunk. Only the cases of matrices are sharded, the tests
+registered one by one run in every shard.
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+import os
+import re
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+SHARD_ENV = "COCOTB_WRAPPER_SHARD"
+"""The environment variable selecting a shard as ``<index>/<count>``."""
+
+_UNSAFE = re.compile(r"\W+")
+
+
+def expand(
+    params: Mapping[str, Iterable[Any]], reconfigure: Sequence[str] = ()
+) -> list[dict[str, Any]]:
+    """Expand the cross product of parameters into cases.
+
+    Args:
+        params: The values of each parameter
+        reconfigure: The parameters that need an expensive reconfiguration,
+            the most expensive first
+
+    Returns:
+        The cases, ordered such that consecutive cases differ in one parameter
+
+    Raises:
+        ValueError: If a parameter to reconfigure is not in `params`
+    """
+    unknown = set(reconfigure) - set(params)
+    if unknown:
+        raise ValueError(
+            f"Unknown parameters to reconfigure: {sorted(unknown)}"
+        )
+    keys = [*reconfigure, *(key for key in params if key not in reconfigure)]
+    return [
+        {key: values[keys.index(key)] for key in params}
+        for values in _gray([list(params[key]) for key in keys])
+    ]
+
+
+def case_name(
+    name: str,
+    case: Mapping[str, Any],
+    params: Mapping[str, Sequence[Any]],
+    ids: Mapping[str, Sequence[str]] | None = None,
+) -> str:
+    """Get the test name of a case.
+
+    Strings, numbers and booleans name themselves. Other values, such as
+    backpressure generators, are named by their index in `params`, since
+    their text changes from run to run.
+
+    Args:
+        name: The name of the test function
+        case: The parameter values of the case
+        params: The values of each parameter
+        ids: The names of the values of some parameters, in the order of
+            `params`
+
+    Returns:
+        The name followed by the parameter names and values, e.g.
+        ``test_frames__size_64__width_32``
+    """
+    labels = []
+    for key, value in case.items():
+        if ids is not None and key in ids:
+            label = str(ids[key][_index(params[key], value)])
+        elif isinstance(value, (str, int, float, bool)):
+            label = str(value)
+        else:
+            label = str(_index(params[key], value))
+        labels.append(f"{key}_{_UNSAFE.sub('_', label).strip('_')}")
+    return "__".join([name, *labels])
+
+
+def shard() -> tuple[int, int]:
+    """Get the shard of the run.
+
+    Returns:
+        The index and the count of shards given by
+        :envvar:`COCOTB_WRAPPER_SHARD`, ``(0, 1)`` if not set
+
+    Raises:
+        ValueError: If the variable is not of the form ``<index>/<count>``
+            with an index below the count
+    """
+    value = os.environ.get(SHARD_ENV)
+    if not value:
+        return 0, 1
+    index, _, count = value.partition("/")
+    if not (index.isdigit() and count.isdigit() and int(index) < int(count)):
+        raise ValueError(
+            f"Invalid {SHARD_ENV} {value!r}, expected <index>/<count>"
+        )
+    return int(index), int(count)
+
+
+def assign_shards(groups: Sequence[int], count: int) -> list[int]:
+    """Distribute the cases evenly to shards.
+
+    The runs of cases of the same group are split into nearly equal chunks of
+    at most a shard's share of the cases. The largest chunks are assigned
+    first, each to the shard with the fewest cases so far. The assignment only
+    depends on the groups, so every shard of a regression computes the same
+    one.
+
+    Args:
+        groups: The group of each case, with the cases of a group adjacent
+        count: The number of shards
+
+    Returns:
+        The shard of each case
+    """
+    share = max(1, -(-len(groups) // count))
+    chunks: list[tuple[int, int]] = []
+    start = 0
+    for stop in range(1, len(groups) + 1):
+        if stop < len(groups) and groups[stop] == groups[start]:
+            continue
+        size = stop - start
+        parts = -(-size // share)
+        chunks.extend(
+            (start + size * part // parts, start + size * (part + 1) // parts)
+            for part in range(parts)
+        )
+        start = stop
+    loads = [0] * count
+    shards = [0] * len(groups)
+    for first, last in sorted(chunks, key=lambda chunk: chunk[0] - chunk[1]):
+        target = loads.index(min(loads))
+        loads[target] += last - first
+        shards[first:last] = [target] * (last - first)
+    return shards
+
+
+def _index(values: Sequence[Any], value: Any) -> int:
+    """Find a value by identity.
+
+    Args:
+        values: The values of a parameter
+        value: One of the values
+
+    Returns:
+        The index of the value
+    """
+    return next(index for index, item in enumerate(values) if item is value)
+
+
+def _gray(values: list[list[Any]]) -> Iterator[tuple[Any, ...]]:
+    """Enumerate a cross product in a reflected mixed-radix Gray code.
+
+    Args:
+        values: The values of each digit, the most significant first
+
+    Yields:
+        The combinations of values, each differing from the previous one in a
+        single digit
+    """
+    if not values:
+        yield ()
+        return
+    rest = list(_gray(values[1:]))
+    for index, value in enumerate(values[0]):
+        for tail in rest if index % 2 == 0 else reversed(rest):
+            yield (value, *tail)
@@ -0,0 +1,193 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Track the memory each test leaves behind.
+
+The tracker takes the resident set size (RSS) of the simulator process and a
+:mod:`tracemalloc` snapshot before and after a test, after a garbage
+collection. The allocation sites that grew the most are logged, and a warning
+is logged if the test left more than a threshold of memory behind. The numbers
+of every test are appended to a JSON lines file, which survives a regression
+that runs out of memory.
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+from cocotb.log import SimLog
+
+MEMORY_ENV = "COCOTB_WRAPPER_MEMORY"
+"""The environment variable enabling the tracker for all tests.
+
+Holds the threshold in MiB, or any other non-empty value for the default one.
+"""
+MEMORY_FILE_ENV = "COCOTB_WRAPPER_MEMORY_FILE"
+"""The environment variable holding the path of the memory file."""
+MEMORY_FILE = "memory.jsonl"
+"""The default memory file, relative to the simulator."""
+
+_MIB = 2**20
+_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+_started: set[str] = set()
+
+
+def rss() -> int:
+    """Get the resident set size of the process.
+
+    Returns:
+        The current RSS in bytes, or the peak RSS where the current one is not
+        available
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def memory_path() -> str:
+    """Get the path of the memory file.
+
+    Returns:
+        The path given by :envvar:`COCOTB_WRAPPER_MEMORY_FILE`, which defaults
+        to ``memory.jsonl`` in the working directory of the simulator
+    """
+    return os.environ.get(MEMORY_FILE_ENV, MEMORY_FILE)
+
+
+class MemoryTracker:
+    """A tracker of the memory left behind by a test."""
+
+    def __init__(self, name: str, threshold: int = 16 * _MIB, top: int = 10):
+        """Initialize an instance.
+
+        Args:
+            name: The test name
+            threshold: The growth in bytes above which a warning is logged
+            top: The number of allocation sites logged
+        """
+        self.name: str = name
+        """The test name."""
+        self.threshold: int = threshold
+        """The growth in bytes above which a warning is logged."""
+        self.top: int = top
+        """The number of allocation sites logged."""
+        self.rss_before: int = 0
+        """The RSS in bytes before the test."""
+        self.rss_after: int = 0
+        """The RSS in bytes after the test."""
+        self.traced_growth: int = 0
+        """The growth of the memory allocated by Python in bytes."""
+        self.sites: list[tracemalloc.StatisticDiff] = []
+        """The allocation sites sorted by descending growth."""
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._log = SimLog(f"memory.{name}")
+
+    @property
+    def rss_growth(self) -> int:
+        """The growth of the RSS in bytes.
+
+        Returns:
+            The RSS after minus the RSS before the test
+        """
+        return self.rss_after - self.rss_before
+
+    def start(self) -> None:
+        """Take the measurements before the test.
+
+        Tracing Python allocations starts with the first tracker and goes on
+        for the rest of the process, so the frames of later tests are traced
+        from their start.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        gc.collect()
+        self._snapshot = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+        self.rss_before = rss()
+
+    def stop(self) -> None:
+        """Take the measurements after the test and report them."""
+        gc.collect()
+        self.rss_after = rss()
+        if self._snapshot is not None:
+            snapshot = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+            self.sites = snapshot.compare_to(self._snapshot, "lineno")
+            self.traced_growth = sum(site.size_diff for site in self.sites)
+            self._snapshot = None
+        self.report()
+        self.record()
+
+    def report(self) -> None:
+        """Log the memory growth and the allocation sites that grew the most."""
+        self._log.info(
+            "RSS %.1f MiB (%+.1f MiB), Python allocations %+.1f MiB",
+            self.rss_after / _MIB,
+            self.rss_growth / _MIB,
+            self.traced_growth / _MIB,
+        )
+        for site in self.sites[: self.top]:
+            if site.size_diff <= 0:
+                break
+            self._log.info(
+                "%+10.1f KiB %+8d blocks  %s",
+                site.size_diff / 1024,
+                site.count_diff,
+                site.traceback,
+            )
+        leaked = max(self.rss_growth, self.traced_growth)
+        if leaked > self.threshold:
+            self._log.warning(
+                "%s left %.1f MiB behind, more than %.1f MiB",
+                self.name,
+                leaked / _MIB,
+                self.threshold / _MIB,
+            )
+
+    def record(self) -> None:
+        """Append the measurements to the memory file.
+
+        The file is overwritten by the first test of each run.
+        """
+        path = memory_path()
+        mode = "a" if path in _started else "w"
+        _started.add(path)
+        with open(path, mode) as f:
+            f.write(
+                json.dumps(
+                    {
+                        "test": self.name,
+                        "rss_before": self.rss_before,
+                        "rss_after": self.rss_after,
+                        "traced_growth": self.traced_growth,
+                        "sites": [
+                            [str(site.traceback), site.size_diff]
+                            for site in self.sites[: self.top]
+                        ],
+                    }
+                )
+                + "\n"
+            )
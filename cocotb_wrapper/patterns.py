@@ -0,0 +1,516 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Generators and verifiers of structured payload patterns.
+
+Each pattern generator comes with a verifier that checks received data without
+keeping the expected payloads. The verifiers follow the pattern across calls,
+so a stream can be checked frame by frame. They count the erroneous bits and
+report the bit offset of the first error within the checked stream.
+
+Like the random payload generators in :mod:`~cocotb_wrapper.axi`, every value
+is encoded as big-endian bytes of the value width rounded up to whole bytes.
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+from cocotb_wrapper.axi import bits_to_bytes
+
+PRBS_POLYNOMIALS: dict[int, tuple[int, int]] = {
+    7: (7, 6),
+    15: (15, 14),
+    23: (23, 18),
+    31: (31, 28),
+}
+"""The exponents of the ITU-T O.150 PRBS polynomials :math:`x^n + x^m + 1`."""
+
+
+def _popcount(value: int) -> int:
+    """Count the set bits of an integer.
+
+    Args:
+        value: A non-negative integer
+
+    Returns:
+        The number of set bits
+    """
+    return bin(value).count("1")
+
+
+def _prbs_extend(state: int, n: int, m: int, length: int) -> int:
+    """Continue a PRBS sequence.
+
+    The sequence satisfies ``s[i] = s[i - n] ^ s[i - m]``. Squaring the
+    polynomial shows that ``s[i] = s[i - k * n] ^ s[i - k * m]`` holds for any
+    power of two ``k``, so the number of bits produced per step doubles as the
+    sequence grows.
+
+    Args:
+        state: The last `n` bits of the sequence, the oldest bit first
+        n: The degree of the polynomial
+        m: The exponent of the middle term of the polynomial
+        length: The number of bits to produce
+
+    Returns:
+        The next `length` bits, the oldest bit first
+    """
+    seq = state
+    total = n
+    target = n + length
+    lag_n, lag_m = n, m
+    while total < target:
+        while 2 * lag_n <= total:
+            lag_n *= 2
+            lag_m *= 2
+        k = min(lag_m, target - total)
+        block = ((seq >> (lag_n - k)) ^ (seq >> (lag_m - k))) & ((1 << k) - 1)
+        seq = (seq << k) | block
+        total += k
+    return seq & ((1 << length) - 1)
+
+
+class _PatternVerifier:
+    """The base of the pattern verifiers."""
+
+    def __init__(self) -> None:
+        """Initialize an instance."""
+        self.bits_checked: int = 0
+        """The number of checked bits."""
+        self.bit_errors: int = 0
+        """The number of erroneous bits."""
+        self.first_error: int | None = None
+        """The bit offset of the first error within the checked stream."""
+
+    def _record(self, errors: int, offset: int) -> None:
+        """Record errors found in the checked data.
+
+        Args:
+            errors: The number of erroneous bits
+            offset: The bit offset of the first error within the checked data
+        """
+        if errors:
+            self.bit_errors += errors
+            if self.first_error is None:
+                self.first_error = self.bits_checked + offset
+
+
+class PrbsPayloadGenerator:
+    """A generator of pseudo-random binary sequence payloads.
+
+    The sequence is produced by the ITU-T O.150 polynomials and packed into the
+    payload bytes most significant bit first.
+    """
+
+    def __init__(
+        self,
+        frame_length: int,
+        data_width_bits: int,
+        order: int = 31,
+        seed: int | None = None,
+    ):
+        """Initialize an instance.
+
+        Args:
+            frame_length: The length of the frame
+            data_width_bits: The width of each value in bits, a multiple of 8
+            order: The order of the PRBS, one of 7, 15, 23 and 31
+            seed: The initial state of the shift register. Defaults to all
+                ones
+
+        Raises:
+            ValueError: If the order is not supported, the width is not a
+                multiple of 8 or the seed is zero
+        """
+        if order not in PRBS_POLYNOMIALS:
+            raise ValueError(f"Unsupported PRBS order {order}")
+        if data_width_bits % 8:
+            raise ValueError("The data width must be a multiple of 8")
+        self._n, self._m = PRBS_POLYNOMIALS[order]
+        if seed is None:
+            seed = (1 << self._n) - 1
+        self._state: int = seed & ((1 << self._n) - 1)
+        if not self._state:
+            raise ValueError("The seed must not be zero")
+        self._payload_bits: int = frame_length * data_width_bits
+
+    def get_payload(self) -> bytes:
+        """Get the next part of the sequence.
+
+        Returns:
+            The payload
+        """
+        bits = _prbs_extend(self._state, self._n, self._m, self._payload_bits)
+        self._state = bits & ((1 << self._n) - 1)
+        return bits.to_bytes(self._payload_bits // 8, byteorder="big")
+
+    def get_payloads(self, count: int) -> list[bytes]:
+        """Get the next payloads of the sequence.
+
+        Args:
+            count: The number of payloads
+
+        Returns:
+            The payloads
+        """
+        return [self.get_payload() for _ in range(count)]
+
+
+class PrbsPayloadVerifier(_PatternVerifier):
+    """A verifier of pseudo-random binary sequence payloads.
+
+    The verifier is self-synchronizing: it checks that every bit equals the
+    XOR of the two bits selected by the polynomial, using only the received
+    data. The first `order` bits of the stream synchronize the verifier and are
+    not checked. As in hardware PRBS checkers, a single flipped bit violates
+    the recurrence up to three times and is counted as such.
+    """
+
+    def __init__(self, order: int = 31):
+        """Initialize an instance.
+
+        Args:
+            order: The order of the PRBS, one of 7, 15, 23 and 31
+
+        Raises:
+            ValueError: If the order is not supported
+        """
+        if order not in PRBS_POLYNOMIALS:
+            raise ValueError(f"Unsupported PRBS order {order}")
+        super().__init__()
+        self._n, self._m = PRBS_POLYNOMIALS[order]
+        self._tail: int = 0
+        self._tail_bits: int = 0
+
+    def check(self, data: bytes | bytearray) -> bool:
+        """Check the next part of the sequence.
+
+        Args:
+            data: The received data
+
+        Returns:
+            True if no error was found in the data
+        """
+        length = 8 * len(data)
+        seq = (self._tail << length) | int.from_bytes(data, byteorder="big")
+        total = self._tail_bits + length
+        checked = max(0, min(length, total - self._n))
+        errors = (seq ^ (seq >> self._n) ^ (seq >> self._m)) & (
+            (1 << checked) - 1
+        )
+        self._record(_popcount(errors), length - errors.bit_length())
+        self._tail = seq & ((1 << self._n) - 1)
+        self._tail_bits = min(self._n, total)
+        self.bits_checked += length
+        return not errors
+
+
+class CounterPayloadGenerator:
+    """A generator of incrementing counter payloads.
+
+    Each value is split into lanes, which hold consecutive counter values. The
+    counter wraps around at the lane width.
+    """
+
+    def __init__(
+        self,
+        frame_length: int,
+        data_width_bits: int,
+        lane_bits: int | None = None,
+        start: int = 0,
+        step: int = 1,
+        lane_order: str = "msb",
+    ):
+        """Initialize an instance.
+
+        Args:
+            frame_length: The length of the frame
+            data_width_bits: The width of each value in bits
+            lane_bits: The width of each lane in bits. Defaults to the value
+                width
+            start: The first counter value
+            step: The increment between two lanes
+            lane_order: Whether the first lane is in the most (``'msb'``) or
+                least (``'lsb'``) significant bits of the value
+
+        Raises:
+            ValueError: If the lanes don't divide the value or the lane order
+                is not supported
+        """
+        self._frame_length: int = frame_length
+        self._layout = _CounterLayout(
+            data_width_bits, lane_bits, start, step, lane_order
+        )
+
+    def get_payload(self) -> bytes:
+        """Get the next counter values.
+
+        Returns:
+            The payload
+        """
+        return self._layout.next_words(self._frame_length)
+
+    def get_payloads(self, count: int) -> list[bytes]:
+        """Get the next payloads.
+
+        Args:
+            count: The number of payloads
+
+        Returns:
+            The payloads
+        """
+        return [self.get_payload() for _ in range(count)]
+
+
+class CounterPayloadVerifier(_PatternVerifier):
+    """A verifier of incrementing counter payloads.
+
+    The expected counter values are computed value by value while comparing,
+    so no expected payload is built.
+    """
+
+    def __init__(
+        self,
+        data_width_bits: int,
+        lane_bits: int | None = None,
+        start: int = 0,
+        step: int = 1,
+        lane_order: str = "msb",
+    ):
+        """Initialize an instance.
+
+        Args:
+            data_width_bits: The width of each value in bits
+            lane_bits: The width of each lane in bits. Defaults to the value
+                width
+            start: The first counter value
+            step: The increment between two lanes
+            lane_order: Whether the first lane is in the most (``'msb'``) or
+                least (``'lsb'``) significant bits of the value
+
+        Raises:
+            ValueError: If the lanes don't divide the value or the lane order
+                is not supported
+        """
+        super().__init__()
+        self._layout = _CounterLayout(
+            data_width_bits, lane_bits, start, step, lane_order
+        )
+
+    def check(self, data: bytes | bytearray) -> bool:
+        """Check the next counter values.
+
+        Args:
+            data: The received data, a whole number of values
+
+        Returns:
+            True if no error was found in the data
+
+        Raises:
+            ValueError: If the data does not hold a whole number of values
+        """
+        size = self._layout.word_bytes
+        if len(data) % size:
+            raise ValueError(f"The data size must be a multiple of {size}")
+        errors = 0
+        first = None
+        for offset in range(0, len(data), size):
+            word = int.from_bytes(data[offset : offset + size], "big")
+            diff = word ^ self._layout.next_word()
+            if diff:
+                errors += _popcount(diff)
+                if first is None:
+                    first = 8 * (offset + size) - diff.bit_length()
+        if first is not None:
+            self._record(errors, first)
+        self.bits_checked += 8 * len(data)
+        return not errors
+
+
+class _CounterLayout:
+    """The layout of counter values in the lanes of a value."""
+
+    def __init__(
+        self,
+        data_width_bits: int,
+        lane_bits: int | None,
+        start: int,
+        step: int,
+        lane_order: str,
+    ):
+        """Initialize an instance.
+
+        Args:
+            data_width_bits: The width of each value in bits
+            lane_bits: The width of each lane in bits
+            start: The first counter value
+            step: The increment between two lanes
+            lane_order: ``'msb'`` or ``'lsb'``
+
+        Raises:
+            ValueError: If the lanes don't divide the value or the lane order
+                is not supported
+        """
+        if lane_bits is None:
+            lane_bits = data_width_bits
+        if lane_bits <= 0 or data_width_bits % lane_bits:
+            raise ValueError("The lane width must divide the data width")
+        if lane_order not in ("msb", "lsb"):
+            raise ValueError(f"Unsupported lane order '{lane_order}'")
+        self.word_bytes: int = bits_to_bytes(data_width_bits)
+        self._lanes: int = data_width_bits // lane_bits
+        self._shifts: list[int] = [
+            lane * lane_bits for lane in range(self._lanes)
+        ]
+        if lane_order == "msb":
+            self._shifts.reverse()
+        self._mask: int = (1 << lane_bits) - 1
+        self._value: int = start
+        self._step: int = step
+
+    def next_word(self) -> int:
+        """Get the next value.
+
+        Returns:
+            The lanes of the next value combined into one integer
+        """
+        word = 0
+        for shift in self._shifts:
+            word |= (self._value & self._mask) << shift
+            self._value += self._step
+        return word
+
+    def next_words(self, count: int) -> bytes:
+        """Get the next values.
+
+        Args:
+            count: The number of values
+
+        Returns:
+            The big-endian values
+        """
+        size = self.word_bytes
+        return b"".join(
+            self.next_word().to_bytes(size, "big") for _ in range(count)
+        )
+
+
+class WalkingPayloadGenerator:
+    """A generator of walking ones or walking zeros payloads.
+
+    The n-th value has only bit ``n % data_width_bits`` set, or cleared for
+    walking zeros.
+    """
+
+    def __init__(
+        self, frame_length: int, data_width_bits: int, ones: bool = True
+    ):
+        """Initialize an instance.
+
+        Args:
+            frame_length: The length of the frame
+            data_width_bits: The width of each value in bits
+            ones: Walk a one through zeros, else a zero through ones
+        """
+        self._period: bytes = _walking_period(data_width_bits, ones)
+        self._payload_bytes: int = frame_length * bits_to_bytes(data_width_bits)
+        self._offset: int = 0
+
+    def get_payload(self) -> bytes:
+        """Get the next walking values.
+
+        Returns:
+            The payload
+        """
+        end = self._offset + self._payload_bytes
+        repeat = -(-end // len(self._period))
+        payload = (self._period * repeat)[self._offset : end]
+        self._offset = end % len(self._period)
+        return payload
+
+    def get_payloads(self, count: int) -> list[bytes]:
+        """Get the next payloads.
+
+        Args:
+            count: The number of payloads
+
+        Returns:
+            The payloads
+        """
+        return [self.get_payload() for _ in range(count)]
+
+
+class WalkingPayloadVerifier(_PatternVerifier):
+    """A verifier of walking ones or walking zeros payloads.
+
+    The data is compared against one period of the pattern at a time, so the
+    memory use is independent of the payload size.
+    """
+
+    def __init__(self, data_width_bits: int, ones: bool = True):
+        """Initialize an instance.
+
+        Args:
+            data_width_bits: The width of each value in bits
+            ones: Walk a one through zeros, else a zero through ones
+        """
+        super().__init__()
+        self._period: bytes = _walking_period(data_width_bits, ones)
+        self._offset: int = 0
+
+    def check(self, data: bytes | bytearray) -> bool:
+        """Check the next walking values.
+
+        Args:
+            data: The received data
+
+        Returns:
+            True if no error was found in the data
+        """
+        period = len(self._period)
+        expected = self._period[self._offset :] + self._period[: self._offset]
+        view = memoryview(data)
+        errors = 0
+        first = None
+        for offset in range(0, len(view), period):
+            chunk = view[offset : offset + period]
+            if chunk != expected[: len(chunk)]:
+                diff = int.from_bytes(chunk, "big") ^ int.from_bytes(
+                    expected[: len(chunk)], "big"
+                )
+                errors += _popcount(diff)
+                if first is None:
+                    first = 8 * (offset + len(chunk)) - diff.bit_length()
+        if first is not None:
+            self._record(errors, first)
+        self._offset = (self._offset + len(view)) % period
+        self.bits_checked += 8 * len(view)
+        return not errors
+
+
+def _walking_period(data_width_bits: int, ones: bool) -> bytes:
+    """Get one period of a walking pattern.
+
+    Args:
+        data_width_bits: The width of each value in bits
+        ones: Walk a one through zeros, else a zero through ones
+
+    Returns:
+        The big-endian values of one period
+    """
+    size = bits_to_bytes(data_width_bits)
+    mask = (1 << data_width_bits) - 1
+    words = [1 << bit for bit in range(data_width_bits)]
+    if not ones:
+        words = [~word & mask for word in words]
+    return b"".join(word.to_bytes(size, "big") for word in words)
@@ -0,0 +1,208 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Profile the coroutines of a test.
+
+The profiler measures the wall-clock time of every resumption of a task and
+attributes it to the coroutine stack of the task and the trigger that resumed
+it. The result is written in the collapsed stack format, which is read by
+flamegraph tools such as `FlameGraph <https://github.com/brendangregg/
+FlameGraph>`_ and `speedscope <https://www.speedscope.app>`_. Each line holds
+the test name, the awaiting coroutines from the task down and the trigger type
+prefixed with ``@``, followed by the time in microseconds.
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+import os
+import re
+import time
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Any
+
+import cocotb
+from cocotb.log import SimLog
+
+if TYPE_CHECKING:
+    from cocotb_wrapper.framing import PathLike
+
+PROFILE_ENV = "COCOTB_WRAPPER_PROFILE"
+"""The environment variable enabling the profiler for all tests."""
+PROFILE_DIR_ENV = "COCOTB_WRAPPER_PROFILE_DIR"
+"""The environment variable holding the output directory of the profiles."""
+
+
+class CoroutineProfiler:
+    """A profiler of the tasks run by the cocotb scheduler.
+
+    Use the profiler as a context manager around the code to profile. Only one
+    profiler can be active at a time.
+    """
+
+    def __init__(self, name: str):
+        """Initialize an instance.
+
+        Args:
+            name: The root of every recorded stack, usually the test name
+        """
+        self.name: str = name
+        self.time: defaultdict[tuple[str, ...], float] = defaultdict(float)
+        """The wall-clock time in seconds spent per stack."""
+        self.resumes: Counter[tuple[str, ...]] = Counter()
+        """The number of resumptions per stack."""
+        self._child_time: list[float] = []
+        self._log = SimLog(f"profiler.{name}")
+
+    def __enter__(self) -> CoroutineProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start recording the resumptions of all tasks."""
+        scheduler: Any = cocotb.scheduler
+        schedule = scheduler._schedule
+
+        def _schedule(coroutine: Any, trigger: Any = None) -> object:
+            stack = self._stack(coroutine, trigger)
+            self._child_time.append(0.0)
+            start = time.perf_counter()
+            try:
+                return schedule(coroutine, trigger)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.time[stack] += elapsed - self._child_time.pop()
+                self.resumes[stack] += 1
+                if self._child_time:
+                    self._child_time[-1] += elapsed
+
+        scheduler._schedule = _schedule
+
+    def stop(self) -> None:
+        """Stop recording."""
+        vars(cocotb.scheduler).pop("_schedule", None)
+
+    def by_task(self) -> list[tuple[str, float, int]]:
+        """Sum the time and resumptions per task.
+
+        Returns:
+            The outermost coroutine of each task with its time in seconds and
+            resumptions, sorted by descending time
+        """
+        return self._group(1)
+
+    def by_trigger(self) -> list[tuple[str, float, int]]:
+        """Sum the time and resumptions per trigger type.
+
+        Returns:
+            The trigger types with their time in seconds and resumptions,
+            sorted by descending time
+        """
+        return self._group(-1)
+
+    def write(self, path: PathLike, resumes: bool = False) -> None:
+        """Write the profile in the collapsed stack format.
+
+        Args:
+            path: The path to the file
+            resumes: Write the resumptions instead of the time in microseconds
+        """
+        with open(path, "w") as f:
+            for stack, value in sorted(self.time.items()):
+                if resumes:
+                    value = self.resumes[stack]
+                else:
+                    value = round(value * 1e6)
+                f.write(f"{';'.join(stack)} {value}\n")
+
+    def report(self, count: int = 10) -> None:
+        """Log the tasks and trigger types that took the most time.
+
+        Args:
+            count: The number of entries logged per table
+        """
+        for title, rows in (
+            ("task", self.by_task()),
+            ("trigger", self.by_trigger()),
+        ):
+            self._log.info("%-40s %12s %10s", title, "time [ms]", "resumes")
+            for name, seconds, resumes in rows[:count]:
+                self._log.info(
+                    "%-40s %12.3f %10d", name, 1e3 * seconds, resumes
+                )
+
+    def _group(self, level: int) -> list[tuple[str, float, int]]:
+        """Sum the time and resumptions by one level of the stacks.
+
+        Args:
+            level: The index of the level in the stacks
+
+        Returns:
+            The name at the level with its time and resumptions, sorted by
+            descending time
+        """
+        time_per_name: defaultdict[str, float] = defaultdict(float)
+        resumes_per_name: Counter[str] = Counter()
+        for stack, seconds in self.time.items():
+            time_per_name[stack[level]] += seconds
+            resumes_per_name[stack[level]] += self.resumes[stack]
+        return [
+            (name, seconds, resumes_per_name[name])
+            for name, seconds in sorted(
+                time_per_name.items(), key=lambda item: -item[1]
+            )
+        ]
+
+    def _stack(self, task: Any, trigger: Any) -> tuple[str, ...]:
+        """Get the stack under which a resumption is recorded.
+
+        Args:
+            task: The resumed task
+            trigger: The trigger that resumed the task, None at the start
+
+        Returns:
+            The test name, the awaiting coroutines and the trigger type
+        """
+        stack = [self.name]
+        coro = task._coro
+        while coro is not None and not hasattr(coro, "_outcome"):
+            name = getattr(coro, "__qualname__", None)
+            if name is None or name.endswith("__await__"):
+                break
+            stack.append(name)
+            coro = getattr(coro, "cr_await", None) or getattr(
+                coro, "gi_yieldfrom", None
+            )
+        stack.append("@" + (type(trigger).__name__ if trigger else "start"))
+        return tuple(stack)
+
+
+def profile_path(name: str) -> str:
+    """Get the path of the profile of a test.
+
+    The profiles are written to the directory given by
+    :envvar:`COCOTB_WRAPPER_PROFILE_DIR`, which defaults to ``profiles`` in the
+    working directory of the simulator.
+
+    Args:
+        name: The test name
+
+    Returns:
+        The path of the collapsed stack file
+    """
+    directory = os.environ.get(PROFILE_DIR_ENV, "profiles")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, re.sub(r"[^\w.-]", "_", name) + ".collapsed")
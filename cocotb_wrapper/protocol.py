@@ -0,0 +1,536 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Check that the buses of a DUT follow the AXI protocol.
+
+A :class:`ProtocolChecker` is attached to the cocotbext models of the wrapped
+buses and checks two kinds of rules:
+
+Handshakes
+    A cycle monitor on each channel checks that the payload stays stable and
+    valid stays asserted while valid is high and ready is low.
+Transactions
+    The transactions put into the queues of the cocotbext channels are checked
+    against the burst rules: WLAST on the last beat of each write burst, no
+    INCR burst crossing a 4 KiB boundary, the length and alignment of WRAP
+    bursts, and responses returned in request order per ID.
+
+The full checks wake a monitor on every clock cycle of every channel. For long
+runs, the checker is limited to every Nth transfer of each channel with
+`every`, or to a window of simulation time with `window`. Outside of the
+sampled transfers, the monitors sleep and the transactions are only counted.
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+from collections import deque
+from collections.abc import Callable, Coroutine
+from operator import attrgetter
+from typing import Any
+
+from cocotb import start_soon
+from cocotb.log import SimLog
+from cocotb.task import Task
+from cocotb.triggers import Event, RisingEdge, Timer
+from cocotb.utils import get_sim_steps, get_sim_time
+
+from cocotb_wrapper.coverage import _tap
+
+_WRAP_LENGTHS = (2, 4, 8, 16)
+
+
+class ProtocolViolation:
+    """A violation of the AXI protocol."""
+
+    def __init__(self, time: float, channel: str, message: str):
+        """Initialize an instance.
+
+        Args:
+            time: The simulation time in nanoseconds
+            channel: The name of the channel
+            message: The description of the violation
+        """
+        self.time: float = time
+        """The simulation time in nanoseconds."""
+        self.channel: str = channel
+        """The name of the channel."""
+        self.message: str = message
+        """The description of the violation."""
+
+    def __str__(self) -> str:
+        return f"{self.time} ns {self.channel}: {self.message}"
+
+
+class ProtocolChecker:
+    """Check the AXI protocol on the attached buses.
+
+    Violations are logged as errors and collected in :attr:`violations`, so a
+    test fails on them with :meth:`check`.
+
+    Example:
+        .. code-block:: python
+
+            checker = ProtocolChecker(every=100)
+            ram.enable_protocol_checks(checker)
+            ...
+            checker.check()
+    """
+
+    def __init__(
+        self,
+        every: int = 1,
+        window: tuple[float, float] | None = None,
+        units: str = "ns",
+    ):
+        """Initialize an instance.
+
+        Args:
+            every: Check every Nth transfer of each channel. ``1`` checks all
+                transfers
+            window: The start and end time of the checks. None checks the
+                whole simulation
+            units: The unit of `window`
+
+        Raises:
+            ValueError: If `every` is not positive or the window is empty
+        """
+        if every < 1:
+            raise ValueError("The sampling interval must be positive")
+        if window is not None and window[1] <= window[0]:
+            raise ValueError("The window must end after it starts")
+        self._every: int = every
+        self._window: tuple[float, float] | None = window
+        self._units: str = units
+        self._active: bool = window is None
+        self._monitors: dict[str, Callable[[], Coroutine[Any, Any, None]]] = {}
+        self._tasks: dict[str, Task] = {}  # pyright: ignore[reportMissingTypeArgument]
+        self._window_task: Task | None = None  # pyright: ignore[reportMissingTypeArgument]
+        self.violations: list[ProtocolViolation] = []
+        """The violations found so far."""
+        self.checked: int = 0
+        """The number of checked transfers."""
+        self._log = SimLog(type(self).__name__)
+
+    def attach_axi(self, name: str, model: Any) -> None:
+        """Check a cocotbext AXI master or slave.
+
+        Args:
+            name: The name of the bus in the violations
+            model: The cocotbext model with `write_if` and `read_if`
+        """
+        bus = _AxiBursts(self, name, model.write_if.byte_lanes)
+        write_if, read_if = model.write_if, model.read_if
+        self._attach_channel(f"{name}.aw", write_if.aw_channel, bus.aw)
+        self._attach_channel(f"{name}.w", write_if.w_channel, bus.w)
+        self._attach_channel(f"{name}.b", write_if.b_channel, bus.b)
+        self._attach_channel(f"{name}.ar", read_if.ar_channel, bus.ar)
+        self._attach_channel(f"{name}.r", read_if.r_channel, bus.r)
+
+    def attach_axil(self, name: str, model: Any) -> None:
+        """Check a cocotbext AXI-Lite master or slave.
+
+        AXI-Lite has no bursts, so only the handshakes are checked.
+
+        Args:
+            name: The name of the bus in the violations
+            model: The cocotbext model with `write_if` and `read_if`
+        """
+        for interface, channels in (
+            (model.write_if, ("aw", "w", "b")),
+            (model.read_if, ("ar", "r")),
+        ):
+            for channel in channels:
+                self._attach_channel(
+                    f"{name}.{channel}",
+                    getattr(interface, f"{channel}_channel"),
+                    None,
+                )
+
+    def attach_axis(self, name: str, model: Any) -> None:
+        """Check the handshakes of a cocotbext AXI-Stream source or sink.
+
+        The transfers of a stream are counted in frames, so `every` selects
+        every Nth frame.
+
+        Args:
+            name: The name of the bus in the violations
+            model: The cocotbext stream model
+        """
+        self._attach_channel(name, model, None, "tvalid", "tready")
+
+    def check(self) -> None:
+        """Check that no violation was found.
+
+        Raises:
+            AssertionError: If the protocol was violated
+        """
+        assert not self.violations, (
+            f"{len(self.violations)} protocol violations, "
+            f"first: {self.violations[0]}"
+        )
+
+    def report(self) -> None:
+        """Log the number of checked transfers and violations."""
+        self._log.info(
+            "%d transfers checked, %d protocol violations",
+            self.checked,
+            len(self.violations),
+        )
+
+    def _violation(self, channel: str, message: str) -> None:
+        """Record a violation.
+
+        Args:
+            channel: The name of the channel
+            message: The description of the violation
+        """
+        violation = ProtocolViolation(get_sim_time("ns"), channel, message)
+        self.violations.append(violation)
+        self._log.error("Protocol violation: %s", violation)
+
+    def _attach_channel(
+        self,
+        name: str,
+        channel: Any,
+        check: Callable[[_Sample, Any], None] | None,
+        valid: str | None = None,
+        ready: str | None = None,
+    ) -> None:
+        """Check the handshakes and transactions of a channel.
+
+        Args:
+            name: The name of the channel
+            channel: The cocotbext channel or stream model
+            check: A function that checks a transaction, None if only the
+                handshakes are checked
+            valid: The name of the valid signal, the one of the channel if None
+            ready: The name of the ready signal, the one of the channel if None
+        """
+        valid_name: str = valid or channel._valid_signal
+        ready_name: str = ready or channel._ready_signal
+        sample = _Sample(self, self._every > 1)
+        check = check or _count
+        _tap(channel, lambda transaction: check(sample, transaction))
+        if not (
+            hasattr(channel.bus, valid_name)
+            and hasattr(channel.bus, ready_name)
+        ):
+            return
+        payload = [
+            getattr(channel.bus, signal)
+            for signal in (*channel._signals, *channel._optional_signals)
+            if signal not in (valid_name, ready_name)
+            and hasattr(channel.bus, signal)
+        ]
+
+        def monitor() -> Coroutine[Any, Any, None]:
+            return self._check_handshake(
+                name,
+                channel,
+                getattr(channel.bus, valid_name),
+                getattr(channel.bus, ready_name),
+                payload,
+                sample.armed,
+            )
+
+        # A bus set up again for the next test replaces the monitor of the
+        # previous one, whose task cocotb killed at the end of that test
+        self._monitors[name] = monitor
+        previous = self._tasks.pop(name, None)
+        if previous is not None:
+            previous.kill()
+        if self._window_task is not None and self._window_task.done():
+            self._window_task = None
+            self._active = False
+            self._tasks.clear()
+        if self._active:
+            self._tasks[name] = start_soon(monitor())
+        elif self._window is not None and self._window_task is None:
+            self._window_task = start_soon(self._run_window())
+
+    async def _check_handshake(
+        self,
+        name: str,
+        channel: Any,
+        valid: Any,
+        ready: Any,
+        payload: list[Any],
+        armed: Event | None,
+    ) -> None:
+        """Check that a stalled transfer stays stable until its handshake.
+
+        Args:
+            name: The name of the channel
+            channel: The cocotbext channel or stream model
+            valid: The valid signal
+            ready: The ready signal
+            payload: The payload signals
+            armed: The event set when the next transfer is sampled, None if
+                every transfer is checked
+        """
+        clock_edge = RisingEdge(channel.clock)
+        while True:
+            if armed is not None:
+                await armed.wait()
+                armed.clear()
+            stalled = None
+            while True:
+                await clock_edge
+                if channel._reset_state:
+                    stalled = None
+                elif valid.value:
+                    if stalled is not None:
+                        current = tuple(str(signal.value) for signal in payload)
+                        if current != stalled:
+                            self._violation(
+                                name,
+                                "Payload changed while valid and not ready",
+                            )
+                    if ready.value:
+                        break
+                    stalled = tuple(str(signal.value) for signal in payload)
+                elif stalled is not None:
+                    self._violation(name, "Valid deasserted before ready")
+                    stalled = None
+
+    async def _run_window(self) -> None:
+        """Run the handshake monitors during the window."""
+        assert self._window is not None
+        start, stop = (
+            get_sim_steps(time, self._units)  # pyright: ignore[reportArgumentType]
+            for time in self._window
+        )
+        now = get_sim_time()
+        if now >= stop:
+            return
+        if start > now:
+            await Timer(start - now, "step")  # pyright: ignore[reportArgumentType]
+            now = start
+        self._active = True
+        for name, monitor in self._monitors.items():
+            self._tasks[name] = start_soon(monitor())
+        await Timer(stop - now, "step")  # pyright: ignore[reportArgumentType]
+        self._active = False
+        for task in self._tasks.values():
+            task.kill()
+        self._tasks.clear()
+
+
+class _Sample:
+    """Select the sampled transfers of a channel."""
+
+    def __init__(self, checker: ProtocolChecker, armed: bool):
+        """Initialize an instance.
+
+        Args:
+            checker: The checker of the channel
+            armed: Wake the handshake monitor only for the sampled transfers
+        """
+        self._checker = checker
+        self._count: int = 0
+        self.armed: Event | None = Event() if armed else None
+        """The event that wakes the handshake monitor, None if always awake."""
+
+    def select(self) -> bool:
+        """Count a transfer and check whether it is sampled.
+
+        The handshake monitor is armed for the transfer that follows a sampled
+        one.
+
+        Returns:
+            True if the transfer is checked
+        """
+        index = self._count
+        self._count += 1
+        checker = self._checker
+        if not checker._active or index % checker._every:
+            return False
+        checker.checked += 1
+        if self.armed is not None:
+            self.armed.set()
+        return True
+
+
+def _count(sample: _Sample, transaction: object) -> None:
+    """Count a transfer whose transaction is not checked.
+
+    Args:
+        sample: The sampling of the channel
+        transaction: The transaction of the transfer
+    """
+    sample.select()
+
+
+class _AxiBursts:
+    """Check the bursts and responses of an AXI bus."""
+
+    def __init__(self, checker: ProtocolChecker, name: str, byte_lanes: int):
+        """Initialize an instance.
+
+        Args:
+            checker: The checker collecting the violations
+            name: The name of the bus
+            byte_lanes: The number of byte lanes of the data bus
+        """
+        self._checker = checker
+        self._name = name
+        self._byte_lanes = byte_lanes
+        self._aw_fields = attrgetter(
+            "awid", "awaddr", "awlen", "awsize", "awburst"
+        )
+        self._ar_fields = attrgetter(
+            "arid", "araddr", "arlen", "arsize", "arburst"
+        )
+        # Write data follows the order of the write addresses
+        self._write_bursts: deque[list[Any]] = deque()
+        self._wlast: deque[int] = deque()
+        self._writes: dict[int, deque[bool]] = {}
+        self._reads: dict[int, deque[list[Any]]] = {}
+
+    def aw(self, sample: _Sample, transaction: object) -> None:
+        """Check a write address.
+
+        Args:
+            sample: The sampling of the channel
+            transaction: The AW transaction
+        """
+        selected = sample.select()
+        id, addr, length, size, burst = map(int, self._aw_fields(transaction))
+        if selected:
+            self._check_burst("aw", addr, length, size, burst)
+        self._write_bursts.append([length + 1, selected])
+        self._writes.setdefault(id, deque()).append(selected)
+        self._match_write_data()
+
+    def w(self, sample: _Sample, transaction: Any) -> None:
+        """Check a write data beat.
+
+        Args:
+            sample: The sampling of the channel
+            transaction: The W transaction
+        """
+        sample.select()
+        self._wlast.append(int(transaction.wlast))
+        self._match_write_data()
+
+    def b(self, sample: _Sample, transaction: Any) -> None:
+        """Check a write response.
+
+        Args:
+            sample: The sampling of the channel
+            transaction: The B transaction
+        """
+        selected = sample.select()
+        id = int(transaction.bid)
+        outstanding = self._writes.get(id)
+        if not outstanding:
+            if selected:
+                self._checker._violation(
+                    f"{self._name}.b", f"Response with ID {id} without a write"
+                )
+            return
+        outstanding.popleft()
+
+    def ar(self, sample: _Sample, transaction: object) -> None:
+        """Check a read address.
+
+        Args:
+            sample: The sampling of the channel
+            transaction: The AR transaction
+        """
+        selected = sample.select()
+        id, addr, length, size, burst = map(int, self._ar_fields(transaction))
+        if selected:
+            self._check_burst("ar", addr, length, size, burst)
+        self._reads.setdefault(id, deque()).append([length + 1, selected])
+
+    def r(self, sample: _Sample, transaction: Any) -> None:
+        """Check a read data beat.
+
+        The beats of each ID must belong to the oldest outstanding read of
+        that ID, so RLAST must be set on its last beat.
+
+        Args:
+            sample: The sampling of the channel
+            transaction: The R transaction
+        """
+        selected = sample.select()
+        id = int(transaction.rid)
+        outstanding = self._reads.get(id)
+        if not outstanding:
+            if selected:
+                self._checker._violation(
+                    f"{self._name}.r", f"Read data with ID {id} without a read"
+                )
+            return
+        burst = outstanding[0]
+        burst[0] -= 1
+        last = int(transaction.rlast)
+        if burst[1] and bool(last) != (burst[0] == 0):
+            self._checker._violation(
+                f"{self._name}.r",
+                f"RLAST {last} with {burst[0]} beats left of the oldest "
+                f"read with ID {id}",
+            )
+        if last or not burst[0]:
+            outstanding.popleft()
+
+    def _match_write_data(self) -> None:
+        """Check the WLAST of the write data beats with a known burst."""
+        bursts, wlast = self._write_bursts, self._wlast
+        while bursts and wlast:
+            burst = bursts[0]
+            burst[0] -= 1
+            last = wlast.popleft()
+            if burst[1] and bool(last) != (burst[0] == 0):
+                self._checker._violation(
+                    f"{self._name}.w",
+                    f"WLAST {last} with {burst[0]} beats left of the burst",
+                )
+            if last or not burst[0]:
+                bursts.popleft()
+
+    def _check_burst(
+        self, prefix: str, addr: int, length: int, size: int, burst: int
+    ) -> None:
+        """Check the burst rules of an address transaction.
+
+        Args:
+            prefix: ``'aw'`` or ``'ar'``
+            addr: The start address
+            length: The burst length minus one
+            size: The burst size as the log2 of the bytes per beat
+            burst: The burst type
+        """
+        channel = f"{self._name}.{prefix}"
+        violation = self._checker._violation
+        beats = length + 1
+        if (1 << size) > self._byte_lanes:
+            violation(channel, f"Burst size {1 << size} exceeds the data bus")
+        if burst == 0:
+            if beats > 16:
+                violation(channel, f"FIXED burst of {beats} beats")
+        elif burst == 1:
+            start = addr & 0xFFF & -(1 << size)
+            if start + (beats << size) > 0x1000:
+                violation(
+                    channel, f"INCR burst at {addr:#x} crosses a 4 KiB boundary"
+                )
+        elif burst == 2:
+            if beats not in _WRAP_LENGTHS:
+                violation(channel, f"WRAP burst of {beats} beats")
+            if addr & ((1 << size) - 1):
+                violation(channel, f"WRAP burst at unaligned {addr:#x}")
+        else:
+            violation(channel, f"Reserved burst type {burst}")
@@ -0,0 +1,475 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Scoreboards that compare received transactions against expected ones."""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+import hashlib
+from collections import deque
+from typing import TYPE_CHECKING
+
+from cocotb.log import SimLog
+from cocotb.queue import QueueFull
+from cocotb.triggers import Event
+from cocotb.utils import get_sim_time, get_time_from_sim_steps
+
+from cocotb_wrapper.axi import (
+    AxiStreamSink,
+    RandomAxiLitePayloadGenerator,
+    RandomAxiPayloadGenerator,
+    RandomAxiStreamPayloadGenerator,
+    sideband_value,
+)
+
+if TYPE_CHECKING:
+    import cocotbext.axi as axi
+
+
+def _frame_digest(data: bytes | bytearray) -> bytes:
+    """Get the key under which frame data is indexed.
+
+    Args:
+        data: The frame data
+
+    Returns:
+        A short digest of the data
+    """
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class AxiStreamScoreboardStats:
+    """The statistics of one stream of an :class:`AxiStreamScoreboard`."""
+
+    def __init__(self, key: int | None):
+        """Initialize an instance.
+
+        Args:
+            key: The `tid` or `tdest` of the stream, None if not keyed
+        """
+        self.key: int | None = key
+        """The `tid` or `tdest` of the stream."""
+        self.matched: int = 0
+        """The number of received frames that were expected."""
+        self.unexpected: int = 0
+        """The number of received frames that were not expected."""
+        self.outstanding: int = 0
+        """The number of expected frames that were not received yet."""
+        self.bytes: int = 0
+        """The number of bytes of the matched frames."""
+        self.latency_min: int | None = None
+        """The minimum latency in simulation steps."""
+        self.latency_max: int | None = None
+        """The maximum latency in simulation steps."""
+        self.latency_sum: int = 0
+        """The sum of all latencies in simulation steps."""
+        self.first_time: int | None = None
+        """The simulation step the first matched frame started."""
+        self.last_time: int | None = None
+        """The simulation step the last matched frame ended."""
+
+    def latency_mean(self, units: str = "ns") -> float:
+        """Get the mean latency from adding to receiving an expected frame.
+
+        Args:
+            units: The unit of the latency
+
+        Returns:
+            The mean latency
+        """
+        if not self.matched:
+            return 0.0
+        return get_time_from_sim_steps(self.latency_sum, units) / self.matched
+
+    def throughput(self, units: str = "ns") -> float:
+        """Get the throughput of the matched frames.
+
+        Args:
+            units: The time unit of the throughput
+
+        Returns:
+            The throughput in bytes per time unit
+        """
+        if self.first_time is None or self.last_time is None:
+            return 0.0
+        duration = get_time_from_sim_steps(
+            self.last_time - self.first_time, units
+        )
+        return self.bytes / duration if duration else 0.0
+
+
+class AxiStreamScoreboard:
+    """A scoreboard that matches frames received by an AXI-Stream sink.
+
+    The expected frames are indexed by a digest of their data, so each
+    received frame is matched in constant time regardless of the delivery
+    order. With a `key`, the frames are matched per stream and only reordering
+    within the same `tid` or `tdest` is tolerated.
+
+    Example:
+        .. code-block:: python
+
+            scoreboard = AxiStreamScoreboard(sink, key="tdest")
+            for tdest, data in frames:
+                await scoreboard.add_expected(data, tdest=tdest)
+                await source.write(data)
+            await scoreboard.wait()
+            scoreboard.check()
+    """
+
+    def __init__(
+        self,
+        sink: AxiStreamSink,
+        key: str | None = None,
+        max_expected: int = 0,
+        consume: bool = True,
+    ):
+        """Initialize an instance.
+
+        Args:
+            sink: The sink receiving the frames
+            key: Match the frames per stream, either ``'tid'`` or ``'tdest'``
+            max_expected: The maximum number of outstanding expected frames.
+                ``0`` disables the limit
+            consume: Don't queue the received frames in the sink
+
+        Raises:
+            ValueError: If the key is not supported
+        """
+        if key not in (None, "tid", "tdest"):
+            raise ValueError(f"Unsupported stream key '{key}'")
+        self._sink: AxiStreamSink = sink
+        self._key: str | None = key
+        self._max_expected: int = max_expected
+        self._expected: dict[int | None, dict[bytes, deque[int]]] = {}
+        self._stats: dict[int | None, AxiStreamScoreboardStats] = {}
+        self._outstanding: int = 0
+        self._slot_event: Event = Event()
+        self._slot_event.set()
+        self._done_event: Event = Event()
+        self._done_event.set()
+        self._log = SimLog(type(self).__name__)
+        sink.add_callback(self._receive, consume=consume)
+
+    @property
+    def outstanding(self) -> int:
+        """Get the number of expected frames that were not received yet.
+
+        Returns:
+            The number of outstanding frames of all streams
+        """
+        return self._outstanding
+
+    @property
+    def stats(self) -> dict[int | None, AxiStreamScoreboardStats]:
+        """Get the statistics of each stream.
+
+        Returns:
+            The statistics indexed by the stream key
+        """
+        return self._stats
+
+    async def add_expected(
+        self,
+        data: bytes,
+        tid: int | None = None,
+        tdest: int | None = None,
+    ) -> None:
+        """Add an expected frame.
+
+        Wait until an expected frame is received if `max_expected` frames are
+        outstanding.
+
+        Args:
+            data: The expected frame data
+            tid: The expected `tid`, used if the scoreboard is keyed by `tid`
+            tdest: The expected `tdest`, used if the scoreboard is keyed by
+                `tdest`
+        """
+        while self._full():
+            self._slot_event.clear()
+            await self._slot_event.wait()
+        self.add_expected_nowait(data, tid, tdest)
+
+    def add_expected_nowait(
+        self,
+        data: bytes,
+        tid: int | None = None,
+        tdest: int | None = None,
+    ) -> None:
+        """Add an expected frame without waiting.
+
+        Args:
+            data: The expected frame data
+            tid: The expected `tid`, used if the scoreboard is keyed by `tid`
+            tdest: The expected `tdest`, used if the scoreboard is keyed by
+                `tdest`
+
+        Raises:
+            QueueFull: If `max_expected` frames are outstanding
+        """
+        if self._full():
+            raise QueueFull()
+        key = None
+        if self._key == "tid":
+            key = tid
+        elif self._key == "tdest":
+            key = tdest
+        stream = self._expected.setdefault(key, {})
+        stream.setdefault(_frame_digest(data), deque()).append(get_sim_time())
+        self._get_stats(key).outstanding += 1
+        self._outstanding += 1
+        self._done_event.clear()
+
+    async def wait(self) -> None:
+        """Wait until all expected frames are received."""
+        await self._done_event.wait()
+
+    def check(self) -> None:
+        """Check that exactly the expected frames were received.
+
+        Raises:
+            AssertionError: If frames are outstanding or unexpected frames were
+                received
+        """
+        unexpected = sum(stats.unexpected for stats in self._stats.values())
+        assert not unexpected, f"Received {unexpected} unexpected frames"
+        assert not self._outstanding, (
+            f"{self._outstanding} expected frames were not received"
+        )
+
+    def report(self, units: str = "ns") -> None:
+        """Log the throughput and latency of each stream.
+
+        Args:
+            units: The time unit of the report
+        """
+        for stats in self._stats.values():
+            self._log.info(
+                "Stream %s: %d matched, %d unexpected, %d outstanding, "
+                "%.3f bytes/%s, latency %.3f %s (mean)",
+                stats.key,
+                stats.matched,
+                stats.unexpected,
+                stats.outstanding,
+                stats.throughput(units),
+                units,
+                stats.latency_mean(units),
+                units,
+            )
+
+    def close(self) -> None:
+        """Stop receiving frames from the sink."""
+        self._sink.remove_callback(self._receive)
+
+    def _full(self) -> bool:
+        """Check whether the maximum of outstanding frames is reached.
+
+        Returns:
+            True if no further frame may be added
+        """
+        return 0 < self._max_expected <= self._outstanding
+
+    def _get_stats(self, key: int | None) -> AxiStreamScoreboardStats:
+        """Get the statistics of a stream.
+
+        Args:
+            key: The stream key
+
+        Returns:
+            The statistics of the stream
+        """
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = AxiStreamScoreboardStats(key)
+        return stats
+
+    def _receive(self, frame: axi.AxiStreamFrame) -> None:  # pyright: ignore[reportAttributeAccessIssue]
+        """Match a received frame against the expected frames.
+
+        Args:
+            frame: The received frame
+        """
+        key = sideband_value(getattr(frame, self._key)) if self._key else None
+        stats = self._get_stats(key)
+        stream = self._expected.get(key, {})
+        digest = _frame_digest(frame.tdata)
+        times = stream.get(digest)
+        if not times:
+            stats.unexpected += 1
+            self._log.error("Unexpected frame on stream %s: %s", key, frame)
+            return
+        latency = frame.sim_time_end - times.popleft()
+        if not times:
+            del stream[digest]
+        stats.matched += 1
+        stats.outstanding -= 1
+        stats.bytes += len(frame.tdata)
+        stats.latency_sum += latency
+        if stats.latency_min is None or latency < stats.latency_min:
+            stats.latency_min = latency
+        if stats.latency_max is None or latency > stats.latency_max:
+            stats.latency_max = latency
+        if stats.first_time is None:
+            stats.first_time = frame.sim_time_start
+        stats.last_time = frame.sim_time_end
+        self._outstanding -= 1
+        self._slot_event.set()
+        if not self._outstanding:
+            self._done_event.set()
+
+
+class PayloadChecker:
+    """A checker that recreates the expected payloads instead of storing them.
+
+    The payloads of a seeded random payload generator only depend on the seed
+    and their index, so the expected data is recreated from the generator when
+    a payload is received. The memory use is constant regardless of the number
+    of payloads in flight. The payloads must be received in the order they were
+    generated, unless the index is given explicitly. The checker may share the
+    generator with the producer, the generator keeps the blocks of payloads
+    both of them recently used.
+
+    Example:
+        .. code-block:: python
+
+            generator = RandomAxiStreamPayloadGenerator(64, 32, seed=1234)
+            checker = PayloadChecker(generator, sink=sink)
+            await source.write_frames(
+                generator.get_payload() for _ in range(1_000_000)
+            )
+            await source.wait_sent()
+            checker.check_all(1_000_000)
+    """
+
+    def __init__(
+        self,
+        generator: RandomAxiPayloadGenerator
+        | RandomAxiLitePayloadGenerator
+        | RandomAxiStreamPayloadGenerator,
+        sink: AxiStreamSink | None = None,
+        start_index: int = 0,
+        consume: bool = True,
+    ):
+        """Initialize an instance.
+
+        Args:
+            generator: A seeded generator of the expected payloads
+            sink: A sink whose received frames are checked
+            start_index: The index of the first expected payload
+            consume: Don't queue the frames checked from the sink
+        """
+        self._generator = generator
+        self._sink: AxiStreamSink | None = sink
+        self._index: int = start_index
+        self._checked: int = 0
+        self._mismatches: int = 0
+        self._first_mismatch: int | None = None
+        self._log = SimLog(type(self).__name__)
+        if sink is not None:
+            sink.add_callback(self._receive, consume=consume)
+
+    @property
+    def checked(self) -> int:
+        """Get the number of checked payloads.
+
+        Returns:
+            The number of checked payloads
+        """
+        return self._checked
+
+    @property
+    def mismatches(self) -> int:
+        """Get the number of payloads that differed from the expected ones.
+
+        Returns:
+            The number of mismatching payloads
+        """
+        return self._mismatches
+
+    @property
+    def first_mismatch(self) -> int | None:
+        """Get the index of the first mismatching payload.
+
+        Returns:
+            The index, or None if all payloads matched
+        """
+        return self._first_mismatch
+
+    def check(self, data: bytes, index: int | None = None) -> bool:
+        """Check a received payload.
+
+        Args:
+            data: The received payload
+            index: The index of the payload. Defaults to the index following the
+                previously checked payload
+
+        Returns:
+            True if the payload matches the expected one
+        """
+        if index is None:
+            index = self._index
+        self._index = index + 1
+        self._checked += 1
+        if data == self._generator.get_payload_at(index):
+            return True
+        self._mismatches += 1
+        if self._first_mismatch is None:
+            self._first_mismatch = index
+        self._log.error("Payload %d does not match", index)
+        return False
+
+    def check_all(self, count: int | None = None) -> None:
+        """Check that all payloads matched.
+
+        A warning is logged if the generator derived its blocks of payloads
+        much more often than the checked payloads span, e.g. because the
+        checker trails the producer by more than the kept blocks.
+
+        Args:
+            count: The expected number of checked payloads
+
+        Raises:
+            AssertionError: If a payload mismatched or the count differs
+        """
+        block_payloads = self._generator.BLOCK_PAYLOADS
+        spanned = -(-max(self._index, self._generator.index) // block_payloads)
+        if self._generator.derived_blocks > 2 * spanned + 1:
+            self._log.warning(
+                "The generator derived %d blocks for %d blocks of payloads",
+                self._generator.derived_blocks,
+                spanned,
+            )
+        assert not self._mismatches, (
+            f"{self._mismatches} payloads mismatched, the first one at index "
+            f"{self._first_mismatch}"
+        )
+        if count is not None:
+            assert self._checked == count, (
+                f"Checked {self._checked} payloads instead of {count}"
+            )
+
+    def close(self) -> None:
+        """Stop checking the frames received by the sink."""
+        if self._sink is not None:
+            self._sink.remove_callback(self._receive)
+            self._sink = None
+
+    def _receive(self, frame: axi.AxiStreamFrame) -> None:  # pyright: ignore[reportAttributeAccessIssue]
+        """Check a frame received by the sink.
+
+        Args:
+            frame: The received frame
+        """
+        self.check(frame.tdata)
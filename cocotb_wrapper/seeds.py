@@ -0,0 +1,127 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Seed the random state of each test.
+
+Each test reseeds the global :mod:`random` state with a seed derived from the
+seed of the run and the test name. A test therefore draws the same random
+numbers whether it runs in the full regression or alone, and a failing test is
+replayed without the tests before it::
+
+    TESTCASE=test_add RANDOM_SEED=1760781234 make
+
+The seed of every test is appended to a JSON lines file, together with the
+outcome and the command that replays the test.
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+
+import cocotb
+
+SEEDS_ENV = "COCOTB_WRAPPER_SEEDS"
+"""The environment variable holding the path of the seeds file."""
+SEEDS_FILE = "seeds.jsonl"
+"""The default seeds file, relative to the simulator."""
+
+_started: set[str] = set()
+
+
+def run_seed() -> int:
+    """Get the seed of the run.
+
+    Returns:
+        The seed cocotb seeded the random state with, see
+        :envvar:`RANDOM_SEED`
+    """
+    return cocotb.RANDOM_SEED or 0
+
+
+def derive_seed(name: str, base: int | None = None) -> int:
+    """Derive the seed of a test.
+
+    Args:
+        name: The name of the test function
+        base: The seed of the run. Defaults to the one of cocotb
+
+    Returns:
+        A 32-bit seed
+    """
+    if base is None:
+        base = run_seed()
+    digest = hashlib.blake2b(f"{base}:{name}".encode(), digest_size=4)
+    return int.from_bytes(digest.digest(), "big")
+
+
+def replay_command(names: Iterable[str], base: int | None = None) -> str:
+    """Get the environment that replays tests with the seeds of a run.
+
+    Args:
+        names: The names of the test functions
+        base: The seed of the run. Defaults to the one of cocotb
+
+    Returns:
+        The environment variable assignments
+    """
+    if base is None:
+        base = run_seed()
+    return f"TESTCASE={','.join(names)} RANDOM_SEED={base}"
+
+
+def seeds_path() -> str:
+    """Get the path of the seeds file.
+
+    Returns:
+        The path given by :envvar:`COCOTB_WRAPPER_SEEDS`, which defaults to
+        ``seeds.jsonl`` in the working directory of the simulator
+    """
+    return os.environ.get(SEEDS_ENV, SEEDS_FILE)
+
+
+def record_seed(
+    name: str, test_id: int, stage: int, seed: int, passed: bool
+) -> None:
+    """Append the seed of a test to the seeds file.
+
+    The file is overwritten by the first test of each run.
+
+    Args:
+        name: The name of the test function
+        test_id: The ID of the test
+        stage: The stage of the test
+        seed: The seed of the test
+        passed: Whether the test function returned without an exception
+    """
+    path = seeds_path()
+    mode = "a" if path in _started else "w"
+    _started.add(path)
+    with open(path, mode) as f:
+        f.write(
+            json.dumps(
+                {
+                    "test": name,
+                    "test_id": test_id,
+                    "stage": stage,
+                    "seed": seed,
+                    "random_seed": run_seed(),
+                    "passed": passed,
+                    "replay": replay_command([name]),
+                }
+            )
+            + "\n"
+        )
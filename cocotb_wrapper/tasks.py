@@ -0,0 +1,232 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Run coroutines concurrently and fail them together.
+
+A :class:`TaskGroup` starts each coroutine as a cocotb task. The first task
+that raises an exception or runs into its timeout kills the other tasks of the
+group, and waiting on the group raises that exception:
+
+.. code-block:: python
+
+    async with TB.task_group() as group:
+        group.start(master.write(0x0, data), timeout_time=10, timeout_unit="us")
+        group.start(sink.read())
+
+The tasks of the groups created by the :class:`~cocotb_wrapper.Testbench` are
+killed at the end of each test, so they don't run on into the next test.
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+from collections.abc import Coroutine
+from types import TracebackType
+from typing import Any
+
+from cocotb import start_soon
+from cocotb.log import SimLog
+from cocotb.result import SimTimeoutError
+from cocotb.task import Task
+from cocotb.triggers import Combine, First, Timer
+
+
+class TaskGroup:
+    """A group of tasks that fail together."""
+
+    def __init__(self, name: str = "tasks"):
+        """Initialize an instance.
+
+        Args:
+            name: The name of the group in the log
+        """
+        self._tasks: list[Task] = []  # pyright: ignore[reportMissingTypeArgument]
+        self._error: Exception | None = None
+        self._log = SimLog(name)
+
+    @property
+    def pending(self) -> int:
+        """The number of tasks that are still running.
+
+        Returns:
+            The number of unfinished tasks
+        """
+        return sum(not task.done() for task in self._tasks)
+
+    def start(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        timeout_time: float | None = None,
+        timeout_unit: str = "ns",
+    ) -> Task:  # pyright: ignore[reportMissingTypeArgument]
+        """Start a coroutine as a task of the group.
+
+        Args:
+            coro: The coroutine
+            timeout_time: The simulation time the task may run at most. None
+                runs it without a limit
+            timeout_unit: The unit of the timeout time
+
+        Returns:
+            The task, whose result is the one of the coroutine
+
+        Raises:
+            Exception: The exception of a failed task, if the group has failed
+        """
+        if self._error is not None:
+            coro.close()
+            raise self._error
+        task = start_soon(self._guard(coro, len(self._tasks)))
+        self._tasks.append(task)
+        if timeout_time is not None:
+            start_soon(self._watch(task, timeout_time, timeout_unit))
+        return task
+
+    async def gather(
+        self,
+        *coros: Coroutine[Any, Any, Any],
+        limit: int | None = None,
+        timeout_time: float | None = None,
+        timeout_unit: str = "ns",
+    ) -> list[Any]:
+        """Run coroutines as tasks of the group, at most `limit` at a time.
+
+        Args:
+            coros: The coroutines, started in the given order
+            limit: The number of tasks running at once. None starts all tasks
+                right away
+            timeout_time: The simulation time each task may run at most
+            timeout_unit: The unit of the timeout time
+
+        Returns:
+            The results of the coroutines in the given order
+
+        Raises:
+            Exception: The exception of the first task that failed
+        """
+        tasks = []
+        for index, coro in enumerate(coros):
+            while limit and self._error is None:
+                running = [task.join() for task in tasks if not task.done()]
+                if len(running) < limit:
+                    break
+                await First(*running)
+            if self._error is not None:
+                for unstarted in coros[index:]:
+                    unstarted.close()
+                break
+            tasks.append(self.start(coro, timeout_time, timeout_unit))
+        await self.wait()
+        return [task.result() for task in tasks]
+
+    async def wait(self) -> None:
+        """Wait until all tasks of the group are finished.
+
+        Raises:
+            Exception: The exception of the first task that failed
+        """
+        while True:
+            running = [task.join() for task in self._tasks if not task.done()]
+            if not running:
+                break
+            await Combine(*running)
+        if self._error is not None:
+            raise self._error
+
+    def cancel(self) -> int:
+        """Kill all tasks of the group.
+
+        Returns:
+            The number of tasks that were still running
+        """
+        return self._kill(None)
+
+    async def __aenter__(self) -> TaskGroup:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc is not None:
+            self.cancel()
+        else:
+            await self.wait()
+
+    async def _guard(self, coro: Coroutine[Any, Any, Any], index: int) -> Any:
+        """Run a coroutine and fail the group if it raises an exception.
+
+        Args:
+            coro: The coroutine
+            index: The index of the task running the coroutine
+
+        Returns:
+            The result of the coroutine, None if it failed
+        """
+        try:
+            return await coro
+        except Exception as e:
+            self._fail(e, index)
+            return None
+
+    async def _watch(self, task: Task, time: float, unit: str) -> None:  # pyright: ignore[reportMissingTypeArgument]
+        """Kill a task that runs into its timeout and fail the group.
+
+        Args:
+            task: The task
+            time: The simulation time the task may run at most
+            unit: The unit of the time
+        """
+        timeout = Timer(time, unit)  # pyright: ignore[reportArgumentType]
+        if await First(task.join(), timeout) is timeout and not task.done():
+            task.kill()
+            self._fail(
+                SimTimeoutError(f"{task} timed out after {time} {unit}"),
+                self._tasks.index(task),
+            )
+
+    def _fail(self, error: Exception, index: int) -> None:
+        """Record the first failure and kill the other tasks.
+
+        Args:
+            error: The exception of the failed task
+            index: The index of the failed task
+        """
+        if self._error is not None:
+            return
+        self._error = error
+        killed = self._kill(index)
+        self._log.info(
+            "%s failed with %r, killed %d other tasks",
+            self._tasks[index],
+            error,
+            killed,
+        )
+
+    def _kill(self, spare: int | None) -> int:
+        """Kill the running tasks.
+
+        Args:
+            spare: The index of a task not to kill, i.e. the calling one
+
+        Returns:
+            The number of killed tasks
+        """
+        killed = 0
+        for index, task in enumerate(self._tasks):
+            if index != spare and not task.done():
+                task.kill()
+                killed += 1
+        return killed
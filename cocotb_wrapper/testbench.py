@@ -20,9 +20,20 @@ __mail__ = "deaa@zhaw.ch"
 __copyright__ = "2022 ZHAW Institute of Embedded Systems"
 __date__ = "2024-02-27"
 
-from collections.abc import Awaitable
+import os
+import random
+import sys
+import time
+from collections.abc import (
+    Awaitable,
+    Coroutine,
+    Hashable,
+    Iterable,
+    Mapping,
+    Sequence,
+)
 from functools import wraps
-from typing import Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from cocotb import (
     start_soon,
@@ -31,7 +42,31 @@ from cocotb import (
 from cocotb.clock import Clock
 from cocotb.handle import HierarchyObject
 from cocotb.log import SimLog
-from cocotb.triggers import RisingEdge, Timer
+from cocotb.result import SimTimeoutError, TestSuccess
+from cocotb.triggers import Combine, First, RisingEdge, Timer, with_timeout
+from cocotb.utils import get_sim_steps
+
+from cocotb_wrapper._imports import LazyModule
+from cocotb_wrapper.memory import MEMORY_ENV, MemoryTracker
+from cocotb_wrapper.profiler import PROFILE_ENV, CoroutineProfiler, profile_path
+from cocotb_wrapper.seeds import derive_seed, record_seed, replay_command
+from cocotb_wrapper.waves import (
+    WAVES_ENV,
+    WaveSelection,
+    record_failure,
+    rerun_path,
+)
+
+if TYPE_CHECKING:
+    import cocotb_wrapper.backdoor as backdoor
+    import cocotb_wrapper.matrix as matrix
+    import cocotb_wrapper.tasks as tasks
+    from cocotb_wrapper.buses import Bus, BusConfig
+    from cocotb_wrapper.tasks import TaskGroup
+else:
+    backdoor = LazyModule("cocotb_wrapper.backdoor")
+    matrix = LazyModule("cocotb_wrapper.matrix")
+    tasks = LazyModule("cocotb_wrapper.tasks")
 
 
 class Testbench:
@@ -65,6 +100,31 @@ class Testbench:
         self._teardown: Callable[[HierarchyObject], Awaitable[None]] | None = (
             None
         )
+        self._buses: BusConfig | None = None
+        self._waves = WaveSelection.parse(os.environ.get(WAVES_ENV, ""))
+        self._waves_signal = "dump_enable"
+        self._waves_on_failure = False
+        self._tests: list[tuple[int, int, str]] = []
+        self._cocotb_tests: dict[int, Any] = {}
+        self._max_failures = 0
+        self._skip_later_stages = False
+        self._failures = 0
+        self._failed_stage: int | None = None
+        self._test_budget: float | None = None
+        self._regression_budget: float | None = None
+        self._deadline: float | None = None
+        self._task_groups: list[TaskGroup] = []
+        self._memory_threshold: int | None = None
+        self._memory_top = 10
+        self._configuration: Hashable | None = None
+        self._current_configuration: Hashable | None = None
+        self._reconfiguring = True
+        if memory := os.environ.get(MEMORY_ENV):
+            self.track_memory(
+                int(float(memory) * 2**20)
+                if memory.replace(".", "", 1).isdigit()
+                else 16 * 2**20
+            )
 
     @property
     def name(self) -> str:
@@ -75,6 +135,279 @@ class Testbench:
         """
         return self._name
 
+    @property
+    def reconfiguring(self) -> bool:
+        """Whether the running test needs a freshly set up DUT.
+
+        False only for a test registered with a `configuration`, if the
+        previous test passed with the same configuration. A setup function
+        skips the expensive steps such as the reset in that case, like the
+        default setup does.
+
+        Returns:
+            True unless the DUT is already set up for the running test
+        """
+        return self._reconfiguring
+
+    @property
+    def buses(self) -> BusConfig | None:
+        """Get the registered bus configuration.
+
+        Returns:
+            The bus configuration or None if none is registered
+        """
+        return self._buses
+
+    def register_buses(self, config: BusConfig) -> BusConfig:
+        """Register the bus models of the testbench.
+
+        The bus models are set up before the setup function of each test, so
+        they are rebuilt for every test and observe the reset of the DUT.
+
+        Args:
+            config: The bus configuration
+
+        Returns:
+            The same bus configuration
+        """
+        self._buses = config
+        self._log.debug("Registered %d buses", len(config))
+        return config
+
+    async def wait_all_idle(
+        self,
+        timeout_time: float | None = None,
+        timeout_unit: str = "ns",
+        buses: Iterable[Bus] = (),
+    ) -> None:
+        """Wait until all bus models are idle.
+
+        The bus models registered with :meth:`register_buses` and the given
+        ones are waited on concurrently, see their ``wait_idle`` methods.
+
+        Args:
+            timeout_time: The simulation time to wait at most. None waits
+                without a limit
+            timeout_unit: The unit of the timeout time
+            buses: Further bus models to wait on
+
+        Raises:
+            SimTimeoutError: If a bus model is still busy after the timeout
+        """
+        models = [*buses]
+        if self._buses is not None:
+            models.extend(self._buses[name] for name in self._buses)
+        tasks = [start_soon(model.wait_idle()) for model in models]
+        idle = Combine(*(task.join() for task in tasks))
+        try:
+            if timeout_time is None:
+                await idle
+            else:
+                await with_timeout(idle, timeout_time, timeout_unit)
+        finally:
+            for task in tasks:
+                task.kill()
+
+    def task_group(self, name: str = "tasks") -> TaskGroup:
+        """Create a group of tasks that fail together.
+
+        The tasks of the group still running at the end of the test are
+        killed, see :mod:`~cocotb_wrapper.tasks`.
+
+        Args:
+            name: The name of the group in the log
+
+        Returns:
+            The task group
+        """
+        group = tasks.TaskGroup(name)
+        self._task_groups.append(group)
+        return group
+
+    async def gather(
+        self,
+        *coros: Coroutine[Any, Any, Any],
+        limit: int | None = None,
+        timeout_time: float | None = None,
+        timeout_unit: str = "ns",
+    ) -> list[Any]:
+        """Run coroutines concurrently and wait for their results.
+
+        The first coroutine that fails kills the others, and its exception is
+        raised.
+
+        Args:
+            coros: The coroutines, started in the given order
+            limit: The number of coroutines running at once. None starts all
+                coroutines right away
+            timeout_time: The simulation time each coroutine may run at most.
+                None runs them without a limit
+            timeout_unit: The unit of the timeout time
+
+        Returns:
+            The results of the coroutines in the given order
+
+        Raises:
+            SimTimeoutError: If a coroutine runs into its timeout
+        """
+        return await self.task_group("gather").gather(
+            *coros,
+            limit=limit,
+            timeout_time=timeout_time,
+            timeout_unit=timeout_unit,
+        )
+
+    def set_failure_policy(
+        self, max_failures: int = 0, skip_later_stages: bool = False
+    ) -> None:
+        """Skip the remaining tests after failures.
+
+        Skipped tests are reported as skipped in the results of cocotb. Failures
+        of tests registered with `expect_fail` or `expect_error` don't count.
+
+        Args:
+            max_failures: Skip all remaining tests after this many failures.
+                ``0`` runs all tests
+            skip_later_stages: Skip the tests of the stages after a stage with
+                a failure
+        """
+        self._max_failures = max_failures
+        self._skip_later_stages = skip_later_stages
+
+    def set_time_budget(
+        self, test: float | None = None, regression: float | None = None
+    ) -> None:
+        """Limit the wall-clock time of the tests.
+
+        A test exceeding its budget fails with a
+        :class:`~cocotb.result.SimTimeoutError`. Once the regression exceeds
+        its budget, the running test fails and the remaining tests are
+        skipped. The budget is checked whenever simulation time advances, so a
+        test stuck without advancing it is not aborted.
+
+        Args:
+            test: The budget of each test in seconds. None disables the limit
+            regression: The budget of all tests of the testbench in seconds,
+                counted from the start of the first test. None disables the
+                limit
+        """
+        self._test_budget = test
+        self._regression_budget = regression
+
+    def track_memory(self, threshold: int = 16 * 2**20, top: int = 10) -> None:
+        """Track the memory each test leaves behind.
+
+        The RSS and the Python allocations are measured before and after each
+        test, see :mod:`~cocotb_wrapper.memory`. The
+        :envvar:`COCOTB_WRAPPER_MEMORY` environment variable enables this
+        without changing the testbench.
+
+        Args:
+            threshold: The growth in bytes above which a warning is logged
+            top: The number of allocation sites logged per test
+        """
+        self._memory_threshold = threshold
+        self._memory_top = top
+
+    def dump_waves(
+        self,
+        tests: Iterable[int | str] = (),
+        stages: Iterable[int] = (),
+        on_failure: bool = False,
+        signal: str = "dump_enable",
+    ) -> None:
+        """Dump the waveforms of selected tests.
+
+        The `signal` of the DUT is high from the setup to the teardown of the
+        selected tests and switches the waveform dump of the simulator, see
+        :mod:`~cocotb_wrapper.waves`. The :envvar:`COCOTB_WRAPPER_WAVES`
+        environment variable selects further tests.
+
+        Args:
+            tests: The IDs or function names of the tests
+            stages: The stages whose tests are dumped
+            on_failure: Write the names of the failing tests to the rerun file
+                of :func:`~cocotb_wrapper.waves.rerun_path`, so only they are
+                rerun with waveforms
+            signal: The name of the dump control signal of the DUT
+        """
+        self._waves.update(WaveSelection(tests, stages))
+        self._waves_signal = signal
+        self._waves_on_failure = on_failure
+        if on_failure and os.path.exists(rerun_path()):
+            os.remove(rerun_path())
+
+    def start_waves(self, dut: HierarchyObject) -> None:
+        """Start dumping waveforms.
+
+        Args:
+            dut: The device under test
+        """
+        self._set_waves(dut, 1)
+
+    def stop_waves(self, dut: HierarchyObject) -> None:
+        """Stop dumping waveforms.
+
+        Args:
+            dut: The device under test
+        """
+        self._set_waves(dut, 0)
+
+    def backdoor_load(
+        self,
+        dut: HierarchyObject,
+        path_in_hierarchy: str,
+        data: bytes | Sequence[int],
+        offset: int | None = None,
+    ) -> None:
+        """Write a memory of the DUT directly, without simulating bus accesses.
+
+        Bytes are packed into the memory words in little-endian order. See
+        :mod:`cocotb_wrapper.backdoor`.
+
+        Args:
+            dut: The device under test
+            path_in_hierarchy: The dotted path of the memory array below the
+                DUT, e.g. ``'u_core.u_sram.mem'``
+            data: The bytes or the words to write
+            offset: The index of the first word, the lowest index if None
+
+        Raises:
+            ValueError: If a word does not fit into the memory width
+        """
+        handle = backdoor.resolve(dut, path_in_hierarchy)
+        backdoor.load(handle, data, offset)
+        self._log.debug(
+            "Loaded %d %s into %s[%s:]",
+            len(data),
+            "bytes" if isinstance(data, bytes) else "words",
+            path_in_hierarchy,
+            "" if offset is None else offset,
+        )
+
+    def backdoor_read(
+        self,
+        dut: HierarchyObject,
+        path_in_hierarchy: str,
+        length: int | None = None,
+        offset: int | None = None,
+    ) -> list[int]:
+        """Read a memory of the DUT directly, without simulating bus accesses.
+
+        Args:
+            dut: The device under test
+            path_in_hierarchy: The dotted path of the memory array below the
+                DUT, e.g. ``'u_core.u_sram.mem'``
+            length: The number of words, all words from `offset` on if None
+            offset: The index of the first word, the lowest index if None
+
+        Returns:
+            The words of the memory, see :func:`cocotb_wrapper.backdoor.to_bytes`
+            to get bytes
+        """
+        handle = backdoor.resolve(dut, path_in_hierarchy)
+        return backdoor.read(handle, length, offset)
+
     def register_setup(
         self,
     ) -> Callable[
@@ -109,6 +442,9 @@ class Testbench:
         expect_error: Exception | tuple[Exception, ...] = (),
         skip: bool = False,
         stage: int = 0,
+        profile: bool = False,
+        time_budget: float | None = None,
+        configuration: Hashable | None = None,
     ) -> Callable[
         [Callable[[HierarchyObject], Awaitable[None]]],
         Callable[[HierarchyObject], Awaitable[None]],
@@ -124,6 +460,16 @@ class Testbench:
             skip: Skip this test
             stage: Order tests logically into stages, where multiple test can
                 share a stage
+            profile: Profile the coroutines of the test, see
+                :mod:`~cocotb_wrapper.profiler`. The
+                :envvar:`COCOTB_WRAPPER_PROFILE` environment variable enables
+                this for all tests
+            time_budget: The wall-clock budget of the test in seconds,
+                overrides the one of :meth:`set_time_budget`
+            configuration: The configuration the test needs the DUT in.
+                Following a passed test with the same configuration, the
+                default setup and teardown functions skip the reset, see
+                :attr:`reconfiguring`
 
         Returns:
             A decorator function
@@ -140,26 +486,68 @@ class Testbench:
             Returns:
                 The input function `f`
             """
+            test_id = self._get_new_test_id()
+            self._tests.append((stage, test_id, f.__name__))
+            expected_failure = expect_fail or bool(expect_error)
 
             @wraps(f)
             async def _test_function(dut: HierarchyObject) -> None:
-                await self._get_setup_function()(dut)
-                self._log.debug("Setup completed")
-                await f(dut)
-                self._log.debug("Test finished")
-                await self._get_teardown_function()(dut)
-                self._log.debug("Teardown completed")
+                test_run = self._run_test(f, dut, configuration)
+                if timeout_time is not None:
+                    test_run = with_timeout(
+                        test_run, timeout_time, timeout_unit
+                    )
+                waves = bool(self._waves) and self._waves.selects(
+                    test_id, f.__name__, stage
+                )
+                if waves:
+                    self.start_waves(dut)
+                seed = derive_seed(f.__name__)
+                random.seed(seed)
+                self._log.info("Seeded %s with %d", f.__name__, seed)
+                tracker = None
+                if self._memory_threshold is not None:
+                    tracker = MemoryTracker(
+                        f.__name__, self._memory_threshold, self._memory_top
+                    )
+                    tracker.start()
+                passed = False
+                try:
+                    await self._run_budgeted(test_run, time_budget)
+                    passed = True
+                except TestSuccess:
+                    passed = True
+                    raise
+                except Exception:
+                    if not expected_failure:
+                        self._log_replay(f.__name__, test_id, stage)
+                        if self._waves_on_failure:
+                            record_failure(f.__name__)
+                    raise
+                finally:
+                    self._cancel_tasks(f.__name__)
+                    self._stop_captures(f.__name__)
+                    if tracker is not None:
+                        tracker.stop()
+                    record_seed(f.__name__, test_id, stage, seed, passed)
+                    if waves:
+                        self.stop_waves(dut)
+                    if not (passed or expected_failure):
+                        self._failures += 1
+                        if self._failed_stage is None:
+                            self._failed_stage = stage
+                    self._apply_policies()
 
             test = _Test(
                 test_function=_test_function,
-                test_id=self._get_new_test_id(),
-                timeout_time=timeout_time,
-                timeout_unit=timeout_unit,
+                test_id=test_id,
                 expect_fail=expect_fail,
                 expect_error=expect_error,
                 skip=skip,
                 stage=stage,
+                profile=profile,
             )
+            self._cocotb_tests[test_id] = test.__call__
             self._log.debug(
                 "Registered %s to module %s",
                 test.__call__.__name__,
@@ -169,6 +557,128 @@ class Testbench:
 
         return decorator
 
+    def register_test_matrix(
+        self,
+        params: Mapping[str, Iterable[Any]],
+        reconfigure: Sequence[str] = (),
+        configure: Callable[..., Awaitable[None]] | None = None,
+        ids: Mapping[str, Sequence[str]] | None = None,
+        timeout_time: int | None = None,
+        timeout_unit: str = "step",
+        expect_fail: bool = False,
+        expect_error: Exception | tuple[Exception, ...] = (),
+        skip: bool = False,
+        stage: int = 0,
+        profile: bool = False,
+        time_budget: float | None = None,
+    ) -> Callable[
+        [Callable[..., Awaitable[None]]], Callable[..., Awaitable[None]]
+    ]:
+        """Decorate a function to register a test for each parameter combination.
+
+        The function is called with the DUT and the parameters of a case as
+        keyword arguments. Each case is a separate cocotb test named after the
+        function and its parameters, see :mod:`~cocotb_wrapper.matrix`. The
+        cases are ordered such that the parameters to `reconfigure` change as
+        rarely as possible, and the cases sharing their values run one after
+        the other without a reset in between, see :attr:`reconfiguring`. All
+        cases run in the given `stage`, in the order of their test IDs, so
+        other tests of the stage run before or after the whole matrix. With
+        :envvar:`COCOTB_WRAPPER_SHARD`, only the cases of the shard are
+        registered, but they keep their test IDs. Tests registered with
+        :meth:`register_test` are not sharded.
+
+        Args:
+            params: The values of each parameter. A function as value is
+                called for each case, so stateful values such as
+                backpressure generators are not shared between cases, e.g.
+                ``lambda: cycle([0, 1])``
+            reconfigure: The parameters that need an expensive reconfiguration
+                of the DUT, the most expensive first
+            configure: An async function called with the DUT and the
+                parameters to `reconfigure` as keyword arguments, after the
+                setup of the first case of each group
+            ids: The names of the values of some parameters in the test
+                names, in the order of `params`. Values other than strings,
+                numbers and booleans are named by their index otherwise
+            timeout_time: The duration before a timeout occurs
+            timeout_unit: The unit of the timeout time
+            expect_fail: Don't mark the tests as failed if they fail.
+            expect_error: Mark the tests as passed only if the given exception
+                is raised
+            skip: Skip these tests
+            stage: The stage of all cases
+            profile: Profile the coroutines of the tests
+            time_budget: The wall-clock budget of each test in seconds
+
+        Returns:
+            A decorator function
+
+        Raises:
+            ValueError: If a parameter to reconfigure is not in `params`, or
+                two cases get the same name
+        """
+
+        def decorator(
+            f: Callable[..., Awaitable[None]],
+        ) -> Callable[..., Awaitable[None]]:
+            """Register a cocotb test for each case.
+
+            Args:
+                f: The decorated function
+
+            Returns:
+                The input function `f`
+            """
+            values = {key: list(value) for key, value in params.items()}
+            cases = matrix.expand(values, reconfigure)
+            configs = [
+                tuple(case[key] for key in reconfigure) for case in cases
+            ]
+            groups = {
+                config: group
+                for group, config in enumerate(dict.fromkeys(configs))
+            }
+            index, count = matrix.shard()
+            shards = matrix.assign_shards(
+                [groups[config] for config in configs], count
+            )
+            module = sys.modules[f.__module__]
+            registered = 0
+            for case, config, case_shard in zip(cases, configs, shards):
+                name = matrix.case_name(f.__name__, case, values, ids)
+                if name in vars(module):
+                    raise ValueError(
+                        f"Test {name} already exists in {module.__name__}"
+                    )
+                if case_shard != index:
+                    self._get_new_test_id()
+                    continue
+                setup = dict(zip(reconfigure, config))
+                test = self.register_test(
+                    timeout_time=timeout_time,
+                    timeout_unit=timeout_unit,
+                    expect_fail=expect_fail,
+                    expect_error=expect_error,
+                    skip=skip,
+                    stage=stage,
+                    profile=profile,
+                    time_budget=time_budget,
+                    configuration=(f.__qualname__, config),
+                )(self._matrix_case(f, name, case, setup, configure))
+                setattr(module, name, test)
+                registered += 1
+            self._log.debug(
+                "Registered %d of %d cases of %s in %d groups",
+                registered,
+                len(cases),
+                f.__name__,
+                len(groups),
+            )
+            return f
+
+        return decorator
+
     async def reset(self, dut: HierarchyObject, time: int, units: str) -> None:
         """Reset the DUT.
 
@@ -211,6 +721,192 @@ class Testbench:
         else:
             self._log.debug("Clock not available")
 
+    async def _run_test(
+        self,
+        f: Callable[[HierarchyObject], Awaitable[None]],
+        dut: HierarchyObject,
+        configuration: Hashable | None = None,
+    ) -> None:
+        """Run a test function between the setup and teardown functions.
+
+        Args:
+            f: The test function
+            dut: The device under test
+            configuration: The configuration the test needs the DUT in
+        """
+        previous, self._configuration = self._configuration, None
+        self._current_configuration = configuration
+        self._reconfiguring = configuration is None or configuration != previous
+        if self._buses is not None:
+            self._buses.setup(dut)
+        await self._get_setup_function()(dut)
+        self._log.debug("Setup completed")
+        await f(dut)
+        self._log.debug("Test finished")
+        await self._get_teardown_function()(dut)
+        self._log.debug("Teardown completed")
+        self._configuration = configuration
+
+    def _matrix_case(
+        self,
+        f: Callable[..., Awaitable[None]],
+        name: str,
+        case: dict[str, Any],
+        setup: dict[str, Any],
+        configure: Callable[..., Awaitable[None]] | None,
+    ) -> Callable[[HierarchyObject], Awaitable[None]]:
+        """Bind a test function to the parameters of a case.
+
+        Args:
+            f: The test function of the matrix
+            name: The test name of the case
+            case: The parameters of the case
+            setup: The parameters to reconfigure
+            configure: The function reconfiguring the DUT
+
+        Returns:
+            The test function of the case
+        """
+
+        async def _case(dut: HierarchyObject) -> None:
+            if configure is not None and self.reconfiguring:
+                await configure(dut, **setup)
+            await f(
+                dut,
+                **{
+                    key: value() if callable(value) else value
+                    for key, value in case.items()
+                },
+            )
+
+        _case.__name__ = _case.__qualname__ = name
+        _case.__module__ = f.__module__
+        _case.__doc__ = f.__doc__
+        return _case
+
+    async def _run_budgeted(
+        self,
+        test_run: Coroutine[Any, Any, None],
+        time_budget: float | None,
+    ) -> None:
+        """Run a test within its wall-clock budget.
+
+        Args:
+            test_run: The test, including the setup and teardown
+            time_budget: The budget of the test in seconds, the default one if
+                None
+
+        Raises:
+            SimTimeoutError: If the test or the regression exceeds its budget
+        """
+        now = time.monotonic()
+        if self._regression_budget is not None and self._deadline is None:
+            self._deadline = now + self._regression_budget
+        budget = self._test_budget if time_budget is None else time_budget
+        deadlines = [now + budget] if budget is not None else []
+        if self._deadline is not None:
+            deadlines.append(self._deadline)
+        if not deadlines:
+            await test_run
+            return
+        task = start_soon(test_run)
+        watchdog = start_soon(_watch_wall_clock(min(deadlines)))
+        try:
+            await First(task.join(), watchdog.join())
+        finally:
+            watchdog.kill()
+        if not task.done():
+            task.kill()
+            raise SimTimeoutError(
+                f"Exceeded the wall-clock budget after {time.monotonic() - now:.1f} s"
+            )
+        task.result()
+
+    def _apply_policies(self) -> None:
+        """Skip the tests excluded by the failure policy and time budget."""
+        stop = bool(self._max_failures) and self._failures >= self._max_failures
+        if stop:
+            self._log.warning(
+                "Skipping the remaining tests after %d failures", self._failures
+            )
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self._log.warning(
+                "Skipping the remaining tests after the regression budget of "
+                "%.1f s",
+                self._regression_budget,
+            )
+            stop = True
+        skip_after = self._failed_stage if self._skip_later_stages else None
+        for stage, test_id, _ in self._tests:
+            if stop or (skip_after is not None and stage > skip_after):
+                self._cocotb_tests[test_id].skip = True
+
+    def _cancel_tasks(self, name: str) -> None:
+        """Kill the tasks of the task groups left running by a test.
+
+        Args:
+            name: The name of the test function
+        """
+        killed = sum(group.cancel() for group in self._task_groups)
+        self._task_groups.clear()
+        if killed:
+            self._log.warning(
+                "Killed %d tasks left running by %s", killed, name
+            )
+
+    def _stop_captures(self, name: str) -> None:
+        """Stop the captures of AXI-Stream sinks left running by a test.
+
+        Args:
+            name: The name of the test function
+        """
+        # No sink can capture unless the axi module was imported
+        module = sys.modules.get("cocotb_wrapper.axi")
+        if module is None:
+            return
+        stopped = module.stop_captures()
+        if stopped:
+            self._log.debug("Stopped %d captures left by %s", stopped, name)
+
+    def _log_replay(self, name: str, test_id: int, stage: int) -> None:
+        """Log the commands that replay a failed test.
+
+        The test is replayed alone, or after the tests that run before it, in
+        case the test depends on the state they leave in the DUT.
+
+        Args:
+            name: The name of the test function
+            test_id: The ID of the test
+            stage: The stage of the test
+        """
+        prefix = [
+            test[2]
+            for test in sorted(self._tests)
+            if test <= (stage, test_id, name)
+        ]
+        self._log.info("Replay the test with: %s", replay_command([name]))
+        if len(prefix) > 1:
+            self._log.info(
+                "Replay the test after its predecessors with: %s",
+                replay_command(prefix),
+            )
+
+    def _set_waves(self, dut: HierarchyObject, value: int) -> None:
+        """Drive the dump control signal of the DUT.
+
+        Args:
+            dut: The device under test
+            value: 1 to dump waveforms, else 0
+        """
+        try:
+            getattr(dut, self._waves_signal).value = value
+            self._log.debug("Set '%s' to %d", self._waves_signal, value)
+        except AttributeError:
+            self._log.warning(
+                "No '%s' signal found in DUT, waveforms are not switched",
+                self._waves_signal,
+            )
+
     def _add_to_instance(
         self,
         name: str,
@@ -255,18 +951,21 @@ class Testbench:
             dut: The device under test
         """
         self.start_clk(dut, period=2, units="ns")
-        await self.reset(dut, time=2, units="ns")
+        if self.reconfiguring:
+            await self.reset(dut, time=2, units="ns")
 
     async def _default_teardown(self, dut: HierarchyObject) -> None:
         """Teardown the testbench.
 
         This function is the default teardown function and is executed if no
-        other teardown function is registered.
+        other teardown function is registered. Tests with a configuration leave
+        the DUT as it is for the next test.
 
         Args:
             dut: The device under test
         """
-        await self.reset(dut, time=2, units="ns")
+        if self._current_configuration is None:
+            await self.reset(dut, time=2, units="ns")
 
     def _get_new_test_id(self) -> int:
         """Get a new test ID.
@@ -305,6 +1004,25 @@ class Testbench:
             return self._default_teardown
 
 
+async def _watch_wall_clock(deadline: float) -> None:
+    """Wait until a wall-clock deadline while simulation time advances.
+
+    The simulation time between two checks is adapted to about one check per
+    100 ms of wall-clock time, so the watchdog costs next to nothing.
+
+    Args:
+        deadline: The deadline in seconds of :func:`time.monotonic`
+    """
+    steps = get_sim_steps(1, "us")  # pyright: ignore[reportArgumentType]
+    while True:
+        start = time.monotonic()
+        if start >= deadline:
+            return
+        await Timer(steps, "step")  # pyright: ignore[reportArgumentType]
+        elapsed = time.monotonic() - start
+        steps = max(1, min(steps * 10, int(steps * 0.1 / max(elapsed, 1e-6))))
+
+
 class _Test:
     """A single test of a testbench.
 
@@ -324,6 +1042,7 @@ class _Test:
         expect_error: Exception | tuple[Exception, ...] = (),
         skip: bool = False,
         stage: int = 0,
+        profile: bool = False,
     ):
         """Initialize an instance.
 
@@ -338,6 +1057,10 @@ class _Test:
             skip: Skip this test
             stage: Order tests logically into stages, where multiple test can
                 share a stage
+            profile: Profile the coroutines of the test, see
+                :mod:`~cocotb_wrapper.profiler`. The
+                :envvar:`COCOTB_WRAPPER_PROFILE` environment variable enables
+                this for all tests
         """
         self._log = SimLog(test_function.__name__)
 
@@ -348,7 +1071,10 @@ class _Test:
                 self._log.debug("'Set test_id' to %s", self._test_id)
             except AttributeError:
                 self._log.debug("No 'test_id' signal found in DUT")
-            await test_function(dut)
+            if profile or os.environ.get(PROFILE_ENV):
+                await self._profile(test_function, dut)
+            else:
+                await test_function(dut)
 
         self.__call__: Callable[[HierarchyObject], Awaitable[None]] = test(
             timeout_time=timeout_time,
@@ -359,3 +1085,29 @@ class _Test:
             stage=stage,
         )(_test_function)
         self._test_id = test_id
+
+    async def _profile(
+        self,
+        test_function: Callable[[HierarchyObject], Awaitable[None]],
+        dut: HierarchyObject,
+    ) -> None:
+        """Run the test function under the coroutine profiler.
+
+        The profile is written even if the test fails.
+
+        Args:
+            test_function: The test function
+            dut: The device under test
+        """
+        profiler = CoroutineProfiler(test_function.__qualname__)
+        try:
+            with profiler:
+                await test_function(dut)
+        finally:
+            path = profile_path(test_function.__qualname__)
+            profiler.write(path)
+            profiler.write(
+                path.replace(".collapsed", ".resumes.collapsed"), True
+            )
+            profiler.report()
+            self._log.info("Wrote the profile to %s", path)
@@ -0,0 +1,151 @@
+# ============================================================
+#   _____       ______  _____
+#  |_   _|     |  ____|/ ____|
+#    | |  _ __ | |__  | (___    Institute of Embedded Systems
+#    | | | '_ \|  __|  \___ \   Zurich University of
+#   _| |_| | | | |____ ____) |  Applied Sciences
+#  |_____|_| |_|______|_____/   8401 Winterthur, Switzerland
+# ============================================================
+
+"""Dump waveforms only for selected tests.
+
+The simulator dumps waveforms while a control signal of the DUT is high. In a
+Verilog toplevel, the signal switches the dump with ``$dumpon`` and
+``$dumpoff``:
+
+.. code-block:: verilog
+
+    reg dump_enable = 0;
+    initial begin
+        $dumpfile("waves.vcd");
+        $dumpvars(0, top);
+        $dumpoff;
+    end
+    always @(dump_enable) if (dump_enable) $dumpon; else $dumpoff;
+
+The :class:`~cocotb_wrapper.Testbench` raises the signal for the tests selected
+with :meth:`~cocotb_wrapper.Testbench.dump_waves` or the
+:envvar:`COCOTB_WRAPPER_WAVES` environment variable. With ``on_failure``, the
+names of the failing tests are written to a file instead, one per line, and
+only those tests are rerun with waveforms::
+
+    TESTCASE=$(paste -sd, sim_build/waves_rerun.txt) COCOTB_WRAPPER_WAVES=all make
+"""
+
+from __future__ import annotations
+
+__author__ = "Thierry Delafontaine"
+__mail__ = "deaa@zhaw.ch"
+__copyright__ = "2026 ZHAW Institute of Embedded Systems"
+__date__ = "2026-10-18"
+
+import os
+from collections.abc import Iterable
+
+WAVES_ENV = "COCOTB_WRAPPER_WAVES"
+"""The environment variable holding the tests to dump.
+
+A comma-separated list of test IDs, test names, ``stage<N>`` for all tests of a
+stage, or ``all``.
+"""
+WAVES_RERUN_ENV = "COCOTB_WRAPPER_WAVES_RERUN"
+"""The environment variable holding the file of the tests to rerun."""
+WAVES_RERUN_FILE = "waves_rerun.txt"
+"""The default file of the tests to rerun, relative to the simulator."""
+
+
+class WaveSelection:
+    """The tests whose waveforms are dumped."""
+
+    def __init__(
+        self,
+        tests: Iterable[int | str] = (),
+        stages: Iterable[int] = (),
+        all: bool = False,
+    ):
+        """Initialize an instance.
+
+        Args:
+            tests: The IDs or names of the tests
+            stages: The stages whose tests are dumped
+            all: Dump all tests
+        """
+        self.tests: set[int | str] = set(tests)
+        """The IDs or names of the tests."""
+        self.stages: set[int] = set(stages)
+        """The stages whose tests are dumped."""
+        self.all: bool = all
+        """Dump all tests."""
+
+    @classmethod
+    def parse(cls, value: str) -> WaveSelection:
+        """Parse a selection in the format of :data:`WAVES_ENV`.
+
+        Args:
+            value: The comma-separated selection
+
+        Returns:
+            The selection
+        """
+        selection = cls()
+        for item in filter(None, (item.strip() for item in value.split(","))):
+            if item == "all":
+                selection.all = True
+            elif item.startswith("stage") and item[5:].isdigit():
+                selection.stages.add(int(item[5:]))
+            elif item.isdigit():
+                selection.tests.add(int(item))
+            else:
+                selection.tests.add(item)
+        return selection
+
+    def __bool__(self) -> bool:
+        return self.all or bool(self.tests) or bool(self.stages)
+
+    def update(self, other: WaveSelection) -> None:
+        """Add the tests of another selection.
+
+        Args:
+            other: The other selection
+        """
+        self.tests |= other.tests
+        self.stages |= other.stages
+        self.all |= other.all
+
+    def selects(self, test_id: int, name: str, stage: int) -> bool:
+        """Check whether a test is selected.
+
+        Args:
+            test_id: The ID of the test
+            name: The name of the test function
+            stage: The stage of the test
+
+        Returns:
+            True if the waveforms of the test are dumped
+        """
+        return (
+            self.all
+            or test_id in self.tests
+            or name in self.tests
+            or stage in self.stages
+        )
+
+
+def rerun_path() -> str:
+    """Get the path of the file of the tests to rerun.
+
+    Returns:
+        The path given by :envvar:`COCOTB_WRAPPER_WAVES_RERUN`, which defaults
+        to ``waves_rerun.txt`` in the working directory of the simulator
+    """
+    return os.environ.get(WAVES_RERUN_ENV, WAVES_RERUN_FILE)
+
+
+def record_failure(name: str) -> None:
+    """Add a failing test to the file of the tests to rerun.
+
+    Args:
+        name: The name of the test function
+    """
+    with open(rerun_path(), "a") as f:
+        f.write(f"{name}\n")